@@ -1,13 +1,13 @@
 """Authentication CLI commands."""
 
+import sys
 from collections.abc import Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Annotated, Any
 
 import typer
 
 from gdocs_cli.services.auth import (
-    get_token_expiry,
     is_authenticated,
     logout,
     run_oauth_flow,
@@ -16,11 +16,12 @@ from gdocs_cli.services.credentials import (
     delete_credentials,
     get_default_account,
     get_raw_credentials_json,
+    get_token_expiries,
     has_credentials,
     list_accounts,
     set_default_account,
 )
-from gdocs_cli.services.docs import TokenExpiredError
+from gdocs_cli.services.docs import TokenExpiredError, clear_service_cache
 from gdocs_cli.utils.output import (
     is_json_mode,
     print_error,
@@ -35,6 +36,37 @@ auth_app = typer.Typer(
     no_args_is_help=True,
 )
 
+# Keyring lookups are comparatively slow (IPC + decrypt per read). A single CLI
+# invocation only needs each lookup once, so memoize them for the lifetime of
+# the process and clear after any mutation (login/logout/set-default).
+list_accounts = lru_cache(maxsize=None)(list_accounts)
+get_default_account = lru_cache(maxsize=None)(get_default_account)
+
+# Result of the last is_authenticated() probe; None means not yet checked
+_auth_ok: bool | None = None
+
+
+def _invalidate_account_caches() -> None:
+    """Clear memoized account lookups and service stubs after credentials change."""
+    global _auth_ok
+    _auth_ok = None
+    list_accounts.cache_clear()
+    get_default_account.cache_clear()
+    clear_service_cache()
+
+
+def _cached_is_authenticated() -> bool:
+    """Check authentication once per process.
+
+    Every command wrapped with require_auth probes the keyring via
+    is_authenticated(); cache the result so chained checks within one
+    invocation don't repeat the I/O.
+    """
+    global _auth_ok
+    if _auth_ok is None:
+        _auth_ok = is_authenticated()
+    return _auth_ok
+
 
 def require_auth(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to require authentication for a command.
@@ -48,7 +80,7 @@ def require_auth(func: Callable[..., Any]) -> Callable[..., Any]:
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if not is_authenticated():
+        if not _cached_is_authenticated():
             if is_json_mode():
                 print_json_error(
                     "NOT_AUTHENTICATED",
@@ -66,6 +98,7 @@ def require_auth(func: Callable[..., Any]) -> Callable[..., Any]:
         except TokenExpiredError as e:
             if e.account:
                 delete_credentials(account=e.account)
+            _invalidate_account_caches()
             if is_json_mode():
                 print_json_error(
                     "TOKEN_EXPIRED",
@@ -94,10 +127,11 @@ def login(
     Supports multiple accounts. The first account authenticated becomes the default.
     Use --set-default to make a new account the default.
     """
+    json_mode = is_json_mode()
     accounts = list_accounts()
     if accounts and has_credentials(account=accounts[0]):
         if not typer.confirm("You already have authenticated accounts. Add another account?"):
-            if is_json_mode():
+            if json_mode:
                 print_json({"status": "cancelled", "message": "Login cancelled"})
             else:
                 print_success("Keeping existing authentication")
@@ -112,7 +146,9 @@ def login(
         if set_default and not was_first_account:
             set_default_account(email)
 
-        if is_json_mode():
+        _invalidate_account_caches()
+
+        if json_mode:
             print_json(
                 {
                     "status": "authenticated",
@@ -128,7 +164,7 @@ def login(
                 print_success(f"Successfully authenticated as {email}")
 
     except FileNotFoundError as e:
-        if is_json_mode():
+        if json_mode:
             print_json_error("CREDENTIALS_NOT_FOUND", str(e))
         else:
             print_error(
@@ -139,7 +175,7 @@ def login(
         raise typer.Exit(2)
 
     except Exception as e:
-        if is_json_mode():
+        if json_mode:
             print_json_error("AUTH_FAILED", "Authentication failed", str(e))
         else:
             print_error(
@@ -166,9 +202,11 @@ def logout_command(
     Use --account to log out a specific account.
     Use --all to log out all accounts.
     """
+    json_mode = is_json_mode()
     logged_out = logout(account=account, all_accounts=all_accounts)
+    _invalidate_account_caches()
 
-    if is_json_mode():
+    if json_mode:
         print_json({"status": "logged_out", "accounts": logged_out})
     else:
         if not logged_out:
@@ -186,11 +224,12 @@ def status() -> None:
     Lists all configured accounts with their status.
     The default account is marked with an asterisk (*).
     """
+    json_mode = is_json_mode()
     accounts = list_accounts()
     default = get_default_account()
 
     if not accounts:
-        if is_json_mode():
+        if json_mode:
             print_json({"authenticated": False, "accounts": []})
         else:
             print_error(
@@ -199,17 +238,17 @@ def status() -> None:
             )
         raise typer.Exit(1)
 
-    if is_json_mode():
-        accounts_info = []
-        for acc in accounts:
-            expiry = get_token_expiry(account=acc)
-            accounts_info.append(
-                {
-                    "email": acc,
-                    "is_default": acc == default,
-                    "token_expiry": expiry,
-                }
-            )
+    expiries = get_token_expiries(accounts)
+
+    if json_mode:
+        accounts_info = [
+            {
+                "email": acc,
+                "is_default": acc == default,
+                "token_expiry": expiries.get(acc),
+            }
+            for acc in accounts
+        ]
         print_json(
             {
                 "authenticated": True,
@@ -221,7 +260,7 @@ def status() -> None:
         print_success(f"Authenticated with {len(accounts)} account(s):")
         for acc in accounts:
             marker = " *" if acc == default else ""
-            expiry = get_token_expiry(account=acc)
+            expiry = expiries.get(acc)
             expiry_info = f" (token expires: {expiry})" if expiry else ""
             typer.echo(f"  {acc}{marker}{expiry_info}")
 
@@ -237,10 +276,11 @@ def set_default_command(
 
     The default account is used when no --account option is specified.
     """
+    json_mode = is_json_mode()
     accounts = list_accounts()
 
     if email not in accounts:
-        if is_json_mode():
+        if json_mode:
             print_json_error(
                 "ACCOUNT_NOT_FOUND",
                 f"Account '{email}' not found",
@@ -254,8 +294,9 @@ def set_default_command(
         raise typer.Exit(1)
 
     set_default_account(email)
+    _invalidate_account_caches()
 
-    if is_json_mode():
+    if json_mode:
         print_json({"status": "default_set", "account": email})
     else:
         print_success(f"Default account set: {email}")
@@ -275,10 +316,11 @@ def token_command(
 
     WARNING: This contains sensitive data. Handle with care!
     """
+    json_mode = is_json_mode()
     accounts = list_accounts()
 
     if not accounts:
-        if is_json_mode():
+        if json_mode:
             print_json_error("NOT_AUTHENTICATED", "No accounts configured")
         else:
             print_error(
@@ -290,7 +332,7 @@ def token_command(
     target_account = account or get_default_account() or accounts[0]
 
     if target_account not in accounts:
-        if is_json_mode():
+        if json_mode:
             print_json_error(
                 "ACCOUNT_NOT_FOUND",
                 f"Account '{target_account}' not found",
@@ -306,10 +348,13 @@ def token_command(
     creds_json = get_raw_credentials_json(target_account)
 
     if not creds_json:
-        if is_json_mode():
+        if json_mode:
             print_json_error("NO_CREDENTIALS", f"No credentials for {target_account}")
         else:
             print_error(f"No credentials for {target_account}")
         raise typer.Exit(1)
 
-    typer.echo(creds_json)
+    # The blob is emitted exactly as stored; write it straight to stdout
+    # instead of routing it through typer.echo's processing.
+    sys.stdout.write(creds_json)
+    sys.stdout.write("\n")
@@ -1,5 +1,6 @@
 """Content manipulation CLI commands."""
 
+import io
 from pathlib import Path
 from typing import Annotated
 
@@ -24,6 +25,14 @@ content_app = typer.Typer(
     no_args_is_help=True,
 )
 
+# Chunking for file imports: read this many characters at a time and send this
+# many chunks per batchUpdate, keeping memory constant for large files.
+_FILE_CHUNK_CHARS = 64 * 1024
+_FILE_CHUNKS_PER_BATCH = 16
+
+# Precomputed once so the invalid-heading error path doesn't re-iterate the enum
+_VALID_HEADING_STYLES = ", ".join(s.name for s in NamedStyleType)
+
 
 def _extract_text_from_paragraph(paragraph: dict) -> str:
     """Extract text from a paragraph element."""
@@ -34,12 +43,6 @@ def _extract_text_from_paragraph(paragraph: dict) -> str:
     return "".join(text_parts)
 
 
-def _get_paragraph_style(paragraph: dict) -> str | None:
-    """Get the named style type of a paragraph."""
-    style = paragraph.get("paragraphStyle", {})
-    return style.get("namedStyleType")
-
-
 def _extract_cell_text(cell: dict) -> str:
     """Extract text from a table cell, stripping trailing newlines."""
     cell_content = cell.get("content", [])
@@ -50,25 +53,40 @@ def _extract_cell_text(cell: dict) -> str:
     return "".join(text_parts).strip()
 
 
+def _table_row_to_markdown(row: dict) -> str:
+    """Convert a single table row to a Markdown table line."""
+    cells = row.get("tableCells", ())
+    return "| " + " | ".join(_extract_cell_text(cell) for cell in cells) + " |"
+
+
 def _table_to_markdown(table: dict) -> str:
     """Convert a Google Docs table to Markdown format."""
-    rows = table.get("tableRows", [])
+    rows = table.get("tableRows", ())
     if not rows:
         return ""
 
-    markdown_rows = []
+    # Header row + separator first, then the remaining rows in one sweep —
+    # no per-iteration first-row branch.
+    separator = "| " + " | ".join(["---"] * len(rows[0].get("tableCells", ()))) + " |"
+    markdown_rows = [_table_row_to_markdown(rows[0]), separator]
+    markdown_rows.extend(_table_row_to_markdown(row) for row in rows[1:])
 
-    for row_idx, row in enumerate(rows):
-        cells = row.get("tableCells", [])
-        cell_texts = [_extract_cell_text(cell) for cell in cells]
-        markdown_rows.append("| " + " | ".join(cell_texts) + " |")
+    return "\n".join(markdown_rows)
 
-        # Add header separator after first row
-        if row_idx == 0:
-            separator = "| " + " | ".join(["---"] * len(cells)) + " |"
-            markdown_rows.append(separator)
 
-    return "\n".join(markdown_rows)
+# Markdown prefix/suffix per named paragraph style; unknown styles fall back
+# to plain text.
+_STYLE_PREFIX = {
+    "TITLE": "# ",
+    "SUBTITLE": "*",
+    "HEADING_1": "# ",
+    "HEADING_2": "## ",
+    "HEADING_3": "### ",
+    "HEADING_4": "#### ",
+    "HEADING_5": "##### ",
+    "HEADING_6": "###### ",
+}
+_STYLE_SUFFIX = {"SUBTITLE": "*"}
 
 
 def _content_to_markdown(content: list) -> str:
@@ -76,34 +94,24 @@ def _content_to_markdown(content: list) -> str:
     markdown_parts = []
 
     for element in content:
-        if "paragraph" in element:
-            paragraph = element["paragraph"]
-            text = _extract_text_from_paragraph(paragraph).rstrip("\n")
+        paragraph = element.get("paragraph")
+        if paragraph is not None:
+            # Extract text and style in a single pass over the paragraph dict
+            # instead of delegating to the per-paragraph helpers twice.
+            text_parts = []
+            for elem in paragraph.get("elements", ()):
+                text_run = elem.get("textRun")
+                if text_run is not None:
+                    text_parts.append(text_run.get("content", ""))
+            text = "".join(text_parts).rstrip("\n")
 
             if not text:
                 continue
 
-            style = _get_paragraph_style(paragraph)
-
-            # Apply heading styles
-            if style == "TITLE":
-                markdown_parts.append(f"# {text}\n")
-            elif style == "SUBTITLE":
-                markdown_parts.append(f"*{text}*\n")
-            elif style == "HEADING_1":
-                markdown_parts.append(f"# {text}\n")
-            elif style == "HEADING_2":
-                markdown_parts.append(f"## {text}\n")
-            elif style == "HEADING_3":
-                markdown_parts.append(f"### {text}\n")
-            elif style == "HEADING_4":
-                markdown_parts.append(f"#### {text}\n")
-            elif style == "HEADING_5":
-                markdown_parts.append(f"##### {text}\n")
-            elif style == "HEADING_6":
-                markdown_parts.append(f"###### {text}\n")
-            else:
-                markdown_parts.append(f"{text}\n")
+            style = paragraph.get("paragraphStyle", {}).get("namedStyleType")
+            prefix = _STYLE_PREFIX.get(style, "")
+            suffix = _STYLE_SUFFIX.get(style, "")
+            markdown_parts.append(f"{prefix}{text}{suffix}\n")
 
         elif "table" in element:
             markdown_parts.append("\n" + _table_to_markdown(element["table"]) + "\n")
@@ -113,20 +121,26 @@ def _content_to_markdown(content: list) -> str:
 
 def _extract_text_from_content(content: list) -> str:
     """Extract plain text from document content structure."""
-    text_parts = []
+    # StringIO instead of list-append + join: no part list to grow and no
+    # second copy of the full text on join, which matters for large tables.
+    out = io.StringIO()
 
     for element in content:
-        if "paragraph" in element:
-            paragraph = element["paragraph"]
-            text_parts.append(_extract_text_from_paragraph(paragraph))
+        paragraph = element.get("paragraph")
+        if paragraph is not None:
+            for elem in paragraph.get("elements", ()):
+                text_run = elem.get("textRun")
+                if text_run is not None:
+                    out.write(text_run.get("content", ""))
         elif "table" in element:
             table = element["table"]
             for row in table.get("tableRows", []):
                 for cell in row.get("tableCells", []):
-                    text_parts.append(_extract_cell_text(cell) + "\t")
-                text_parts.append("\n")
+                    out.write(_extract_cell_text(cell))
+                    out.write("\t")
+                out.write("\n")
 
-    return "".join(text_parts)
+    return out.getvalue()
 
 
 @content_app.command("read")
@@ -152,23 +166,23 @@ def read_command(
     Use --plain for plain text.
     Use --raw for full JSON structure.
     """
-    doc_content = get_document_content(document_id, account=account)
+    json_mode = is_json_mode()
+    if raw or json_mode:
+        print_json(get_document_content(document_id, account=account))
+        return
 
-    if raw or is_json_mode():
-        print_json(doc_content)
-    else:
-        title = doc_content.get("title", "Untitled")
-        body = doc_content.get("body", {})
-        content = body.get("content", [])
+    # Text rendering only needs title and body elements, so limit the payload
+    doc_content = get_document_content(
+        document_id,
+        fields="title,body(content(paragraph,table))",
+        account=account,
+    )
+    title = doc_content.get("title", "Untitled")
+    content = doc_content.get("body", {}).get("content", [])
 
-        if plain:
-            text = _extract_text_from_content(content)
-            typer.echo(f"# {title}\n")
-            typer.echo(text)
-        else:
-            text = _content_to_markdown(content)
-            typer.echo(f"# {title}\n")
-            typer.echo(text)
+    text = _extract_text_from_content(content) if plain else _content_to_markdown(content)
+    typer.echo(f"# {title}\n")
+    typer.echo(text)
 
 
 @content_app.command("insert")
@@ -207,22 +221,19 @@ def insert_command(
     Use --heading to apply a heading style.
     Use --bold or --italic for text formatting.
     """
-    requests = []
-
-    # Insert the text with newline
+    json_mode = is_json_mode()
     text_with_newline = text + "\n"
-    requests.append(insert_text_request(text_with_newline, index=index))
-
-    # Calculate end index
+    text_len = len(text)
     end_index = index + len(text_with_newline)
 
+    requests = [insert_text_request(text_with_newline, index=index)]
+
     # Apply heading style if specified
     if heading:
         try:
             style_type = NamedStyleType[heading.upper()]
         except KeyError:
-            valid_styles = ", ".join([s.name for s in NamedStyleType])
-            typer.echo(f"Invalid heading: {heading}. Valid: {valid_styles}", err=True)
+            typer.echo(f"Invalid heading: {heading}. Valid: {_VALID_HEADING_STYLES}", err=True)
             raise typer.Exit(1)
 
         requests.append(apply_named_style_request(index, end_index, style_type))
@@ -230,14 +241,14 @@ def insert_command(
     # Apply text formatting
     if bold or italic:
         text_style = TextStyle(bold=bold, italic=italic)
-        requests.append(update_text_style_request(index, index + len(text), text_style))
+        requests.append(update_text_style_request(index, index + text_len, text_style))
 
     batch_update(document_id, requests, account=account)
 
-    if is_json_mode():
-        print_json({"inserted": True, "index": index, "length": len(text)})
+    if json_mode:
+        print_json({"inserted": True, "index": index, "length": text_len})
     else:
-        print_success(f"Inserted {len(text)} characters at index {index}")
+        print_success(f"Inserted {text_len} characters at index {index}")
 
 
 @content_app.command("append")
@@ -255,46 +266,37 @@ def append_command(
     ] = None,
 ) -> None:
     """Append text to end of document."""
-    requests = []
-
-    # Append text at end
+    json_mode = is_json_mode()
     text_with_newline = text + "\n"
-    requests.append(insert_text_at_end_request(text_with_newline))
 
-    # If heading is specified, we need to get the document to find the end index
     if heading:
-        doc_content = get_document_content(document_id, account=account)
-        body = doc_content.get("body", {})
-        content = body.get("content", [])
-        if content:
-            last_element = content[-1]
-            end_index = last_element.get("endIndex", 1)
-        else:
-            end_index = 1
-
-        # After appending, the new text starts at end_index
+        # Validate the heading before any network I/O
         try:
             style_type = NamedStyleType[heading.upper()]
         except KeyError:
-            valid_styles = ", ".join([s.name for s in NamedStyleType])
-            typer.echo(f"Invalid heading: {heading}. Valid: {valid_styles}", err=True)
+            typer.echo(f"Invalid heading: {heading}. Valid: {_VALID_HEADING_STYLES}", err=True)
             raise typer.Exit(1)
 
-        # Note: The style will be applied in a separate batch update after the insert
-        batch_update(document_id, requests, account=account)
-
-        # Now apply the heading style to the appended text
-        new_doc_content = get_document_content(document_id, account=account)
-        new_body = new_doc_content.get("body", {})
-        new_content = new_body.get("content", [])
-        if new_content:
-            new_end = new_content[-1].get("endIndex", 1)
-            style_requests = [apply_named_style_request(end_index, new_end - 1, style_type)]
-            batch_update(document_id, style_requests, account=account)
+        # One fetch to find the end of the body, then insert and style in a
+        # single batch update instead of two updates with a re-fetch between.
+        doc_content = get_document_content(document_id, account=account)
+        content = doc_content.get("body", {}).get("content", [])
+        end_index = content[-1].get("endIndex", 1) if content else 1
+
+        # The body always ends with a newline, so insert just before it
+        insert_index = max(end_index - 1, 1)
+        requests = (
+            insert_text_request(text_with_newline, index=insert_index),
+            apply_named_style_request(
+                insert_index, insert_index + len(text_with_newline) - 1, style_type
+            ),
+        )
     else:
-        batch_update(document_id, requests, account=account)
+        requests = (insert_text_at_end_request(text_with_newline),)
+
+    batch_update(document_id, requests, account=account)
 
-    if is_json_mode():
+    if json_mode:
         print_json({"appended": True, "length": len(text)})
     else:
         print_success(f"Appended {len(text)} characters")
@@ -315,20 +317,34 @@ def from_file_command(
     Reads the file content and appends it to the document.
     Supports plain text and basic markdown files.
     """
+    json_mode = is_json_mode()
     path = Path(file_path)
     if not path.exists():
         typer.echo(f"File not found: {file_path}", err=True)
         raise typer.Exit(1)
 
-    content = path.read_text()
-
-    requests = [insert_text_at_end_request(content)]
-    batch_update(document_id, requests, account=account)
-
-    if is_json_mode():
-        print_json({"imported": True, "file": file_path, "length": len(content)})
+    # Stream the file in chunks instead of reading it fully into memory, so
+    # large imports stay within constant memory and below the API request
+    # size limit. Chunks are appended in order, so the result is identical.
+    # The batch buffer is preallocated once and reused across flushes.
+    buf = [None] * _FILE_CHUNKS_PER_BATCH
+    pos = 0
+    total = 0
+    with path.open(encoding="utf-8") as f:
+        while chunk := f.read(_FILE_CHUNK_CHARS):
+            buf[pos] = insert_text_at_end_request(chunk)
+            pos += 1
+            total += len(chunk)
+            if pos == _FILE_CHUNKS_PER_BATCH:
+                batch_update(document_id, buf, account=account)
+                pos = 0
+    if pos:
+        batch_update(document_id, buf[:pos], account=account)
+
+    if json_mode:
+        print_json({"imported": True, "file": file_path, "length": total})
     else:
-        print_success(f"Imported {len(content)} characters from {file_path}")
+        print_success(f"Imported {total} characters from {file_path}")
 
 
 @content_app.command("replace")
@@ -347,7 +363,8 @@ def replace_command(
     ] = None,
 ) -> None:
     """Replace all occurrences of text in a document."""
-    requests = [replace_all_text_request(find, replace, match_case=match_case)]
+    json_mode = is_json_mode()
+    requests = (replace_all_text_request(find, replace, match_case=match_case),)
     result = batch_update(document_id, requests, account=account)
 
     # Get number of replacements from response
@@ -356,7 +373,7 @@ def replace_command(
     if replies:
         occurrences = replies[0].get("replaceAllText", {}).get("occurrencesChanged", 0)
 
-    if is_json_mode():
+    if json_mode:
         print_json({"replaced": True, "occurrences": occurrences})
     else:
         print_success(f"Replaced {occurrences} occurrence(s)")
@@ -382,10 +399,11 @@ def bullets_command(
     Presets: BULLET_DISC_CIRCLE_SQUARE, BULLET_DIAMONDX_ARROW3D_SQUARE,
     BULLET_CHECKBOX, NUMBERED_DECIMAL_ALPHA_ROMAN, etc.
     """
-    requests = [create_paragraph_bullets_request(start_index, end_index, preset)]
+    json_mode = is_json_mode()
+    requests = (create_paragraph_bullets_request(start_index, end_index, preset),)
     batch_update(document_id, requests, account=account)
 
-    if is_json_mode():
+    if json_mode:
         print_json({"bullets_applied": True, "start": start_index, "end": end_index})
     else:
         print_success(f"Applied bullets to range {start_index}-{end_index}")
@@ -1,16 +1,20 @@
 """Document management CLI commands."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 import typer
 
 from gdocs_cli.cli.auth import require_auth
+from gdocs_cli.models.document import DocumentSummary
 from gdocs_cli.services.docs import (
     create_document,
     delete_document,
     get_document,
     list_documents,
+    list_documents_for_accounts,
     list_permissions,
+    list_permissions_and_revisions,
     list_revisions,
     move_document,
     search_documents,
@@ -31,6 +35,16 @@ document_app = typer.Typer(
     no_args_is_help=True,
 )
 
+_VALID_ROLES: frozenset[str] = frozenset({"reader", "writer", "commenter"})
+
+
+def _summary_row(doc: DocumentSummary) -> tuple[str, str, str]:
+    """Build one display row for a document summary."""
+    doc_id = doc.id[:16] + "..." if len(doc.id) > 16 else doc.id
+    title = doc.title[:50] + "..." if len(doc.title) > 50 else doc.title
+    modified = str(doc.modified_time)[:10] if doc.modified_time else "-"
+    return doc_id, title, modified
+
 
 @document_app.command("create")
 @require_auth
@@ -104,13 +118,38 @@ def list_command(
         str | None,
         typer.Option("--account", "-A", help="Account to use"),
     ] = None,
+    accounts: Annotated[
+        str | None,
+        typer.Option("--accounts", help="Comma-separated accounts to query concurrently"),
+    ] = None,
 ) -> None:
     """List your Google Docs.
 
     By default lists documents from My Drive.
     Use --shared-drive to list from a Shared Drive.
     Use --folder to list from a specific folder.
+    Use --accounts a,b,c to query several accounts in parallel.
     """
+    if accounts:
+        account_list = [a.strip() for a in accounts.split(",") if a.strip()]
+        results = list_documents_for_accounts(
+            account_list,
+            limit=limit,
+            folder_id=folder,
+            shared_drive_id=shared_drive,
+        )
+
+        if is_json_mode():
+            print_json({"accounts": results})
+        else:
+            for acc, docs in results.items():
+                if not docs:
+                    typer.echo(f"No documents found for {acc}.")
+                    continue
+                rows = (_summary_row(d) for d in docs)
+                print_table(f"Documents ({acc})", ["ID", "Title", "Modified"], rows)
+        return
+
     docs = list_documents(
         limit=limit,
         folder_id=folder,
@@ -119,25 +158,13 @@ def list_command(
     )
 
     if is_json_mode():
-        print_json(
-            {
-                "documents": [
-                    {"id": d.id, "title": d.title, "modified_time": d.modified_time} for d in docs
-                ]
-            }
-        )
+        print_json({"documents": docs})
     else:
         if not docs:
             typer.echo("No documents found.")
             return
 
-        rows = []
-        for d in docs:
-            doc_id = d.id[:16] + "..." if len(d.id) > 16 else d.id
-            title = d.title[:50] + "..." if len(d.title) > 50 else d.title
-            modified = str(d.modified_time)[:10] if d.modified_time else "-"
-            rows.append([doc_id, title, modified])
-
+        rows = (_summary_row(d) for d in docs)
         print_table("Documents", ["ID", "Title", "Modified"], rows)
 
 
@@ -209,26 +236,13 @@ def search_command(
     docs = search_documents(query=query, limit=limit, account=account)
 
     if is_json_mode():
-        print_json(
-            {
-                "query": query,
-                "documents": [
-                    {"id": d.id, "title": d.title, "modified_time": d.modified_time} for d in docs
-                ],
-            }
-        )
+        print_json({"query": query, "documents": docs})
     else:
         if not docs:
             typer.echo(f"No documents found matching '{query}'.")
             return
 
-        rows = []
-        for d in docs:
-            doc_id = d.id[:16] + "..." if len(d.id) > 16 else d.id
-            title = d.title[:50] + "..." if len(d.title) > 50 else d.title
-            modified = str(d.modified_time)[:10] if d.modified_time else "-"
-            rows.append([doc_id, title, modified])
-
+        rows = (_summary_row(d) for d in docs)
         print_table(f"Search: '{query}'", ["ID", "Title", "Modified"], rows)
 
 
@@ -261,7 +275,7 @@ def share_command(
       - commenter: Can view and comment
       - writer: Can edit
     """
-    if role not in ("reader", "writer", "commenter"):
+    if role not in _VALID_ROLES:
         typer.echo(f"Invalid role: {role}. Must be reader, writer, or commenter.", err=True)
         raise typer.Exit(1)
 
@@ -309,6 +323,47 @@ def unshare_command(
         print_success(f"Removed permission {permission_id}")
 
 
+@document_app.command("info")
+@require_auth
+def info_command(
+    document_id: Annotated[str, typer.Argument(help="Document ID")],
+    account: Annotated[
+        str | None,
+        typer.Option("--account", "-A", help="Account to use"),
+    ] = None,
+) -> None:
+    """Show document details, permissions, and revisions in one view.
+
+    The two Drive lookups travel as a single batched HTTP request, which
+    runs concurrently with the Docs lookup.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        doc_future = executor.submit(get_document, document_id=document_id, account=account)
+        drive_future = executor.submit(
+            list_permissions_and_revisions, document_id=document_id, account=account
+        )
+    doc = doc_future.result()
+    permissions, revisions = drive_future.result()
+
+    if is_json_mode():
+        print_json(
+            {
+                "document": {
+                    "id": doc.id,
+                    "title": doc.title,
+                    "revision_id": doc.revision_id,
+                    "url": doc.url,
+                },
+                "permissions": permissions,
+                "revisions": revisions,
+            }
+        )
+    else:
+        print_document_info(doc.id, doc.title)
+        typer.echo(f"  Permissions: {len(permissions)}")
+        typer.echo(f"  Revisions: {len(revisions)}")
+
+
 @document_app.command("permissions")
 @require_auth
 def permissions_command(
@@ -10,6 +10,7 @@ from gdocs_cli.cli.content import content_app
 from gdocs_cli.cli.document import document_app
 from gdocs_cli.cli.drives import drives_app
 from gdocs_cli.cli.table import table_app
+from gdocs_cli.services.docs import set_cache_enabled
 from gdocs_cli.utils.output import set_json_mode
 
 app = typer.Typer(
@@ -45,9 +46,17 @@ def main(
             help="Output results as JSON.",
         ),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Disable in-process caching of document content.",
+        ),
+    ] = False,
 ) -> None:
     """Google Docs CLI - Manage documents from the command line."""
     set_json_mode(json_output)
+    set_cache_enabled(not no_cache)
 
 
 # Register sub-apps
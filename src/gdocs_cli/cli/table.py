@@ -1,11 +1,16 @@
 """Table management CLI commands."""
 
+import os
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
 from typing import Annotated
 
+import orjson
 import typer
 
 from gdocs_cli.cli.auth import require_auth
-from gdocs_cli.services.docs import batch_update, get_document_content
+from gdocs_cli.services.docs import batch_update, get_document_structure
 from gdocs_cli.utils.output import is_json_mode, print_json, print_success, print_table
 from gdocs_cli.utils.request_builder import (
     delete_table_column_request,
@@ -21,33 +26,145 @@ table_app = typer.Typer(
     no_args_is_help=True,
 )
 
+batch_app = typer.Typer(
+    name="batch",
+    help="Queue table edits and submit them in one batchUpdate call.",
+    no_args_is_help=True,
+)
+table_app.add_typer(batch_app)
+
+# When GDOCS_BATCH_ID is set, table edits are queued on disk instead of sent
+# immediately; 'gdocs table batch end <id>' submits the whole queue in as few
+# batchUpdate calls as possible (the API caps one call at 500 requests).
+BATCH_ENV_VAR = "GDOCS_BATCH_ID"
+MAX_BATCH_REQUESTS = 500
+_BATCH_DIR = Path.home() / ".cache" / "gdocs-cli" / "batches"
+
+
+def _batch_file(batch_id: str) -> Path:
+    """Get the on-disk queue file for a batch."""
+    return _BATCH_DIR / f"{batch_id}.json"
+
+
+def _read_batch_state(batch_id: str) -> dict:
+    """Load and validate a batch queue file, exiting cleanly if damaged.
+
+    The queue file is written non-atomically, so a partial write (or any
+    other corruption) must surface as an error message, not a traceback.
+
+    Args:
+        batch_id: Batch whose queue file to read.
+
+    Returns:
+        Queue state dict with 'document_id' and 'requests' keys.
+
+    Raises:
+        typer.Exit: If the file cannot be read, parsed, or lacks the
+            expected keys.
+    """
+    try:
+        state = orjson.loads(_batch_file(batch_id).read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        typer.echo(f"Batch queue for '{batch_id}' is unreadable: {e}", err=True)
+        raise typer.Exit(1)
+    if not isinstance(state, dict) or "document_id" not in state or "requests" not in state:
+        typer.echo(f"Batch queue for '{batch_id}' is unreadable: missing queue fields", err=True)
+        raise typer.Exit(1)
+    return state
+
+
+def _submit_or_queue(document_id: str, requests: list[dict], account: str | None) -> bool:
+    """Submit requests immediately, or queue them if a batch is active.
+
+    Args:
+        document_id: Target document ID.
+        requests: Update requests to submit or queue.
+        account: Account to use.
+
+    Returns:
+        True if the requests were queued instead of submitted.
+
+    Raises:
+        typer.Exit: If the queue file is unreadable or the batch already
+            targets a different document.
+    """
+    batch_id = os.environ.get(BATCH_ENV_VAR)
+    if not batch_id:
+        batch_update(document_id, requests, account=account)
+        return False
+
+    path = _batch_file(batch_id)
+    if path.exists():
+        state = _read_batch_state(batch_id)
+        if state["document_id"] != document_id:
+            # A batch is submitted as one batchUpdate per document, so mixing
+            # documents would replay earlier edits against the wrong one.
+            typer.echo(
+                f"Batch '{batch_id}' already queues edits for document "
+                f"'{state['document_id']}'; end it before editing '{document_id}'.",
+                err=True,
+            )
+            raise typer.Exit(1)
+    else:
+        state = {"document_id": document_id, "requests": []}
+    state["requests"].extend(requests)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(state))
+    return True
+
+
+def _print_queued(count: int) -> None:
+    """Report that requests were queued in the active batch."""
+    batch_id = os.environ[BATCH_ENV_VAR]
+    if is_json_mode():
+        print_json({"queued": True, "batch": batch_id, "requests": count})
+    else:
+        print_success(f"Queued {count} request(s) in batch {batch_id}")
+
+
+def _iter_tables(doc_content: dict) -> Iterator[dict]:
+    """Yield table info dicts lazily from document content.
+
+    Args:
+        doc_content: Full document content from API.
+
+    Yields:
+        Table info dicts with index and dimensions, in document order.
+    """
+    for element in doc_content.get("body", {}).get("content", ()):
+        table = element.get("table")
+        if table:
+            yield {
+                "start_index": element.get("startIndex"),
+                "end_index": element.get("endIndex"),
+                "rows": table.get("rows", 0),
+                "columns": table.get("columns", 0),
+            }
+
 
 def _find_tables(doc_content: dict) -> list[dict]:
-    """Find all tables in document content.
+    """Find all tables in document content."""
+    return list(_iter_tables(doc_content))
+
+
+def _nth_table(doc_content: dict, table_index: int) -> dict | None:
+    """Get the table at a position without scanning the rest of the body.
 
     Args:
         doc_content: Full document content from API.
+        table_index: 0-based table position.
 
     Returns:
-        List of table info dicts with index and dimensions.
+        Table info dict, or None if the document has fewer tables.
     """
-    tables = []
-    body = doc_content.get("body", {})
-    content = body.get("content", [])
-
-    for element in content:
-        if "table" in element:
-            table = element["table"]
-            tables.append(
-                {
-                    "start_index": element.get("startIndex"),
-                    "end_index": element.get("endIndex"),
-                    "rows": table.get("rows", 0),
-                    "columns": table.get("columns", 0),
-                }
-            )
+    return next(islice(_iter_tables(doc_content), table_index, table_index + 1), None)
+
 
-    return tables
+def _table_not_found(doc_content: dict, table_index: int) -> None:
+    """Report a missing table index and exit."""
+    count = sum(1 for _ in _iter_tables(doc_content))
+    typer.echo(f"Table index {table_index} not found. Document has {count} table(s).")
+    raise typer.Exit(1)
 
 
 @table_app.command("create")
@@ -76,7 +193,9 @@ def create_table_command(
     By default creates a 3x3 table at the beginning of the document.
     """
     requests = [insert_table_request(rows, columns, index=index)]
-    batch_update(document_id, requests, account=account)
+    if _submit_or_queue(document_id, requests, account):
+        _print_queued(len(requests))
+        return
 
     if is_json_mode():
         print_json(
@@ -101,7 +220,7 @@ def list_tables_command(
     ] = None,
 ) -> None:
     """List all tables in a document."""
-    doc_content = get_document_content(document_id, account=account)
+    doc_content = get_document_structure(document_id, account=account)
     tables = _find_tables(doc_content)
 
     if is_json_mode():
@@ -150,16 +269,14 @@ def add_row_command(
     By default adds below the specified row.
     Use --above to insert above instead.
     """
-    doc_content = get_document_content(document_id, account=account)
-    tables = _find_tables(doc_content)
-
-    if table_index >= len(tables):
-        typer.echo(f"Table index {table_index} not found. Document has {len(tables)} table(s).")
-        raise typer.Exit(1)
-
-    table = tables[table_index]
+    doc_content = get_document_structure(document_id, account=account)
+    table = _nth_table(doc_content, table_index)
+    if table is None:
+        _table_not_found(doc_content, table_index)
     requests = [insert_table_row_request(table["start_index"], row, insert_below=not above)]
-    batch_update(document_id, requests, account=account)
+    if _submit_or_queue(document_id, requests, account):
+        _print_queued(len(requests))
+        return
 
     position = "above" if above else "below"
     if is_json_mode():
@@ -186,16 +303,14 @@ def delete_row_command(
     ] = None,
 ) -> None:
     """Delete a row from a table."""
-    doc_content = get_document_content(document_id, account=account)
-    tables = _find_tables(doc_content)
-
-    if table_index >= len(tables):
-        typer.echo(f"Table index {table_index} not found. Document has {len(tables)} table(s).")
-        raise typer.Exit(1)
-
-    table = tables[table_index]
+    doc_content = get_document_structure(document_id, account=account)
+    table = _nth_table(doc_content, table_index)
+    if table is None:
+        _table_not_found(doc_content, table_index)
     requests = [delete_table_row_request(table["start_index"], row)]
-    batch_update(document_id, requests, account=account)
+    if _submit_or_queue(document_id, requests, account):
+        _print_queued(len(requests))
+        return
 
     if is_json_mode():
         print_json({"deleted_row": True, "table_index": table_index, "row": row})
@@ -229,16 +344,14 @@ def add_column_command(
     By default adds to the right of the specified column.
     Use --left to insert to the left instead.
     """
-    doc_content = get_document_content(document_id, account=account)
-    tables = _find_tables(doc_content)
-
-    if table_index >= len(tables):
-        typer.echo(f"Table index {table_index} not found. Document has {len(tables)} table(s).")
-        raise typer.Exit(1)
-
-    table = tables[table_index]
+    doc_content = get_document_structure(document_id, account=account)
+    table = _nth_table(doc_content, table_index)
+    if table is None:
+        _table_not_found(doc_content, table_index)
     requests = [insert_table_column_request(table["start_index"], column, insert_right=not left)]
-    batch_update(document_id, requests, account=account)
+    if _submit_or_queue(document_id, requests, account):
+        _print_queued(len(requests))
+        return
 
     position = "left of" if left else "right of"
     if is_json_mode():
@@ -265,18 +378,50 @@ def delete_column_command(
     ] = None,
 ) -> None:
     """Delete a column from a table."""
-    doc_content = get_document_content(document_id, account=account)
-    tables = _find_tables(doc_content)
-
-    if table_index >= len(tables):
-        typer.echo(f"Table index {table_index} not found. Document has {len(tables)} table(s).")
-        raise typer.Exit(1)
-
-    table = tables[table_index]
+    doc_content = get_document_structure(document_id, account=account)
+    table = _nth_table(doc_content, table_index)
+    if table is None:
+        _table_not_found(doc_content, table_index)
     requests = [delete_table_column_request(table["start_index"], column)]
-    batch_update(document_id, requests, account=account)
+    if _submit_or_queue(document_id, requests, account):
+        _print_queued(len(requests))
+        return
 
     if is_json_mode():
         print_json({"deleted_column": True, "table_index": table_index, "column": column})
     else:
         print_success(f"Deleted column {column} from table {table_index}")
+
+
+@batch_app.command("end")
+@require_auth
+def batch_end_command(
+    batch_id: Annotated[str, typer.Argument(help="Batch ID to submit")],
+    account: Annotated[
+        str | None,
+        typer.Option("--account", "-A", help="Account to use"),
+    ] = None,
+) -> None:
+    """Submit all queued requests for a batch.
+
+    Queue edits by running table commands with GDOCS_BATCH_ID set, then
+    submit them here in one API call per 500 requests.
+    """
+    path = _batch_file(batch_id)
+    if not path.exists():
+        typer.echo(f"Batch not found: {batch_id}", err=True)
+        raise typer.Exit(1)
+
+    state = _read_batch_state(batch_id)
+    document_id = state["document_id"]
+    requests = state["requests"]
+
+    for start in range(0, len(requests), MAX_BATCH_REQUESTS):
+        batch_update(document_id, requests[start : start + MAX_BATCH_REQUESTS], account=account)
+
+    path.unlink()
+
+    if is_json_mode():
+        print_json({"submitted": True, "batch": batch_id, "requests": len(requests)})
+    else:
+        print_success(f"Submitted {len(requests)} request(s) from batch {batch_id}")
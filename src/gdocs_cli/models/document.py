@@ -3,8 +3,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# Bound .format method: building a URL is one method call, with no f-string
+# evaluation per access.
+_URL_TMPL = "https://docs.google.com/document/d/{}/edit".format
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Document:
     """A Google Docs document."""
 
@@ -18,10 +22,10 @@ class Document:
     @property
     def url(self) -> str:
         """Get the document URL."""
-        return f"https://docs.google.com/document/d/{self.id}/edit"
+        return _URL_TMPL(self.id)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentSummary:
     """Document metadata for list operations."""
 
@@ -32,10 +36,10 @@ class DocumentSummary:
     @property
     def url(self) -> str:
         """Get the document URL."""
-        return f"https://docs.google.com/document/d/{self.id}/edit"
+        return _URL_TMPL(self.id)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SharedDrive:
     """A Google Shared Drive (Team Drive)."""
 
@@ -43,7 +47,7 @@ class SharedDrive:
     name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Folder:
     """A folder in Google Drive."""
 
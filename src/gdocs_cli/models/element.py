@@ -27,7 +27,7 @@ class Alignment(str, Enum):
     JUSTIFIED = "JUSTIFIED"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextStyle:
     """Text formatting options."""
 
@@ -42,7 +42,7 @@ class TextStyle:
     link_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParagraphStyle:
     """Paragraph formatting options."""
 
@@ -54,7 +54,7 @@ class ParagraphStyle:
     indent_first_line_pt: float = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TableCell:
     """A single table cell."""
 
@@ -63,7 +63,7 @@ class TableCell:
     column_span: int = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Table:
     """A table structure."""
 
@@ -1,29 +1,96 @@
-"""OAuth flow service for Google Docs authentication with multi-account support."""
+"""OAuth flow service for Google Docs authentication with multi-account support.
+
+The google-auth imports are deferred into the functions that need them; they
+dominate CLI cold-start time and most commands never run the OAuth flow.
+"""
+
+from __future__ import annotations
 
 import os
+import sys
+import time
+from datetime import UTC, datetime
 from pathlib import Path
-
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+from typing import TYPE_CHECKING
 
 from gdocs_cli.services.credentials import (
     clear_all_accounts,
     delete_credentials,
+    get_cached_access_token,
     get_default_account,
     list_accounts,
     load_credentials,
     save_credentials,
 )
 
-# Google Docs + Drive API scopes
-SCOPES = [
-    "https://www.googleapis.com/auth/documents",  # Full docs access
-    "https://www.googleapis.com/auth/drive.file",  # Create/open docs in Drive
-    "https://www.googleapis.com/auth/drive.readonly",  # List drives and folders
-    "https://www.googleapis.com/auth/userinfo.email",  # Get user email
-    "openid",  # Required by Google when using userinfo.email
-]
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+# Google Docs + Drive API scopes. Immutable and interned: the same strings
+# recur in every loaded Credentials object and in the library's scope checks.
+SCOPES = tuple(
+    sys.intern(scope)
+    for scope in (
+        "https://www.googleapis.com/auth/documents",  # Full docs access
+        "https://www.googleapis.com/auth/drive.file",  # Create/open docs in Drive
+        "https://www.googleapis.com/auth/drive.readonly",  # List drives and folders
+        "https://www.googleapis.com/auth/userinfo.email",  # Get user email
+        "openid",  # Required by Google when using userinfo.email
+    )
+)
+
+
+# Short-lived snapshot of the accounts list: account resolution, auth checks,
+# and logout each enumerate accounts, and one CLI command can hit several of
+# them. A couple of seconds amortizes the keyring round trips to one per run.
+_accounts_cache: tuple[list[str], float] | None = None
+_ACCOUNTS_CACHE_TTL = 2.0
+
+
+def _cached_list_accounts() -> list[str]:
+    """List accounts, reusing a snapshot taken within the last TTL window."""
+    global _accounts_cache
+    now = time.monotonic()
+    if _accounts_cache is not None and now - _accounts_cache[1] < _ACCOUNTS_CACHE_TTL:
+        return _accounts_cache[0]
+    accounts = list_accounts()
+    _accounts_cache = (accounts, now)
+    return accounts
+
+
+def _invalidate_accounts_cache() -> None:
+    """Drop the accounts snapshot after accounts are added or removed."""
+    global _accounts_cache
+    _accounts_cache = None
+
+
+# Live Credentials objects per account: loading means a keyring decrypt plus
+# JSON parse, so one object serves every service build within a process.
+_cred_cache: dict[str, Credentials] = {}
+
+
+# Recent is_authenticated results per account; validity can only change via
+# our own mutations (which invalidate) or token expiry, so a short TTL is safe.
+_auth_cache: dict[str | None, tuple[bool, float]] = {}
+_AUTH_CACHE_TTL = 1.0
+
+# Refresh tokens this close to expiry even though they still pass the
+# client-side expired check: the server can reject them mid-request.
+_REFRESH_WINDOW_SECONDS = 60.0
+
+
+def _invalidate_cred_cache(account: str | None = None) -> None:
+    """Drop cached Credentials after they are refreshed, replaced, or deleted.
+
+    Args:
+        account: Account to drop. If None, the whole cache is cleared.
+    """
+    if account is None:
+        _cred_cache.clear()
+    else:
+        _cred_cache.pop(account, None)
+    # Authentication results are derived from the credentials
+    _auth_cache.clear()
 
 
 class AccountNotFoundError(Exception):
@@ -60,29 +127,37 @@ def resolve_account(explicit_account: str | None = None) -> str:
         AccountNotFoundError: If specified account doesn't exist.
         NoAccountConfiguredError: If no accounts are configured.
     """
-    accounts = list_accounts()
+    # Fetched lazily so branches that never need the enumeration don't pay
+    # for it, and at most once per call.
+    accounts: list[str] | None = None
+
+    def _accounts() -> list[str]:
+        nonlocal accounts
+        if accounts is None:
+            accounts = _cached_list_accounts()
+        return accounts
 
     # Priority 1: Explicit --account flag
     if explicit_account:
-        if explicit_account not in accounts:
-            raise AccountNotFoundError(explicit_account, accounts)
+        if explicit_account not in _accounts():
+            raise AccountNotFoundError(explicit_account, _accounts())
         return explicit_account
 
     # Priority 2: Environment variable
     env_account = os.environ.get("GDOCS_ACCOUNT")
     if env_account:
-        if env_account not in accounts:
-            raise AccountNotFoundError(env_account, accounts)
+        if env_account not in _accounts():
+            raise AccountNotFoundError(env_account, _accounts())
         return env_account
 
     # Priority 3: Configured default
     default = get_default_account()
-    if default and default in accounts:
+    if default and default in _accounts():
         return default
 
     # Priority 4: First available
-    if accounts:
-        return accounts[0]
+    if _accounts():
+        return _accounts()[0]
 
     raise NoAccountConfiguredError()
 
@@ -108,6 +183,30 @@ def get_credentials_file() -> Path:
     )
 
 
+def _pick_free_port(preferred: tuple[int, ...]) -> int:
+    """Pick the first bindable port from the preferred list.
+
+    Args:
+        preferred: Ports to try, in order.
+
+    Returns:
+        First port that accepts a bind, or 0 (OS auto-select) if none do.
+    """
+    import socket
+
+    for port in preferred:
+        sock = socket.socket()
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("127.0.0.1", port))
+            return port
+        except OSError:
+            continue
+        finally:
+            sock.close()
+    return 0
+
+
 def run_oauth_flow() -> tuple[Credentials, str]:
     """Run the OAuth 2.0 authorization flow.
 
@@ -116,34 +215,27 @@ def run_oauth_flow() -> tuple[Credentials, str]:
     Returns:
         Tuple of (authorized credentials, email address).
     """
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     credentials_file = get_credentials_file()
-    flow = InstalledAppFlow.from_client_secrets_file(str(credentials_file), SCOPES)
+    # The flow wants a list; SCOPES itself stays an immutable tuple
+    flow = InstalledAppFlow.from_client_secrets_file(str(credentials_file), list(SCOPES))
 
     # Run local server for OAuth callback
     # Use a specific port range to avoid conflicts with other services
     print("Starting OAuth flow... A browser window will open.")
     print("After authorizing, you'll be redirected back automatically.")
 
-    # Try ports in a specific range to avoid conflicts
-    for port in [9090, 9091, 9092, 8888, 8889]:
-        try:
-            credentials = flow.run_local_server(
-                port=port,
-                prompt="consent",
-                success_message="Authentication successful! You can close this window.",
-                open_browser=True,
-            )
-            break
-        except OSError:
-            continue
-    else:
-        # Fallback to auto-select if all ports are in use
-        credentials = flow.run_local_server(
-            port=0,
-            prompt="consent",
-            success_message="Authentication successful! You can close this window.",
-            open_browser=True,
-        )
+    # Probe port availability with a plain bind first: a failed
+    # run_local_server attempt pays full flow setup and opens a browser
+    # before raising. Fall back to auto-select if all preferred ports are
+    # taken.
+    credentials = flow.run_local_server(
+        port=_pick_free_port((9090, 9091, 9092, 8888, 8889)),
+        prompt="consent",
+        success_message="Authentication successful! You can close this window.",
+        open_browser=True,
+    )
 
     # Get email address for the authenticated user
     from googleapiclient.discovery import build
@@ -152,8 +244,18 @@ def run_oauth_flow() -> tuple[Credentials, str]:
     user_info = service.userinfo().get().execute()
     email = user_info.get("email", "")
 
-    # Save credentials with account email
+    # Google omits the refresh token on repeat consent flows; keep the one
+    # stored from the first authorization instead of overwriting it with None.
+    if credentials.refresh_token is None:
+        previous = load_credentials(account=email)
+        if previous is not None and previous.refresh_token:
+            credentials._refresh_token = previous.refresh_token
+
+    # Save credentials with account email. This also replaces the cached
+    # access token, so tokens minted under an older scope set don't linger.
     save_credentials(credentials, account=email)
+    _invalidate_accounts_cache()
+    _invalidate_cred_cache(email)
 
     return credentials, email
 
@@ -174,21 +276,36 @@ def get_credentials(account: str | None = None) -> Credentials | None:
         except (AccountNotFoundError, NoAccountConfiguredError):
             return None
 
+    cached = _cred_cache.get(account)
+    if cached is not None and not cached.expired:
+        return cached
+
     credentials = load_credentials(account=account)
 
     if not credentials:
+        _invalidate_cred_cache(account)
         return None
 
-    # Check if credentials need refresh
-    if credentials.expired and credentials.refresh_token:
+    # Refresh proactively inside the safety window rather than waiting for
+    # the token to read as expired; expiry timestamps are naive UTC.
+    needs_refresh = False
+    if credentials.expiry is not None:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        remaining = (credentials.expiry - now).total_seconds()
+        needs_refresh = remaining <= _REFRESH_WINDOW_SECONDS
+    if needs_refresh and credentials.refresh_token:
+        from google.auth.transport.requests import Request
+
         try:
             credentials.refresh(Request())
             save_credentials(credentials, account=account)
         except Exception:
             # Refresh failed, need to re-authenticate
             delete_credentials(account=account)
+            _invalidate_cred_cache(account)
             return None
 
+    _cred_cache[account] = credentials
     return credentials
 
 
@@ -201,16 +318,33 @@ def is_authenticated(account: str | None = None) -> bool:
     Returns:
         True if valid credentials exist, False otherwise.
     """
+    now = time.monotonic()
+    cached = _auth_cache.get(account)
+    if cached is not None and now - cached[1] < _AUTH_CACHE_TTL:
+        return cached[0]
+    result = _check_authenticated(account)
+    _auth_cache[account] = (result, now)
+    return result
+
+
+def _check_authenticated(account: str | None) -> bool:
+    """Probe the keyring/credentials for is_authenticated."""
     if account:
+        # A fresh cached access token means valid credentials without a
+        # keyring round trip; the keyring remains authoritative on a miss.
+        if get_cached_access_token(account):
+            return True
         credentials = get_credentials(account=account)
         return credentials is not None and credentials.valid
 
     # Check if any account is authenticated
-    accounts = list_accounts()
+    accounts = _cached_list_accounts()
     if not accounts:
         return False
 
     # Check first available account
+    if get_cached_access_token(accounts[0]):
+        return True
     credentials = get_credentials(account=accounts[0])
     return credentials is not None and credentials.valid
 
@@ -235,9 +369,12 @@ def refresh_credentials(account: str | None = None) -> bool:
     if not credentials or not credentials.refresh_token:
         return False
 
+    from google.auth.transport.requests import Request
+
     try:
         credentials.refresh(Request())
         save_credentials(credentials, account=account)
+        _invalidate_cred_cache(account)
         return True
     except Exception:
         return False
@@ -293,19 +430,22 @@ def logout(account: str | None = None, all_accounts: bool = False) -> list[str]:
     Returns:
         List of logged out account emails.
     """
-    if all_accounts:
-        accounts = list_accounts()
-        clear_all_accounts()
-        return accounts
+    try:
+        if all_accounts:
+            # clear_all_accounts enumerates once and reports what it removed
+            return clear_all_accounts()
 
-    if account:
-        delete_credentials(account=account)
-        return [account]
+        if account:
+            delete_credentials(account=account)
+            return [account]
 
-    # Logout default account
-    try:
-        default = resolve_account()
-        delete_credentials(account=default)
-        return [default]
-    except (AccountNotFoundError, NoAccountConfiguredError):
-        return []
+        # Logout default account
+        try:
+            default = resolve_account()
+            delete_credentials(account=default)
+            return [default]
+        except (AccountNotFoundError, NoAccountConfiguredError):
+            return []
+    finally:
+        _invalidate_accounts_cache()
+        _invalidate_cred_cache()
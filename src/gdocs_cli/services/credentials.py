@@ -1,16 +1,38 @@
 """Keyring storage service for OAuth credentials with multi-account support."""
 
-import json
-from datetime import datetime
+from __future__ import annotations
 
-import keyring
-from google.oauth2.credentials import Credentials
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 SERVICE_NAME = "gdocs-cli"
 LEGACY_ACCOUNT_NAME = "oauth_credentials"  # Legacy single-account key
 ACCOUNTS_LIST_KEY = "accounts_list"
 DEFAULT_ACCOUNT_KEY = "default_account"
 
+# Best-effort on-disk cache of access tokens so scripted CLI runs don't pay a
+# keyring round trip per invocation. The keyring remains authoritative.
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "gdocs-cli" / "tokens.json"
+TOKEN_EXPIRY_SKEW_SECONDS = 300  # Treat tokens expiring within 5 min as stale
+
+
+def _dumps(obj: object) -> str:
+    """Serialize to a JSON string (orjson emits bytes)."""
+    return orjson.dumps(obj).decode()
+
+
+# Prefix for account-specific keyring entries; hot call sites concatenate it
+# directly rather than paying a function call per keyring operation.
+_ACCOUNT_KEY_PREFIX = "oauth_"
+
 
 def _get_account_key(email: str) -> str:
     """Get keyring key for account-specific credentials.
@@ -21,7 +43,125 @@ def _get_account_key(email: str) -> str:
     Returns:
         Keyring key string for the account.
     """
-    return f"oauth_{email}"
+    return _ACCOUNT_KEY_PREFIX + email
+
+
+# Process-lifetime cache of keyring entries, keyed by entry name. Keyring
+# lookups are cross-process IPC on every desktop backend, and one CLI
+# invocation reads the same handful of entries repeatedly.
+_kr_cache: dict[str, str | None] = {}
+
+
+def _reset_keyring_cache() -> None:
+    """Drop all cached keyring entries (used by tests)."""
+    _kr_cache.clear()
+
+
+def _kr_get(key: str) -> str | None:
+    """Read a keyring entry through the in-process cache."""
+    if key in _kr_cache:
+        return _kr_cache[key]
+    import keyring
+
+    value = keyring.get_password(SERVICE_NAME, key)
+    _kr_cache[key] = value
+    return value
+
+
+def _kr_set(key: str, value: str) -> None:
+    """Write a keyring entry and keep the cache in step."""
+    import keyring
+
+    keyring.set_password(SERVICE_NAME, key, value)
+    _kr_cache[key] = value
+
+
+def _kr_delete(key: str) -> None:
+    """Delete a keyring entry; the cache entry goes first so it cannot
+    outlive a failed delete."""
+    import keyring
+
+    _kr_cache.pop(key, None)
+    keyring.delete_password(SERVICE_NAME, key)
+
+
+def _read_token_cache() -> dict:
+    """Read the on-disk token cache, returning an empty dict on any failure."""
+    try:
+        return orjson.loads(TOKEN_CACHE_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _write_token_cache(cache: dict) -> None:
+    """Write the on-disk token cache with owner-only permissions (best effort)."""
+    try:
+        TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(_dumps(cache))
+    except OSError:
+        pass
+
+
+def cache_access_token(account: str, token: str | None, expiry_iso: str | None) -> None:
+    """Store an access token in the on-disk cache.
+
+    Args:
+        account: Account email the token belongs to.
+        token: Access token to cache. Entries without a token are dropped.
+        expiry_iso: Token expiry in ISO format.
+    """
+    cache = _read_token_cache()
+    if token and expiry_iso:
+        cache[account] = {"access_token": token, "expiry": expiry_iso}
+    else:
+        cache.pop(account, None)
+    _write_token_cache(cache)
+
+
+def get_cached_access_token(account: str) -> str | None:
+    """Get a still-fresh access token from the on-disk cache.
+
+    Args:
+        account: Account email to look up.
+
+    Returns:
+        Access token if cached and not expiring within the skew window,
+        None otherwise.
+    """
+    entry = _read_token_cache().get(account)
+    if not entry:
+        return None
+    try:
+        expiry = datetime.fromisoformat(entry["expiry"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    now = datetime.now(UTC)
+    if expiry.tzinfo is None:
+        # google-auth stores expiry as naive UTC
+        now = now.replace(tzinfo=None)
+    if expiry - now <= timedelta(seconds=TOKEN_EXPIRY_SKEW_SECONDS):
+        return None
+    return entry.get("access_token")
+
+
+def clear_cached_access_token(account: str | None = None) -> None:
+    """Remove entries from the on-disk token cache.
+
+    Args:
+        account: Account to remove. If None, the whole cache is cleared.
+    """
+    if account is None:
+        try:
+            TOKEN_CACHE_PATH.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return
+    cache = _read_token_cache()
+    if account in cache:
+        del cache[account]
+        _write_token_cache(cache)
 
 
 def list_accounts() -> list[str]:
@@ -30,12 +170,12 @@ def list_accounts() -> list[str]:
     Returns:
         List of account email addresses.
     """
-    data = keyring.get_password(SERVICE_NAME, ACCOUNTS_LIST_KEY)
+    data = _kr_get(ACCOUNTS_LIST_KEY)
     if not data:
         return []
     try:
-        return json.loads(data)
-    except json.JSONDecodeError:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
         return []
 
 
@@ -45,7 +185,7 @@ def get_default_account() -> str | None:
     Returns:
         Default account email or None if not set.
     """
-    return keyring.get_password(SERVICE_NAME, DEFAULT_ACCOUNT_KEY)
+    return _kr_get(DEFAULT_ACCOUNT_KEY)
 
 
 def set_default_account(account: str) -> None:
@@ -54,7 +194,7 @@ def set_default_account(account: str) -> None:
     Args:
         account: Email address to set as default.
     """
-    keyring.set_password(SERVICE_NAME, DEFAULT_ACCOUNT_KEY, account)
+    _kr_set(DEFAULT_ACCOUNT_KEY, account)
 
 
 def _add_to_accounts_list(account: str) -> None:
@@ -66,7 +206,7 @@ def _add_to_accounts_list(account: str) -> None:
     accounts = list_accounts()
     if account not in accounts:
         accounts.append(account)
-        keyring.set_password(SERVICE_NAME, ACCOUNTS_LIST_KEY, json.dumps(accounts))
+        _kr_set(ACCOUNTS_LIST_KEY, _dumps(accounts))
 
 
 def _remove_from_accounts_list(account: str) -> None:
@@ -78,7 +218,7 @@ def _remove_from_accounts_list(account: str) -> None:
     accounts = list_accounts()
     if account in accounts:
         accounts.remove(account)
-        keyring.set_password(SERVICE_NAME, ACCOUNTS_LIST_KEY, json.dumps(accounts))
+        _kr_set(ACCOUNTS_LIST_KEY, _dumps(accounts))
 
 
 def save_credentials(credentials: Credentials, account: str | None = None) -> None:
@@ -100,15 +240,16 @@ def save_credentials(credentials: Credentials, account: str | None = None) -> No
 
     if account:
         # Multi-account format
-        keyring.set_password(SERVICE_NAME, _get_account_key(account), json.dumps(creds_data))
+        _kr_set(_ACCOUNT_KEY_PREFIX + account, _dumps(creds_data))
         _add_to_accounts_list(account)
+        cache_access_token(account, creds_data["token"], creds_data["expiry"])
 
         # Set as default if first account
         if len(list_accounts()) == 1:
             set_default_account(account)
     else:
         # Legacy single-account format (for backward compatibility)
-        keyring.set_password(SERVICE_NAME, LEGACY_ACCOUNT_NAME, json.dumps(creds_data))
+        _kr_set(LEGACY_ACCOUNT_NAME, _dumps(creds_data))
 
 
 def load_credentials(account: str | None = None) -> Credentials | None:
@@ -120,18 +261,16 @@ def load_credentials(account: str | None = None) -> Credentials | None:
     Returns:
         Credentials object if found, None otherwise.
     """
-    if account:
-        # Multi-account format
-        creds_json = keyring.get_password(SERVICE_NAME, _get_account_key(account))
-    else:
-        # Legacy single-account format
-        creds_json = keyring.get_password(SERVICE_NAME, LEGACY_ACCOUNT_NAME)
+    from google.oauth2.credentials import Credentials
+
+    key = _ACCOUNT_KEY_PREFIX + account if account else LEGACY_ACCOUNT_NAME
+    creds_json = _kr_get(key)
 
     if not creds_json:
         return None
 
     try:
-        creds_data = json.loads(creds_json)
+        creds_data = orjson.loads(creds_json)
         expiry = None
         if creds_data.get("expiry"):
             expiry = datetime.fromisoformat(creds_data["expiry"])
@@ -145,7 +284,7 @@ def load_credentials(account: str | None = None) -> Credentials | None:
             scopes=creds_data.get("scopes", []),
             expiry=expiry,
         )
-    except (json.JSONDecodeError, KeyError):
+    except (orjson.JSONDecodeError, KeyError):
         return None
 
 
@@ -155,11 +294,14 @@ def delete_credentials(account: str | None = None) -> None:
     Args:
         account: Account email to delete. If None, deletes legacy format.
     """
+    import keyring
+
     try:
         if account:
             # Multi-account format
-            keyring.delete_password(SERVICE_NAME, _get_account_key(account))
+            _kr_delete(_ACCOUNT_KEY_PREFIX + account)
             _remove_from_accounts_list(account)
+            clear_cached_access_token(account)
 
             # Update default if deleted account was default
             default = get_default_account()
@@ -169,12 +311,12 @@ def delete_credentials(account: str | None = None) -> None:
                     set_default_account(accounts[0])
                 else:
                     try:
-                        keyring.delete_password(SERVICE_NAME, DEFAULT_ACCOUNT_KEY)
+                        _kr_delete(DEFAULT_ACCOUNT_KEY)
                     except keyring.errors.PasswordDeleteError:
                         pass
         else:
             # Legacy single-account format
-            keyring.delete_password(SERVICE_NAME, LEGACY_ACCOUNT_NAME)
+            _kr_delete(LEGACY_ACCOUNT_NAME)
     except keyring.errors.PasswordDeleteError:
         pass
 
@@ -189,8 +331,40 @@ def has_credentials(account: str | None = None) -> bool:
         True if credentials exist, False otherwise.
     """
     if account:
-        return keyring.get_password(SERVICE_NAME, _get_account_key(account)) is not None
-    return keyring.get_password(SERVICE_NAME, LEGACY_ACCOUNT_NAME) is not None
+        # Accounts not on the (cached) accounts list can't have a stored
+        # blob, so the keyring round trip is skipped entirely for them.
+        if account not in list_accounts():
+            return False
+        return _kr_get(_ACCOUNT_KEY_PREFIX + account) is not None
+    return _kr_get(LEGACY_ACCOUNT_NAME) is not None
+
+
+def get_token_expiries(accounts: list[str]) -> dict[str, str | None]:
+    """Get token expiry times for multiple accounts in one pass.
+
+    Reads each stored credential blob once and extracts the expiry directly
+    from the JSON, avoiding a full Credentials construction per account.
+
+    Args:
+        accounts: Account email addresses to look up.
+
+    Returns:
+        Mapping of account email to formatted expiry time, or None if the
+        account has no credentials or no expiry.
+    """
+    expiries: dict[str, str | None] = {}
+    for account in accounts:
+        expiries[account] = None
+        creds_json = _kr_get(_ACCOUNT_KEY_PREFIX + account)
+        if not creds_json:
+            continue
+        try:
+            expiry = orjson.loads(creds_json).get("expiry")
+        except orjson.JSONDecodeError:
+            continue
+        if expiry:
+            expiries[account] = datetime.fromisoformat(expiry).strftime("%Y-%m-%d %H:%M:%S")
+    return expiries
 
 
 def get_raw_credentials_json(account: str) -> str | None:
@@ -204,27 +378,50 @@ def get_raw_credentials_json(account: str) -> str | None:
     Returns:
         Raw JSON string of credentials or None if not found.
     """
-    return keyring.get_password(SERVICE_NAME, _get_account_key(account))
+    return _kr_get(_ACCOUNT_KEY_PREFIX + account)
 
 
-def clear_all_accounts() -> None:
+def _delete_key_quietly(key: str) -> None:
+    """Delete one keyring entry, ignoring missing entries."""
+    import keyring
+
+    try:
+        _kr_delete(key)
+    except keyring.errors.PasswordDeleteError:
+        pass
+
+
+def clear_all_accounts() -> list[str]:
     """Clear all accounts and credentials from keyring.
 
     Used for logout --all functionality.
+
+    Returns:
+        Accounts that were removed, from the single enumeration done here.
     """
+    clear_cached_access_token()
     accounts = list_accounts()
-    for account in accounts:
-        try:
-            keyring.delete_password(SERVICE_NAME, _get_account_key(account))
-        except keyring.errors.PasswordDeleteError:
-            pass
 
-    try:
-        keyring.delete_password(SERVICE_NAME, ACCOUNTS_LIST_KEY)
-    except keyring.errors.PasswordDeleteError:
-        pass
+    # Assemble every key up front so the deletes run as one parallel batch
+    # of independent I/O round trips instead of sequential calls.
+    keys = [_ACCOUNT_KEY_PREFIX + account for account in accounts]
+    keys.append(ACCOUNTS_LIST_KEY)
+    keys.append(DEFAULT_ACCOUNT_KEY)
+    with ThreadPoolExecutor(max_workers=min(8, len(keys))) as executor:
+        list(executor.map(_delete_key_quietly, keys))
 
-    try:
-        keyring.delete_password(SERVICE_NAME, DEFAULT_ACCOUNT_KEY)
-    except keyring.errors.PasswordDeleteError:
-        pass
+    return accounts
+
+
+def __getattr__(name: str):
+    """Expose the lazily imported keyring module as a module attribute.
+
+    keyring costs ~30 ms to import, so the functions above import it on
+    first use; this keeps patch targets like ``credentials.keyring``
+    resolving for callers that reach it through this module.
+    """
+    if name == "keyring":
+        import keyring
+
+        return keyring
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,52 @@
-"""Google Docs and Drive API service."""
+"""Google Docs and Drive API service.
 
-import time
+The googleapiclient imports are deferred into the functions that need them;
+they are expensive to load and would otherwise slow down every CLI start,
+including commands that never talk to the API.
+"""
 
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import random
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from gdocs_cli.models.document import Document, DocumentSummary, Folder, SharedDrive
 from gdocs_cli.services.auth import get_credentials
 
 MAX_RETRIES = 3
 BASE_DELAY = 1
+MAX_DELAY = 32
+
+# Transient statuses worth retrying: rate limits and server-side errors
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Per-process cache of documents.get responses keyed by (document_id, fields,
+# account). Saves re-downloading the document tree when several lookups hit
+# the same document within one invocation; invalidated on every batch_update.
+_document_cache: dict[tuple[str, str | None, str | None], dict] = {}
+_cache_enabled = True
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Enable or disable the in-process document content cache."""
+    global _cache_enabled
+    _cache_enabled = enabled
+    if not enabled:
+        _document_cache.clear()
+
+
+def invalidate_document_cache(document_id: str | None = None) -> None:
+    """Drop cached document content after a mutation.
+
+    Args:
+        document_id: Document to drop. If None, the whole cache is cleared.
+    """
+    if document_id is None:
+        _document_cache.clear()
+        return
+    for key in [k for k in _document_cache if k[0] == document_id]:
+        del _document_cache[key]
 
 
 class TokenExpiredError(Exception):
@@ -20,22 +57,53 @@ class TokenExpiredError(Exception):
         super().__init__(f"Token expired for {account or 'account'}")
 
 
-def get_docs_service(account: str | None = None):
-    """Get authenticated Google Docs API service.
+@lru_cache(maxsize=8)
+def _build_service(api: str, version: str, account: str | None):
+    """Build (and memoize) an authenticated API service stub.
+
+    Stub construction is the slowest part of any command, so it is cached
+    per (api, version, account) for the process; static_discovery skips the
+    network discovery-document fetch entirely.
 
     Args:
+        api: API name, e.g. "docs" or "drive".
+        version: API version, e.g. "v1".
         account: Account to use for authentication.
 
     Returns:
-        Google Docs API service instance.
+        Google API service instance.
 
     Raises:
         Exception: If not authenticated.
     """
+    from googleapiclient.discovery import build
+
     credentials = get_credentials(account=account)
     if not credentials:
         raise Exception("Not authenticated. Run 'gdocs auth login' first.")
-    return build("docs", "v1", credentials=credentials)
+    return build(
+        api, version, credentials=credentials, cache_discovery=False, static_discovery=True
+    )
+
+
+def clear_service_cache() -> None:
+    """Drop memoized API service stubs after credentials change."""
+    _build_service.cache_clear()
+
+
+def get_docs_service(account: str | None = None):
+    """Get authenticated Google Docs API service.
+
+    Args:
+        account: Account to use for authentication.
+
+    Returns:
+        Google Docs API service instance.
+
+    Raises:
+        Exception: If not authenticated.
+    """
+    return _build_service("docs", "v1", account)
 
 
 def get_drive_service(account: str | None = None):
@@ -50,14 +118,38 @@ def get_drive_service(account: str | None = None):
     Raises:
         Exception: If not authenticated.
     """
-    credentials = get_credentials(account=account)
-    if not credentials:
-        raise Exception("Not authenticated. Run 'gdocs auth login' first.")
-    return build("drive", "v3", credentials=credentials)
+    return _build_service("drive", "v3", account)
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    """Pick the sleep before the next retry attempt.
+
+    Jittered exponential backoff: concurrent invocations hitting the same
+    rate limit spread out instead of retrying in lockstep. A Retry-After
+    header from the server sets the floor when present.
+
+    Args:
+        attempt: Zero-based retry attempt number.
+        retry_after: Raw Retry-After header value, if the server sent one.
+
+    Returns:
+        Seconds to sleep.
+    """
+    ceiling = min(MAX_DELAY, BASE_DELAY * 3 * (2**attempt))
+    delay = random.uniform(BASE_DELAY, ceiling)
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+    return delay
 
 
 def _execute_with_retry(request, account: str | None = None):
-    """Execute API request with exponential backoff.
+    """Execute API request with jittered exponential backoff.
+
+    Rate limits (429) and transient server errors (500/502/503/504) are
+    retried; other failures propagate immediately.
 
     Args:
         request: API request to execute.
@@ -70,18 +162,162 @@ def _execute_with_retry(request, account: str | None = None):
         HttpError: If request fails after retries.
         TokenExpiredError: If token has expired.
     """
+    from googleapiclient.errors import HttpError
+
+    last_error: HttpError | None = None
     for attempt in range(MAX_RETRIES):
         try:
             return request.execute()
         except HttpError as e:
             if e.resp.status == 401:
                 raise TokenExpiredError(account)
-            if e.resp.status == 429:  # Rate limited
-                delay = BASE_DELAY * (2**attempt)
-                time.sleep(delay)
-            else:
+            if e.resp.status not in _RETRYABLE_STATUSES:
                 raise
-    return request.execute()  # Final attempt
+            last_error = e
+            if attempt < MAX_RETRIES - 1:
+                time.sleep(_retry_delay(attempt, e.resp.get("retry-after")))
+    raise last_error
+
+
+def _execute_batch(service, requests: Sequence, account: str | None = None) -> list:
+    """Execute independent API requests as one multipart batch call.
+
+    N sub-requests share a single HTTP round trip instead of one each.
+    Only use this for requests that don't depend on each other's results.
+
+    Args:
+        service: Service the requests were built from.
+        requests: Independent HttpRequest objects, in order.
+        account: Account for error context.
+
+    Returns:
+        Responses in the same order as the requests.
+
+    Raises:
+        HttpError: If any sub-request fails (the first failure is raised).
+        TokenExpiredError: If the token has expired.
+    """
+    from googleapiclient.errors import HttpError
+
+    responses: list = [None] * len(requests)
+    errors: list[Exception] = []
+
+    def _collect(index: int):
+        def _callback(_request_id, response, exception) -> None:
+            if exception is not None:
+                errors.append(exception)
+            else:
+                responses[index] = response
+
+        return _callback
+
+    batch = service.new_batch_http_request()
+    for index, request in enumerate(requests):
+        batch.add(request, callback=_collect(index))
+    _execute_with_retry(batch, account=account)
+
+    if errors:
+        error = errors[0]
+        if isinstance(error, HttpError) and error.resp.status == 401:
+            raise TokenExpiredError(account)
+        raise error
+    return responses
+
+
+def _q_escape(value: str) -> str:
+    """Escape a value for interpolation into a Drive query string.
+
+    An unescaped quote breaks the query and costs a wasted round trip on
+    400 Invalid Query; backslashes and single quotes must be escaped.
+
+    Args:
+        value: Raw value, e.g. a user-supplied search term.
+
+    Returns:
+        Value safe to place inside single quotes in a q parameter.
+    """
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+# Base q strings for the two Drive listings; only the optional parent filter
+# varies per call.
+_DOCS_MIME_QUERY = "mimeType='application/vnd.google-apps.document'"
+_FOLDERS_MIME_QUERY = "mimeType='application/vnd.google-apps.folder'"
+
+
+@lru_cache(maxsize=128)
+def _listing_query(mime_query: str, parent_id: str | None) -> str:
+    """Build (and memoize) a Drive listing query with an optional parent filter.
+
+    The same folder tends to be listed repeatedly within one invocation
+    (pagination, multi-account fan-out), so the escaped string is cached
+    instead of rebuilt per call.
+    """
+    if not parent_id:
+        return mime_query
+    return f"{mime_query} and '{_q_escape(parent_id)}' in parents"
+
+
+@lru_cache(maxsize=128)
+def _search_query(query: str) -> str:
+    """Build (and memoize) a name-contains search query for documents."""
+    return f"{_DOCS_MIME_QUERY} and name contains '{_q_escape(query)}'"
+
+
+def _paginate(resource, params: dict, limit: int, account: str | None = None):
+    """Yield list-endpoint items across pages until limit is reached.
+
+    Follows nextPageToken so results beyond one API page (capped at 1000
+    by Drive) aren't silently truncated, and yields items as each page
+    arrives instead of materializing the full list.
+
+    Args:
+        resource: Resource collection with a .list() method (e.g. files()).
+        params: Request parameters; pageSize/pageToken are managed here.
+        limit: Maximum items to yield.
+        account: Account for error context.
+
+    Yields:
+        Raw item dicts from the responses, in API order.
+    """
+    params = dict(params)
+    params["pageSize"] = min(limit, 1000)
+    yielded = 0
+    while True:
+        response = _execute_with_retry(resource.list(**params), account=account)
+        for item in response.get("files", []):
+            yield item
+            yielded += 1
+            if yielded >= limit:
+                return
+        token = response.get("nextPageToken")
+        if not token:
+            return
+        params["pageToken"] = token
+
+
+def _iter_summaries(files):
+    """Yield DocumentSummary objects from raw Drive file dicts.
+
+    A generator so callers that can stream (or stop early) never hold a
+    second full list alongside the raw response items.
+    """
+    for f in files:
+        yield DocumentSummary(
+            id=f["id"],
+            title=f["name"],
+            modified_time=f.get("modifiedTime"),
+        )
+
+
+def _iter_folders(files):
+    """Yield Folder objects from raw Drive file dicts."""
+    for f in files:
+        yield Folder(
+            id=f["id"],
+            name=f["name"],
+            parent_id=f.get("parents", [None])[0] if f.get("parents") else None,
+        )
 
 
 # =============================================================================
@@ -104,40 +340,30 @@ def create_document(
     Returns:
         Created Document object.
     """
-    docs_service = get_docs_service(account=account)
-    body = {"title": title}
-    request = docs_service.documents().create(body=body)
-    response = _execute_with_retry(request, account=account)
-
-    document_id = response["documentId"]
-
-    # If folder specified, move to that folder (supports Shared Drives)
+    # With a target folder, create through Drive with the parent set up front:
+    # one request instead of a Docs create plus a parent lookup and a move.
     if folder_id:
         drive_service = get_drive_service(account=account)
-
-        # Get current parent (My Drive root)
-        file = (
-            drive_service.files()
-            .get(
-                fileId=document_id,
-                fields="parents",
-                supportsAllDrives=True,
-            )
-            .execute()
+        body = {
+            "name": title,
+            "mimeType": "application/vnd.google-apps.document",
+            "parents": [folder_id],
+        }
+        request = drive_service.files().create(
+            body=body,
+            supportsAllDrives=True,
+            fields="id, name",
         )
-        previous_parents = ",".join(file.get("parents", []))
+        response = _execute_with_retry(request, account=account)
+        return Document(id=response["id"], title=response["name"])
 
-        # Move to target folder
-        drive_service.files().update(
-            fileId=document_id,
-            addParents=folder_id,
-            removeParents=previous_parents,
-            supportsAllDrives=True,
-            fields="id, parents",
-        ).execute()
+    docs_service = get_docs_service(account=account)
+    body = {"title": title}
+    request = docs_service.documents().create(body=body)
+    response = _execute_with_retry(request, account=account)
 
     return Document(
-        id=document_id,
+        id=response["documentId"],
         title=response["title"],
         revision_id=response.get("revisionId"),
     )
@@ -154,7 +380,12 @@ def get_document(document_id: str, account: str | None = None) -> Document:
         Document with content.
     """
     service = get_docs_service(account=account)
-    request = service.documents().get(documentId=document_id)
+    # Only metadata is read here; the mask keeps the (potentially huge)
+    # document body off the wire entirely.
+    request = service.documents().get(
+        documentId=document_id,
+        fields="documentId,title,revisionId",
+    )
     response = _execute_with_retry(request, account=account)
 
     return Document(
@@ -164,19 +395,82 @@ def get_document(document_id: str, account: str | None = None) -> Document:
     )
 
 
-def get_document_content(document_id: str, account: str | None = None) -> dict:
+def get_documents_bulk(
+    document_ids: Sequence[str],
+    account: str | None = None,
+    max_workers: int = 8,
+) -> list[Document]:
+    """Fetch metadata for several documents concurrently.
+
+    Each lookup is an independent HTTP round trip, so they run in a thread
+    pool; wall-clock time is roughly one round trip instead of one per
+    document.
+
+    Args:
+        document_ids: Document IDs to fetch.
+        account: Account to use.
+        max_workers: Upper bound on concurrent requests.
+
+    Returns:
+        Documents in the same order as document_ids.
+    """
+    if not document_ids:
+        return []
+
+    def _get(document_id: str) -> Document:
+        return get_document(document_id, account=account)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(document_ids))) as executor:
+        return list(executor.map(_get, document_ids))
+
+
+def get_document_content(
+    document_id: str,
+    fields: str | None = None,
+    account: str | None = None,
+) -> dict:
     """Get full document content including body.
 
     Args:
         document_id: The document ID.
+        fields: Optional field mask to limit the response payload.
         account: Account to use.
 
     Returns:
         Full document API response.
     """
+    cache_key = (document_id, fields, account)
+    if _cache_enabled and cache_key in _document_cache:
+        return _document_cache[cache_key]
+
     service = get_docs_service(account=account)
-    request = service.documents().get(documentId=document_id)
-    return _execute_with_retry(request, account=account)
+    params = {"documentId": document_id}
+    if fields:
+        params["fields"] = fields
+    request = service.documents().get(**params)
+    response = _execute_with_retry(request, account=account)
+
+    if _cache_enabled:
+        _document_cache[cache_key] = response
+    return response
+
+
+# Structural skeleton only: element positions and table dimensions, no text
+# runs or styles. Orders of magnitude smaller than the full tree for big docs.
+STRUCTURE_FIELDS = "body(content(startIndex,endIndex,table(rows,columns)))"
+
+
+def get_document_structure(document_id: str, account: str | None = None) -> dict:
+    """Get only the structural skeleton of a document.
+
+    Args:
+        document_id: The document ID.
+        account: Account to use.
+
+    Returns:
+        Document API response limited to element positions and table shapes.
+    """
+    return get_document_content(document_id, fields=STRUCTURE_FIELDS, account=account)
 
 
 def list_documents(
@@ -198,16 +492,10 @@ def list_documents(
     """
     service = get_drive_service(account=account)
 
-    # Build query
-    query = "mimeType='application/vnd.google-apps.document'"
-    if folder_id:
-        query += f" and '{folder_id}' in parents"
-
     # Build request parameters
     params = {
-        "q": query,
-        "pageSize": limit,
-        "fields": "files(id, name, modifiedTime, parents)",
+        "q": _listing_query(_DOCS_MIME_QUERY, folder_id),
+        "fields": "files(id, name, modifiedTime, parents), nextPageToken",
         "orderBy": "modifiedTime desc",
         "supportsAllDrives": True,
         "includeItemsFromAllDrives": True,
@@ -218,17 +506,42 @@ def list_documents(
         params["corpora"] = "drive"
         params["driveId"] = shared_drive_id
 
-    request = service.files().list(**params)
-    response = _execute_with_retry(request, account=account)
+    return list(_iter_summaries(_paginate(service.files(), params, limit, account=account)))
 
-    return [
-        DocumentSummary(
-            id=f["id"],
-            title=f["name"],
-            modified_time=f.get("modifiedTime"),
+
+def list_documents_for_accounts(
+    accounts: Sequence[str],
+    limit: int = 20,
+    folder_id: str | None = None,
+    shared_drive_id: str | None = None,
+) -> dict[str, list[DocumentSummary]]:
+    """List documents for several accounts concurrently.
+
+    The per-account requests are independent HTTP round trips, so they run
+    in a thread pool; wall-clock time is roughly one round trip instead of
+    one per account.
+
+    Args:
+        accounts: Account email addresses to query.
+        limit: Maximum documents per account.
+        folder_id: Optional folder ID to filter by.
+        shared_drive_id: Optional Shared Drive ID.
+
+    Returns:
+        Mapping of account email to its document summaries.
+    """
+
+    def _list(account: str) -> list[DocumentSummary]:
+        return list_documents(
+            limit=limit,
+            folder_id=folder_id,
+            shared_drive_id=shared_drive_id,
+            account=account,
         )
-        for f in response.get("files", [])
-    ]
+
+    with ThreadPoolExecutor(max_workers=min(8, len(accounts))) as executor:
+        results = executor.map(_list, accounts)
+    return dict(zip(accounts, results, strict=True))
 
 
 def delete_document(document_id: str, account: str | None = None) -> None:
@@ -298,7 +611,7 @@ def list_shared_drives(account: str | None = None) -> list[SharedDrive]:
         List of shared drives.
     """
     service = get_drive_service(account=account)
-    request = service.drives().list(pageSize=100)
+    request = service.drives().list(pageSize=100, fields="drives(id, name)")
     response = _execute_with_retry(request, account=account)
 
     return [SharedDrive(id=d["id"], name=d["name"]) for d in response.get("drives", [])]
@@ -321,16 +634,10 @@ def list_folders(
     """
     service = get_drive_service(account=account)
 
-    # Build query
-    query = "mimeType='application/vnd.google-apps.folder'"
-    if parent_id:
-        query += f" and '{parent_id}' in parents"
-
     # Build request parameters
     params = {
-        "q": query,
-        "pageSize": 100,
-        "fields": "files(id, name, parents)",
+        "q": _listing_query(_FOLDERS_MIME_QUERY, parent_id),
+        "fields": "files(id, name, parents), nextPageToken",
         "orderBy": "name",
         "supportsAllDrives": True,
         "includeItemsFromAllDrives": True,
@@ -340,17 +647,7 @@ def list_folders(
         params["corpora"] = "drive"
         params["driveId"] = shared_drive_id
 
-    request = service.files().list(**params)
-    response = _execute_with_retry(request, account=account)
-
-    return [
-        Folder(
-            id=f["id"],
-            name=f["name"],
-            parent_id=f.get("parents", [None])[0] if f.get("parents") else None,
-        )
-        for f in response.get("files", [])
-    ]
+    return list(_iter_folders(_paginate(service.files(), params, limit=100, account=account)))
 
 
 # =============================================================================
@@ -463,6 +760,37 @@ def list_revisions(document_id: str, account: str | None = None) -> list[dict]:
     return response.get("revisions", [])
 
 
+def list_permissions_and_revisions(
+    document_id: str,
+    account: str | None = None,
+) -> tuple[list[dict], list[dict]]:
+    """List permissions and revisions with one batched HTTP request.
+
+    Args:
+        document_id: Document ID.
+        account: Account to use.
+
+    Returns:
+        Tuple of (permissions, revisions).
+    """
+    service = get_drive_service(account=account)
+    permissions_request = service.permissions().list(
+        fileId=document_id,
+        supportsAllDrives=True,
+        fields="permissions(id, type, role, emailAddress, displayName)",
+    )
+    revisions_request = service.revisions().list(
+        fileId=document_id,
+        fields="revisions(id, modifiedTime, lastModifyingUser)",
+    )
+    permissions, revisions = _execute_batch(
+        service,
+        [permissions_request, revisions_request],
+        account=account,
+    )
+    return permissions.get("permissions", []), revisions.get("revisions", [])
+
+
 # =============================================================================
 # Search Operations
 # =============================================================================
@@ -485,29 +813,15 @@ def search_documents(
     """
     service = get_drive_service(account=account)
 
-    # Build query - search in name
-    full_query = f"mimeType='application/vnd.google-apps.document' and name contains '{query}'"
-
     params = {
-        "q": full_query,
-        "pageSize": limit,
-        "fields": "files(id, name, modifiedTime)",
+        "q": _search_query(query),
+        "fields": "files(id, name, modifiedTime), nextPageToken",
         "orderBy": "modifiedTime desc",
         "supportsAllDrives": True,
         "includeItemsFromAllDrives": True,
     }
 
-    request = service.files().list(**params)
-    response = _execute_with_retry(request, account=account)
-
-    return [
-        DocumentSummary(
-            id=f["id"],
-            title=f["name"],
-            modified_time=f.get("modifiedTime"),
-        )
-        for f in response.get("files", [])
-    ]
+    return list(_iter_summaries(_paginate(service.files(), params, limit, account=account)))
 
 
 # =============================================================================
@@ -517,14 +831,14 @@ def search_documents(
 
 def batch_update(
     document_id: str,
-    requests: list[dict],
+    requests: Sequence[dict],
     account: str | None = None,
 ) -> dict:
     """Execute batch update on document.
 
     Args:
         document_id: Target document ID.
-        requests: List of update requests.
+        requests: Update requests, in order. Any sequence (list or tuple) works.
         account: Account to use.
 
     Returns:
@@ -536,4 +850,7 @@ def batch_update(
         documentId=document_id,
         body=body,
     )
-    return _execute_with_retry(request, account=account)
+    response = _execute_with_retry(request, account=account)
+    # The mutation changes indices/content, so any cached tree is now stale
+    invalidate_document_cache(document_id)
+    return response
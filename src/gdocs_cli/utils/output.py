@@ -1,46 +1,73 @@
-"""Output formatting utilities using rich."""
+"""Output formatting utilities using rich.
+
+The rich imports and Console construction are deferred until the first
+human-readable print: JSON-mode invocations never touch rich at all.
+"""
 
-import json
 import sys
-from typing import Any
+from collections.abc import Iterable, Sequence
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+import orjson
 
-from rich.console import Console
-from rich.table import Table
+if TYPE_CHECKING:
+    from rich.console import Console
 
 # Force UTF-8 encoding on Windows
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
-console = Console(force_terminal=True if sys.platform == "win32" else None)
+_console: "Console | None" = None
+
+
+def _get_console() -> "Console":
+    """Get the shared Console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console(force_terminal=True if sys.platform == "win32" else None)
+    return _console
+
 
-# Global flag for JSON output mode
-_json_mode = False
+# JSON output mode flag. A ContextVar instead of a plain module global so
+# concurrent contexts (threaded test runners, future async use) each see
+# their own value; for the single-threaded CLI it behaves like the global.
+_json_mode: ContextVar[bool] = ContextVar("json_mode", default=False)
+
+# Status-line prefixes, hoisted so each print is a single concatenation
+# instead of re-formatting the same markup every call
+_PREFIX_OK = "[green]✓[/green] "
+_PREFIX_ERR = "[red]✗[/red] [bold]Error:[/bold] "
+_PREFIX_WARN = "[yellow]![/yellow] "
+_PREFIX_INFO = "[blue]ℹ[/blue] "
 
 
 def set_json_mode(enabled: bool) -> None:
-    """Set global JSON output mode."""
-    global _json_mode
-    _json_mode = enabled
+    """Set JSON output mode for the current context."""
+    _json_mode.set(enabled)
 
 
 def is_json_mode() -> bool:
     """Check if JSON output mode is enabled."""
-    return _json_mode
+    return _json_mode.get()
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    if _json_mode:
+    if _json_mode.get():
         return
-    console.print(f"[green]✓[/green] {message}")
+    _get_console().print(_PREFIX_OK + message)
 
 
 def print_error(message: str, details: str | None = None, tip: str | None = None) -> None:
     """Print an error message with optional details and tip."""
-    if _json_mode:
+    if _json_mode.get():
         return
-    console.print(f"[red]✗[/red] [bold]Error:[/bold] {message}")
+    console = _get_console()
+    console.print(_PREFIX_ERR + message)
     if details:
         console.print(f"  {details}")
     if tip:
@@ -49,21 +76,32 @@ def print_error(message: str, details: str | None = None, tip: str | None = None
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    if _json_mode:
+    if _json_mode.get():
         return
-    console.print(f"[yellow]![/yellow] {message}")
+    _get_console().print(_PREFIX_WARN + message)
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    if _json_mode:
+    if _json_mode.get():
         return
-    console.print(f"[blue]ℹ[/blue] {message}")
+    _get_console().print(_PREFIX_INFO + message)
+
 
+def print_json(data: Any) -> None:
+    """Print data as formatted JSON.
 
-def print_json(data: dict[str, Any] | list[Any]) -> None:
-    """Print data as formatted JSON."""
-    console.print(json.dumps(data, indent=2, default=str, ensure_ascii=False))
+    Dataclasses (and lists of them) serialize natively, so callers can pass
+    domain models without building intermediate dicts.
+    """
+    # orjson serializes significantly faster than stdlib json and emits UTF-8
+    # without escaping; writing the bytes straight to stdout skips a decode
+    # plus the rich console's markup and wrapping machinery.
+    sys.stdout.buffer.write(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    )
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.flush()
 
 
 def print_json_error(code: str, message: str, details: str | None = None) -> None:
@@ -81,13 +119,19 @@ def print_json_error(code: str, message: str, details: str | None = None) -> Non
 def print_table(
     title: str | None,
     columns: list[str],
-    rows: list[list[str]],
+    rows: Iterable[Sequence[str]],
     footer: str | None = None,
 ) -> None:
-    """Print a formatted table."""
-    if _json_mode:
+    """Print a formatted table.
+
+    Rows may be any iterable (including a generator); they are consumed
+    once, straight into the renderer.
+    """
+    if _json_mode.get():
         return
 
+    from rich.table import Table
+
     table = Table(title=title, show_header=True, header_style="bold")
 
     for column in columns:
@@ -96,6 +140,7 @@ def print_table(
     for row in rows:
         table.add_row(*row)
 
+    console = _get_console()
     console.print(table)
 
     if footer:
@@ -116,9 +161,10 @@ def print_document_info(
         modified_time: Optional modification time.
         show_url: Whether to show the document URL.
     """
-    if _json_mode:
+    if _json_mode.get():
         return
 
+    console = _get_console()
     console.print(f"[bold]Title:[/bold] {title}")
     console.print(f"[bold]ID:[/bold] {doc_id}")
     if modified_time:
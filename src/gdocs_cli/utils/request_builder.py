@@ -1,6 +1,50 @@
 """BatchUpdate request builder utilities for Google Docs API."""
 
-from gdocs_cli.models.element import NamedStyleType, ParagraphStyle, TextStyle
+from functools import lru_cache
+from operator import attrgetter
+
+from gdocs_cli.models.element import Alignment, NamedStyleType, ParagraphStyle, TextStyle
+
+# Default alignment sentinel: identity check beats comparing .value strings
+_START = Alignment.START
+
+# Shared location for the no-segment append fast path. The API client only
+# serializes request dicts, so the one instance is safe to reuse; treat it
+# as read-only.
+_EMPTY_SEGMENT_LOCATION: dict = {}
+
+
+@lru_cache(maxsize=128)
+def _pt(magnitude: float) -> dict:
+    """Build a point-unit Dimension dict.
+
+    Cached: the common magnitudes (heading sizes, standard spacing) recur
+    across a batch; the returned dict is shared and read-only.
+    """
+    return {"magnitude": magnitude, "unit": "PT"}
+
+
+def _range(start_index: int, end_index: int, segment_id: str | None) -> dict:
+    """Build a Range dict, including segmentId only when one is given."""
+    if segment_id:
+        return {"startIndex": start_index, "endIndex": end_index, "segmentId": segment_id}
+    return {"startIndex": start_index, "endIndex": end_index}
+
+
+def _location(index: int, segment_id: str | None) -> dict:
+    """Build a Location dict, including segmentId only when one is given."""
+    if segment_id:
+        return {"index": index, "segmentId": segment_id}
+    return {"index": index}
+
+
+def _cell_location(table_start_index: int, row_index: int, column_index: int) -> dict:
+    """Build a TableCellLocation dict shared by the row/column builders."""
+    return {
+        "tableStartLocation": {"index": table_start_index},
+        "rowIndex": row_index,
+        "columnIndex": column_index,
+    }
 
 
 def insert_text_request(
@@ -18,9 +62,7 @@ def insert_text_request(
     Returns:
         InsertTextRequest dict.
     """
-    location = {"index": index}
-    if segment_id:
-        location["segmentId"] = segment_id
+    location = _location(index, segment_id)
 
     return {
         "insertText": {
@@ -43,24 +85,30 @@ def insert_text_at_end_request(
     Returns:
         InsertTextRequest dict.
     """
-    location: dict = {"endOfSegmentLocation": {}}
-    if segment_id:
-        location["endOfSegmentLocation"]["segmentId"] = segment_id
+    end_location = {"segmentId": segment_id} if segment_id else _EMPTY_SEGMENT_LOCATION
 
     return {
         "insertText": {
-            **location,
+            "endOfSegmentLocation": end_location,
             "text": text,
         }
     }
 
 
+def has_any_style(style: TextStyle) -> bool:
+    """Check whether a TextStyle sets any attribute at all.
+
+    Lets callers skip building (and sending) a no-op style update.
+    """
+    return any(_get_text_style_values(style))
+
+
 def update_text_style_request(
     start_index: int,
     end_index: int,
     style: TextStyle,
     segment_id: str | None = None,
-) -> dict:
+) -> dict | None:
     """Build UpdateTextStyleRequest.
 
     Args:
@@ -70,48 +118,29 @@ def update_text_style_request(
         segment_id: Optional segment ID.
 
     Returns:
-        UpdateTextStyleRequest dict.
+        UpdateTextStyleRequest dict, or None when the style sets nothing —
+        an empty fields mask would just be a wasted request.
     """
     fields = []
     text_style = {}
+    for value, (key, convert) in zip(
+        _get_text_style_values(style), _TEXT_STYLE_FIELDS, strict=True
+    ):
+        if value:
+            text_style[key] = True if convert is None else convert(value)
+            fields.append(key)
 
-    if style.bold:
-        text_style["bold"] = True
-        fields.append("bold")
-    if style.italic:
-        text_style["italic"] = True
-        fields.append("italic")
-    if style.underline:
-        text_style["underline"] = True
-        fields.append("underline")
-    if style.strikethrough:
-        text_style["strikethrough"] = True
-        fields.append("strikethrough")
-    if style.font_size:
-        text_style["fontSize"] = {"magnitude": style.font_size, "unit": "PT"}
-        fields.append("fontSize")
-    if style.font_family:
-        text_style["weightedFontFamily"] = {"fontFamily": style.font_family}
-        fields.append("weightedFontFamily")
-    if style.link_url:
-        text_style["link"] = {"url": style.link_url}
-        fields.append("link")
-    if style.foreground_color:
-        text_style["foregroundColor"] = _parse_color(style.foreground_color)
-        fields.append("foregroundColor")
-    if style.background_color:
-        text_style["backgroundColor"] = _parse_color(style.background_color)
-        fields.append("backgroundColor")
-
-    range_spec = {"startIndex": start_index, "endIndex": end_index}
-    if segment_id:
-        range_spec["segmentId"] = segment_id
+    if not fields:
+        return None
+
+    range_spec = _range(start_index, end_index, segment_id)
 
     return {
         "updateTextStyle": {
             "range": range_spec,
             "textStyle": text_style,
-            "fields": ",".join(fields),
+            # Single-field masks are the common case; skip the join for them
+            "fields": fields[0] if len(fields) == 1 else ",".join(fields),
         }
     }
 
@@ -138,35 +167,29 @@ def update_paragraph_style_request(
         "namedStyleType": style.named_style.value,
     }
 
-    if style.alignment.value != "START":
-        paragraph_style["alignment"] = style.alignment.value
+    alignment = style.alignment
+    if alignment is not _START:
+        paragraph_style["alignment"] = alignment.value
         fields.append("alignment")
 
-    if style.space_above_pt > 0:
-        paragraph_style["spaceAbove"] = {"magnitude": style.space_above_pt, "unit": "PT"}
-        fields.append("spaceAbove")
+    for attr, key in _PARAGRAPH_PT_FIELDS:
+        value = getattr(style, attr)
+        if value > 0:
+            paragraph_style[key] = _pt(value)
+            fields.append(key)
 
-    if style.space_below_pt > 0:
-        paragraph_style["spaceBelow"] = {"magnitude": style.space_below_pt, "unit": "PT"}
-        fields.append("spaceBelow")
-
-    if style.indent_first_line_pt > 0:
-        paragraph_style["indentFirstLine"] = {"magnitude": style.indent_first_line_pt, "unit": "PT"}
-        fields.append("indentFirstLine")
-
-    range_spec = {"startIndex": start_index, "endIndex": end_index}
-    if segment_id:
-        range_spec["segmentId"] = segment_id
+    range_spec = _range(start_index, end_index, segment_id)
 
     return {
         "updateParagraphStyle": {
             "range": range_spec,
             "paragraphStyle": paragraph_style,
-            "fields": ",".join(fields),
+            "fields": fields[0] if len(fields) == 1 else ",".join(fields),
         }
     }
 
 
+@lru_cache(maxsize=256)
 def apply_named_style_request(
     start_index: int,
     end_index: int,
@@ -175,6 +198,10 @@ def apply_named_style_request(
 ) -> dict:
     """Build UpdateParagraphStyleRequest for named style only.
 
+    Cached: bulk document construction reapplies the same style to the
+    same ranges; the returned dict is shared and must be treated as
+    read-only.
+
     Args:
         start_index: Start of range.
         end_index: End of range.
@@ -184,9 +211,7 @@ def apply_named_style_request(
     Returns:
         UpdateParagraphStyleRequest dict.
     """
-    range_spec = {"startIndex": start_index, "endIndex": end_index}
-    if segment_id:
-        range_spec["segmentId"] = segment_id
+    range_spec = _range(start_index, end_index, segment_id)
 
     return {
         "updateParagraphStyle": {
@@ -214,9 +239,7 @@ def insert_table_request(
     Returns:
         InsertTableRequest dict.
     """
-    location = {"index": index}
-    if segment_id:
-        location["segmentId"] = segment_id
+    location = _location(index, segment_id)
 
     return {
         "insertTable": {
@@ -244,11 +267,7 @@ def insert_table_row_request(
     """
     return {
         "insertTableRow": {
-            "tableCellLocation": {
-                "tableStartLocation": {"index": table_start_index},
-                "rowIndex": row_index,
-                "columnIndex": 0,
-            },
+            "tableCellLocation": _cell_location(table_start_index, row_index, 0),
             "insertBelow": insert_below,
         }
     }
@@ -269,11 +288,7 @@ def delete_table_row_request(
     """
     return {
         "deleteTableRow": {
-            "tableCellLocation": {
-                "tableStartLocation": {"index": table_start_index},
-                "rowIndex": row_index,
-                "columnIndex": 0,
-            },
+            "tableCellLocation": _cell_location(table_start_index, row_index, 0),
         }
     }
 
@@ -295,11 +310,7 @@ def insert_table_column_request(
     """
     return {
         "insertTableColumn": {
-            "tableCellLocation": {
-                "tableStartLocation": {"index": table_start_index},
-                "rowIndex": 0,
-                "columnIndex": column_index,
-            },
+            "tableCellLocation": _cell_location(table_start_index, 0, column_index),
             "insertRight": insert_right,
         }
     }
@@ -320,11 +331,7 @@ def delete_table_column_request(
     """
     return {
         "deleteTableColumn": {
-            "tableCellLocation": {
-                "tableStartLocation": {"index": table_start_index},
-                "rowIndex": 0,
-                "columnIndex": column_index,
-            },
+            "tableCellLocation": _cell_location(table_start_index, 0, column_index),
         }
     }
 
@@ -344,9 +351,7 @@ def delete_content_range_request(
     Returns:
         DeleteContentRangeRequest dict.
     """
-    range_spec = {"startIndex": start_index, "endIndex": end_index}
-    if segment_id:
-        range_spec["segmentId"] = segment_id
+    range_spec = _range(start_index, end_index, segment_id)
 
     return {
         "deleteContentRange": {
@@ -400,28 +405,23 @@ def insert_inline_image_request(
     Returns:
         InsertInlineImageRequest dict.
     """
-    location = {"index": index}
-    if segment_id:
-        location["segmentId"] = segment_id
-
-    request = {
-        "insertInlineImage": {
-            "location": location,
-            "uri": uri,
-        }
+    object_size = {}
+    if width_pt:
+        object_size["width"] = _pt(width_pt)
+    if height_pt:
+        object_size["height"] = _pt(height_pt)
+
+    image = {
+        "location": _location(index, segment_id),
+        "uri": uri,
     }
+    if object_size:
+        image["objectSize"] = object_size
 
-    if width_pt or height_pt:
-        object_size = {}
-        if width_pt:
-            object_size["width"] = {"magnitude": width_pt, "unit": "PT"}
-        if height_pt:
-            object_size["height"] = {"magnitude": height_pt, "unit": "PT"}
-        request["insertInlineImage"]["objectSize"] = object_size
-
-    return request
+    return {"insertInlineImage": image}
 
 
+@lru_cache(maxsize=256)
 def create_paragraph_bullets_request(
     start_index: int,
     end_index: int,
@@ -430,6 +430,8 @@ def create_paragraph_bullets_request(
 ) -> dict:
     """Build CreateParagraphBulletsRequest.
 
+    Cached; the returned dict is shared and must be treated as read-only.
+
     Args:
         start_index: Start of range.
         end_index: End of range.
@@ -439,9 +441,7 @@ def create_paragraph_bullets_request(
     Returns:
         CreateParagraphBulletsRequest dict.
     """
-    range_spec = {"startIndex": start_index, "endIndex": end_index}
-    if segment_id:
-        range_spec["segmentId"] = segment_id
+    range_spec = _range(start_index, end_index, segment_id)
 
     return {
         "createParagraphBullets": {
@@ -451,6 +451,7 @@ def create_paragraph_bullets_request(
     }
 
 
+@lru_cache(maxsize=256)
 def delete_paragraph_bullets_request(
     start_index: int,
     end_index: int,
@@ -458,6 +459,8 @@ def delete_paragraph_bullets_request(
 ) -> dict:
     """Build DeleteParagraphBulletsRequest.
 
+    Cached; the returned dict is shared and must be treated as read-only.
+
     Args:
         start_index: Start of range.
         end_index: End of range.
@@ -466,9 +469,7 @@ def delete_paragraph_bullets_request(
     Returns:
         DeleteParagraphBulletsRequest dict.
     """
-    range_spec = {"startIndex": start_index, "endIndex": end_index}
-    if segment_id:
-        range_spec["segmentId"] = segment_id
+    range_spec = _range(start_index, end_index, segment_id)
 
     return {
         "deleteParagraphBullets": {
@@ -477,26 +478,73 @@ def delete_paragraph_bullets_request(
     }
 
 
+# Byte value to color channel float, computed once instead of dividing on
+# every parse
+_BYTE_TO_FLOAT = tuple(i / 255.0 for i in range(256))
+
+
+@lru_cache(maxsize=64)
 def _parse_color(hex_color: str) -> dict:
     """Parse hex color to Google Docs color format.
 
+    Documents typically reuse a small palette across many styled runs, so
+    results are cached; the returned dict is shared and must be treated
+    as read-only.
+
     Args:
         hex_color: Hex color string (e.g., "#FF0000" or "FF0000").
 
     Returns:
         Color dict for Google Docs API.
     """
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16) / 255.0
-    g = int(hex_color[2:4], 16) / 255.0
-    b = int(hex_color[4:6], 16) / 255.0
-
+    if hex_color.startswith("#"):
+        hex_color = hex_color[1:]
+    r, g, b = bytes.fromhex(hex_color)
+    table = _BYTE_TO_FLOAT
     return {
         "color": {
             "rgbColor": {
-                "red": r,
-                "green": g,
-                "blue": b,
+                "red": table[r],
+                "green": table[g],
+                "blue": table[b],
             }
         }
     }
+
+
+# One C-level attrgetter call fetches all nine style attributes at once
+# instead of nine LOAD_ATTRs per builder call.
+_get_text_style_values = attrgetter(
+    "bold",
+    "italic",
+    "underline",
+    "strikethrough",
+    "font_size",
+    "font_family",
+    "link_url",
+    "foreground_color",
+    "background_color",
+)
+
+# API field names and value converters, positionally parallel to the
+# attrgetter above and in the order they appear in the fields mask. One
+# linear scan over this table replaces a chain of per-attribute branches;
+# None means the attribute is a boolean flag.
+_TEXT_STYLE_FIELDS = (
+    ("bold", None),
+    ("italic", None),
+    ("underline", None),
+    ("strikethrough", None),
+    ("fontSize", _pt),
+    ("weightedFontFamily", lambda v: {"fontFamily": v}),
+    ("link", lambda v: {"url": v}),
+    ("foregroundColor", _parse_color),
+    ("backgroundColor", _parse_color),
+)
+
+# Point-dimension paragraph attributes, applied when greater than zero
+_PARAGRAPH_PT_FIELDS = (
+    ("space_above_pt", "spaceAbove"),
+    ("space_below_pt", "spaceBelow"),
+    ("indent_first_line_pt", "indentFirstLine"),
+)
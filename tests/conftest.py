@@ -1,9 +1,103 @@
 """Pytest configuration and fixtures."""
 
+from types import SimpleNamespace
+
 import pytest
 from typer.testing import CliRunner
 
 
+@pytest.fixture(scope="session", autouse=True)
+def preload_cli_modules():
+    """Import every CLI submodule once up front.
+
+    Dotted-path patching resolves its target through importlib on first
+    touch; forcing the imports here makes every later lookup a plain
+    sys.modules hit.
+    """
+    import gdocs_cli.cli.auth  # noqa: F401
+    import gdocs_cli.cli.content  # noqa: F401
+    import gdocs_cli.cli.document  # noqa: F401
+    import gdocs_cli.cli.drives  # noqa: F401
+    import gdocs_cli.cli.main  # noqa: F401
+    import gdocs_cli.cli.table  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def token_cache_path(tmp_path, monkeypatch):
+    """Point the on-disk token cache at a per-test temp file."""
+    from gdocs_cli.services import credentials
+
+    monkeypatch.setattr(credentials, "TOKEN_CACHE_PATH", tmp_path / "tokens.json")
+
+
+@pytest.fixture(autouse=True)
+def reset_auth_caches():
+    """Reset per-process auth caches so tests don't leak cached state."""
+    from gdocs_cli.cli import auth as cli_auth
+    from gdocs_cli.services import auth as services_auth
+
+    cli_auth._invalidate_account_caches()
+    services_auth._invalidate_accounts_cache()
+    services_auth._invalidate_cred_cache()
+    yield
+    cli_auth._invalidate_account_caches()
+    services_auth._invalidate_accounts_cache()
+    services_auth._invalidate_cred_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_keyring_cache():
+    """Drop cached keyring entries so each test sees its own mocks."""
+    from gdocs_cli.services import credentials
+
+    credentials._reset_keyring_cache()
+    yield
+    credentials._reset_keyring_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_document_cache():
+    """Clear the in-process document and service caches between tests."""
+    from gdocs_cli.services import docs
+
+    docs.invalidate_document_cache()
+    docs.clear_service_cache()
+    yield
+    docs.invalidate_document_cache()
+    docs.clear_service_cache()
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Remove GDOCS_ACCOUNT so tests control account resolution explicitly.
+
+    monkeypatch records single-variable deltas instead of copying the
+    whole environment the way patch.dict does; tests that need the
+    variable call clean_env.setenv on the returned handle.
+    """
+    monkeypatch.delenv("GDOCS_ACCOUNT", raising=False)
+    return monkeypatch
+
+
+@pytest.fixture
+def auth_mocks(mocker):
+    """Patch the auth service's collaborators once, as a bundle.
+
+    One fixture setup replaces the per-test mocker.patch churn; tests
+    configure return_value/side_effect on the handles they care about.
+    """
+    return SimpleNamespace(
+        list_accounts=mocker.patch("gdocs_cli.services.auth.list_accounts"),
+        get_default_account=mocker.patch("gdocs_cli.services.auth.get_default_account"),
+        load_credentials=mocker.patch("gdocs_cli.services.auth.load_credentials"),
+        save_credentials=mocker.patch("gdocs_cli.services.auth.save_credentials"),
+        delete_credentials=mocker.patch("gdocs_cli.services.auth.delete_credentials"),
+        clear_all_accounts=mocker.patch("gdocs_cli.services.auth.clear_all_accounts"),
+        resolve_account=mocker.patch("gdocs_cli.services.auth.resolve_account"),
+        get_credentials=mocker.patch("gdocs_cli.services.auth.get_credentials"),
+    )
+
+
 @pytest.fixture
 def cli_runner():
     """Create a CLI runner for testing."""
@@ -13,12 +107,10 @@ def cli_runner():
 @pytest.fixture
 def mock_credentials(mocker):
     """Mock credentials for testing."""
-    mock_creds = mocker.MagicMock()
-    mock_creds.valid = True
-    mock_creds.expired = False
-    mock_creds.token = "test_token"
-    mock_creds.refresh_token = "test_refresh_token"
-    return mock_creds
+    # MagicMock synthesizes token attributes on demand; only the flags the
+    # code branches on need real values. Tests that assert on exact token
+    # strings set them locally.
+    return mocker.MagicMock(valid=True, expired=False)
 
 
 @pytest.fixture
@@ -1,30 +1,199 @@
 """Tests for CLI commands."""
 
+import importlib
+
+import pytest
+import typer
 from typer.testing import CliRunner
 
-from gdocs_cli.cli.main import app
 from gdocs_cli.models.document import Document, DocumentSummary, Folder, SharedDrive
 
-runner = CliRunner()
+
+class Runner(CliRunner):
+    """CliRunner with invoke-and-assert helpers for the common cases."""
+
+    def ok(self, app, argv, **kwargs):
+        """Invoke and assert a zero exit, returning the result."""
+        result = self.invoke(app, argv, **kwargs)
+        assert result.exit_code == 0, result.output
+        return result
+
+    def fail(self, app, argv, code=1, **kwargs):
+        """Invoke and assert the expected nonzero exit."""
+        result = self.invoke(app, argv, **kwargs)
+        assert result.exit_code == code, result.output
+        return result
+
+
+# Frozen dataclass instances are immutable and only ever fed to mocked
+# return values, so build them once at module scope instead of per test.
+DOC = Document(id="doc123", title="Test Doc")
+DOC_WITH_REVISION = Document(id="doc123", title="Test Doc", revision_id="rev1")
+SUMMARIES = [DocumentSummary(id="doc1", title="Doc 1"), DocumentSummary(id="doc2", title="Doc 2")]
+SEARCH_RESULTS = [
+    DocumentSummary(id="doc1", title="Test Doc 1"),
+    DocumentSummary(id="doc2", title="Test Doc 2"),
+]
+DRIVES = [
+    SharedDrive(id="drive1", name="Team Drive 1"),
+    SharedDrive(id="drive2", name="Team Drive 2"),
+]
+FOLDERS = [Folder(id="folder1", name="Folder 1"), Folder(id="folder2", name="Folder 2")]
+
+
+def _cell(text):
+    """Build one table cell wrapping a single text run."""
+    return {"content": [{"paragraph": {"elements": [{"textRun": {"content": text}}]}}]}
+
+
+TABLE_DOC = {
+    "title": "Test Doc",
+    "body": {
+        "content": [
+            {
+                "table": {
+                    "tableRows": [
+                        {"tableCells": [_cell("A\n"), _cell("B\n")]},
+                        {"tableCells": [_cell("1\n"), _cell("2\n")]},
+                    ]
+                }
+            }
+        ]
+    },
+}
+
+
+def stub(monkeypatch, dotted, value):
+    """Replace a function with a constant-returning stand-in.
+
+    monkeypatch.setattr skips unittest.mock's dotted-path resolution and
+    MagicMock construction for the common "patch to a fixed return" case;
+    tests that assert on calls still use mocker.patch.
+    """
+    module_path, name = dotted.rsplit(".", 1)
+    module = importlib.import_module(module_path)
+
+    def replacement(*_args, **_kwargs):
+        return value
+
+    # some targets are lru_cache-wrapped and get cache_clear() poked after
+    # mutations; keep that a no-op on the stand-in
+    replacement.cache_clear = lambda: None
+    monkeypatch.setattr(module, name, replacement)
+
+
+@pytest.fixture(scope="module")
+def cli():
+    """Provide the Typer app and a shared runner, built once per module.
+
+    Importing the app inside the fixture keeps collection from paying the
+    CLI import cost when no test in this module runs.
+    """
+    from gdocs_cli.cli.main import app
+
+    return app, Runner()
+
+
+@pytest.fixture(autouse=True)
+def _authenticated(request, monkeypatch):
+    """Stub the auth gate once per test instead of per-test mocker.patch.
+
+    monkeypatch.setattr skips unittest.mock's dotted-path resolution and
+    MagicMock construction. Tests exercising the unauthenticated path opt
+    out with @pytest.mark.noauth.
+    """
+    if "noauth" in request.keywords:
+        return
+    from gdocs_cli.cli import auth
+
+    monkeypatch.setattr(auth, "is_authenticated", lambda *_args, **_kwargs: True)
+
+
+@pytest.fixture(scope="module")
+def help_text(cli):
+    """Render every command group's --help once per module.
+
+    The Click help formatter rewalks all parameters and rewraps text per
+    call; tests only need substring checks against the cached output.
+    """
+    app, runner = cli
+    rendered = {}
+    for group in (None, "auth", "doc", "content", "table", "drives"):
+        argv = ["--help"] if group is None else [group, "--help"]
+        result = runner.ok(app, argv)
+        rendered[group] = result.output
+    return rendered
+
+
+class TestHelpScreens:
+    """Parametrized --help coverage for every command group."""
+
+    @pytest.mark.parametrize(
+        ("group", "needles"),
+        [
+            (None, ("command-line interface for Google Docs",)),
+            ("auth", ("login", "logout", "status")),
+            ("doc", ("create", "list")),
+            ("content", ("insert", "append")),
+            ("table", ("create",)),
+            ("drives", ("list", "folders")),
+        ],
+        ids=["main", "auth", "doc", "content", "table", "drives"],
+    )
+    def test_help(self, help_text, group, needles):
+        """Test each group's --help lists its commands."""
+        for needle in needles:
+            assert needle in help_text[group]
+
+
+class TestEmptyListings:
+    """Parametrized empty-result handling for every listing command."""
+
+    @pytest.mark.parametrize(
+        ("target", "ret", "argv", "message"),
+        [
+            ("document.list_documents", [], ["doc", "list"], "No documents found"),
+            ("document.search_documents", [], ["doc", "search", "x"], "No documents found"),
+            (
+                "document.list_permissions",
+                [],
+                ["doc", "permissions", "doc123"],
+                "No permissions found",
+            ),
+            ("document.list_revisions", [], ["doc", "revisions", "doc123"], "No revisions found"),
+            (
+                "table.get_document_structure",
+                {"body": {"content": []}},
+                ["table", "list", "doc123"],
+                "No tables found",
+            ),
+            ("drives.list_shared_drives", [], ["drives", "list"], "No Shared Drives found"),
+            ("drives.list_folders", [], ["drives", "folders"], "No folders found"),
+        ],
+        ids=["doc-list", "doc-search", "permissions", "revisions", "tables", "drives", "folders"],
+    )
+    def test_empty(self, cli, monkeypatch, target, ret, argv, message):
+        """Test listing commands report an empty result cleanly."""
+        app, runner = cli
+        stub(monkeypatch, f"gdocs_cli.cli.{target}", ret)
+
+        result = runner.ok(app, argv)
+
+        assert message in result.output
 
 
 class TestMainCli:
     """Tests for main CLI."""
 
-    def test_version(self):
+    def test_version(self, cli):
         """Test --version flag."""
-        result = runner.invoke(app, ["--version"])
-        assert result.exit_code == 0
+        app, runner = cli
+        result = runner.ok(app, ["--version"])
         assert "gdocs-cli version" in result.output
 
-    def test_help(self):
-        """Test --help flag."""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "command-line interface for Google Docs" in result.output
-
-    def test_no_args(self):
+    def test_no_args(self, cli):
         """Test CLI with no args shows help."""
+        app, runner = cli
         result = runner.invoke(app, [])
         # Typer shows help and exits with 0 for no_args_is_help=True
         assert "Usage:" in result.output
@@ -33,266 +202,216 @@ class TestMainCli:
 class TestAuthCli:
     """Tests for auth CLI commands."""
 
-    def test_auth_help(self):
-        """Test auth --help."""
-        result = runner.invoke(app, ["auth", "--help"])
-        assert result.exit_code == 0
-        assert "login" in result.output
-        assert "logout" in result.output
-        assert "status" in result.output
-
-    def test_auth_status_not_authenticated(self, mocker):
+    def test_auth_status_not_authenticated(self, cli, monkeypatch):
         """Test auth status when not authenticated."""
-        mocker.patch("gdocs_cli.cli.auth.list_accounts", return_value=[])
-        mocker.patch("gdocs_cli.cli.auth.get_default_account", return_value=None)
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.auth.list_accounts", [])
+        stub(monkeypatch, "gdocs_cli.cli.auth.get_default_account", None)
 
-        result = runner.invoke(app, ["auth", "status"])
+        result = runner.fail(app, ["auth", "status"])
 
-        assert result.exit_code == 1
         assert "Not authenticated" in result.output
 
-    def test_auth_status_authenticated(self, mocker):
+    def test_auth_status_authenticated(self, cli, monkeypatch):
         """Test auth status when authenticated."""
-        mocker.patch(
-            "gdocs_cli.cli.auth.list_accounts",
-            return_value=["user@example.com"],
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.auth.list_accounts", ["user@example.com"])
+        stub(monkeypatch, "gdocs_cli.cli.auth.get_default_account", "user@example.com")
+        stub(
+            monkeypatch,
+            "gdocs_cli.cli.auth.get_token_expiries",
+            {"user@example.com": "2024-01-15 12:00:00"},
         )
-        mocker.patch(
-            "gdocs_cli.cli.auth.get_default_account",
-            return_value="user@example.com",
-        )
-        mocker.patch("gdocs_cli.cli.auth.get_token_expiry", return_value="2024-01-15 12:00:00")
 
-        result = runner.invoke(app, ["auth", "status"])
+        result = runner.ok(app, ["auth", "status"])
 
-        assert result.exit_code == 0
         assert "user@example.com" in result.output
 
-    def test_auth_logout_success(self, mocker):
+    def test_auth_logout_success(self, cli, monkeypatch):
         """Test auth logout."""
-        mocker.patch("gdocs_cli.cli.auth.logout", return_value=["user@example.com"])
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.auth.logout", ["user@example.com"])
 
-        result = runner.invoke(app, ["auth", "logout", "--account", "user@example.com"])
+        result = runner.ok(app, ["auth", "logout", "--account", "user@example.com"])
 
-        assert result.exit_code == 0
         assert "user@example.com" in result.output
 
-    def test_auth_set_default(self, mocker):
+    def test_auth_set_default(self, cli, monkeypatch):
         """Test auth set-default."""
-        mocker.patch(
-            "gdocs_cli.cli.auth.list_accounts",
-            return_value=["user@example.com"],
-        )
-        mocker.patch("gdocs_cli.cli.auth.set_default_account")
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.auth.list_accounts", ["user@example.com"])
+        stub(monkeypatch, "gdocs_cli.cli.auth.set_default_account", None)
 
-        result = runner.invoke(app, ["auth", "set-default", "user@example.com"])
+        result = runner.ok(app, ["auth", "set-default", "user@example.com"])
 
-        assert result.exit_code == 0
         assert "Default account set" in result.output
 
-    def test_auth_set_default_not_found(self, mocker):
+    def test_auth_set_default_not_found(self, cli, monkeypatch):
         """Test auth set-default with non-existent account."""
-        mocker.patch("gdocs_cli.cli.auth.list_accounts", return_value=[])
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.auth.list_accounts", [])
 
-        result = runner.invoke(app, ["auth", "set-default", "notfound@example.com"])
+        result = runner.fail(app, ["auth", "set-default", "notfound@example.com"])
 
-        assert result.exit_code == 1
         assert "not found" in result.output
 
 
 class TestDocumentCli:
     """Tests for document CLI commands."""
 
-    def test_doc_help(self):
-        """Test doc --help."""
-        result = runner.invoke(app, ["doc", "--help"])
-        assert result.exit_code == 0
-        assert "create" in result.output
-        assert "list" in result.output
-
-    def test_doc_create_not_authenticated(self, mocker):
+    @pytest.mark.noauth
+    def test_doc_create_not_authenticated(self, cli, monkeypatch):
         """Test doc create when not authenticated."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=False)
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.auth.is_authenticated", False)
 
-        result = runner.invoke(app, ["doc", "create", "Test Doc"])
+        result = runner.fail(app, ["doc", "create", "Test Doc"])
 
-        assert result.exit_code == 1
         assert "Not authenticated" in result.output
 
-    def test_doc_create_success(self, mocker):
+    def test_doc_create_success(self, cli, monkeypatch):
         """Test doc create success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.document.create_document",
-            return_value=Document(id="doc123", title="Test Doc"),
-        )
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.document.create_document", DOC)
 
-        result = runner.invoke(app, ["doc", "create", "Test Doc"])
+        result = runner.ok(app, ["doc", "create", "Test Doc"])
 
-        assert result.exit_code == 0
         assert "Created" in result.output
         assert "doc123" in result.output
 
-    def test_doc_get_success(self, mocker):
+    def test_doc_get_success(self, cli, monkeypatch):
         """Test doc get success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.document.get_document",
-            return_value=Document(id="doc123", title="Test Doc", revision_id="rev1"),
-        )
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.document.get_document", DOC_WITH_REVISION)
 
-        result = runner.invoke(app, ["doc", "get", "doc123"])
+        result = runner.ok(app, ["doc", "get", "doc123"])
 
-        assert result.exit_code == 0
         assert "Test Doc" in result.output
 
-    def test_doc_list_success(self, mocker):
+    def test_doc_list_success(self, cli, monkeypatch):
         """Test doc list success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.document.list_documents",
-            return_value=[
-                DocumentSummary(id="doc1", title="Doc 1"),
-                DocumentSummary(id="doc2", title="Doc 2"),
-            ],
-        )
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.document.list_documents", SUMMARIES)
 
-        result = runner.invoke(app, ["doc", "list"])
+        result = runner.ok(app, ["doc", "list"])
 
-        assert result.exit_code == 0
         assert "Doc 1" in result.output or "Documents" in result.output
 
-    def test_doc_list_empty(self, mocker):
-        """Test doc list with no documents."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.document.list_documents", return_value=[])
-
-        result = runner.invoke(app, ["doc", "list"])
-
-        assert result.exit_code == 0
-        assert "No documents found" in result.output
-
-    def test_doc_delete_confirmed(self, mocker):
+    def test_doc_delete_confirmed(self, cli, monkeypatch):
         """Test doc delete with confirmation."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.document.delete_document")
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.document.delete_document", None)
 
-        result = runner.invoke(app, ["doc", "delete", "doc123", "--force"])
+        result = runner.ok(app, ["doc", "delete", "doc123", "--force"])
 
-        assert result.exit_code == 0
         assert "Deleted" in result.output
 
-    def test_doc_delete_aborted(self, mocker):
+    def test_doc_delete_aborted(self, cli):
         """Test doc delete aborted."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
+        app, runner = cli
+
+        runner.fail(app, ["doc", "delete", "doc123"], input="n\n")
+
+    def test_doc_info_success(self, cli, monkeypatch):
+        """Test doc info combines document, permissions, and revisions."""
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.document.get_document", DOC)
+        stub(
+            monkeypatch,
+            "gdocs_cli.cli.document.list_permissions_and_revisions",
+            ([{"id": "perm1", "role": "owner"}], [{"id": "1"}, {"id": "2"}]),
+        )
 
-        result = runner.invoke(app, ["doc", "delete", "doc123"], input="n\n")
+        result = runner.ok(app, ["doc", "info", "doc123"])
 
-        assert result.exit_code == 1
+        assert "Test Doc" in result.output
+        assert "Permissions: 1" in result.output
+        assert "Revisions: 2" in result.output
 
-    def test_doc_move_success(self, mocker):
+    def test_doc_move_success(self, cli, monkeypatch):
         """Test doc move success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.document.move_document")
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.document.move_document", None)
 
-        result = runner.invoke(app, ["doc", "move", "doc123", "--folder", "folder456"])
+        result = runner.ok(app, ["doc", "move", "doc123", "--folder", "folder456"])
 
-        assert result.exit_code == 0
         assert "Moved" in result.output
 
 
 class TestContentCli:
     """Tests for content CLI commands."""
 
-    def test_content_help(self):
-        """Test content --help."""
-        result = runner.invoke(app, ["content", "--help"])
-        assert result.exit_code == 0
-        assert "insert" in result.output
-        assert "append" in result.output
-
-    def test_content_insert_success(self, mocker):
+    def test_content_insert_success(self, cli, monkeypatch):
         """Test content insert success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.content.batch_update", return_value={})
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.content.batch_update", {})
 
-        result = runner.invoke(app, ["content", "insert", "doc123", "Hello World"])
+        result = runner.ok(app, ["content", "insert", "doc123", "Hello World"])
 
-        assert result.exit_code == 0
         assert "Inserted" in result.output
 
-    def test_content_insert_with_heading(self, mocker):
+    def test_content_insert_with_heading(self, cli, monkeypatch):
         """Test content insert with heading."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.content.batch_update", return_value={})
-
-        result = runner.invoke(
-            app, ["content", "insert", "doc123", "Title", "--heading", "HEADING_1"]
-        )
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.content.batch_update", {})
 
-        assert result.exit_code == 0
+        runner.ok(app, ["content", "insert", "doc123", "Title", "--heading", "HEADING_1"])
 
-    def test_content_insert_invalid_heading(self, mocker):
+    def test_content_insert_invalid_heading(self, capsys):
         """Test content insert with invalid heading."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
+        from gdocs_cli.cli.content import insert_command
 
-        result = runner.invoke(
-            app, ["content", "insert", "doc123", "Title", "--heading", "INVALID"]
-        )
+        # Call the command function directly: the validation branch needs
+        # no Click argument parsing or output isolation.
+        with pytest.raises(typer.Exit) as exc_info:
+            insert_command("doc123", "Title", heading="INVALID")
 
-        assert result.exit_code == 1
-        assert "Invalid heading" in result.output
+        assert exc_info.value.exit_code == 1
+        assert "Invalid heading" in capsys.readouterr().err
 
-    def test_content_append_success(self, mocker):
+    def test_content_append_success(self, cli, monkeypatch):
         """Test content append success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.content.batch_update", return_value={})
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.content.batch_update", {})
 
-        result = runner.invoke(app, ["content", "append", "doc123", "More text"])
+        result = runner.ok(app, ["content", "append", "doc123", "More text"])
 
-        assert result.exit_code == 0
         assert "Appended" in result.output
 
-    def test_content_replace_success(self, mocker):
+    def test_content_replace_success(self, cli, monkeypatch):
         """Test content replace success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
+        app, runner = cli
+        stub(
+            monkeypatch,
             "gdocs_cli.cli.content.batch_update",
-            return_value={"replies": [{"replaceAllText": {"occurrencesChanged": 3}}]},
+            {"replies": [{"replaceAllText": {"occurrencesChanged": 3}}]},
         )
 
-        result = runner.invoke(app, ["content", "replace", "doc123", "old", "new"])
+        result = runner.ok(app, ["content", "replace", "doc123", "old", "new"])
 
-        assert result.exit_code == 0
         assert "Replaced" in result.output
 
 
 class TestTableCli:
     """Tests for table CLI commands."""
 
-    def test_table_help(self):
-        """Test table --help."""
-        result = runner.invoke(app, ["table", "--help"])
-        assert result.exit_code == 0
-        assert "create" in result.output
-
-    def test_table_create_success(self, mocker):
+    def test_table_create_success(self, cli, monkeypatch):
         """Test table create success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.table.batch_update", return_value={})
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.table.batch_update", {})
 
-        result = runner.invoke(app, ["table", "create", "doc123", "--rows", "3", "--columns", "4"])
+        result = runner.ok(app, ["table", "create", "doc123", "--rows", "3", "--columns", "4"])
 
-        assert result.exit_code == 0
         assert "Created" in result.output
         assert "3x4" in result.output
 
-    def test_table_list_success(self, mocker):
+    def test_table_list_success(self, cli, monkeypatch):
         """Test table list success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.table.get_document_content",
-            return_value={
+        app, runner = cli
+        stub(
+            monkeypatch,
+            "gdocs_cli.cli.table.get_document_structure",
+            {
                 "body": {
                     "content": [
                         {
@@ -305,170 +424,143 @@ class TestTableCli:
             },
         )
 
-        result = runner.invoke(app, ["table", "list", "doc123"])
+        runner.ok(app, ["table", "list", "doc123"])
 
-        assert result.exit_code == 0
+    def test_table_batch_queue_and_end(self, cli, mocker, monkeypatch, tmp_path):
+        """Test table edits are queued in a batch and submitted on batch end."""
+        app, runner = cli
+        mock_update = mocker.patch("gdocs_cli.cli.table.batch_update", return_value={})
+        monkeypatch.setattr("gdocs_cli.cli.table._BATCH_DIR", tmp_path)
+        monkeypatch.setenv("GDOCS_BATCH_ID", "batch1")
 
-    def test_table_list_empty(self, mocker):
-        """Test table list with no tables."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.table.get_document_content",
-            return_value={"body": {"content": []}},
-        )
+        result = runner.ok(app, ["table", "create", "doc123"])
 
-        result = runner.invoke(app, ["table", "list", "doc123"])
+        assert "Queued" in result.output
+        mock_update.assert_not_called()
 
-        assert result.exit_code == 0
-        assert "No tables found" in result.output
+        monkeypatch.delenv("GDOCS_BATCH_ID")
+        result = runner.ok(app, ["table", "batch", "end", "batch1"])
 
+        assert "Submitted 1 request(s)" in result.output
+        mock_update.assert_called_once()
 
-class TestDrivesCli:
-    """Tests for drives CLI commands."""
+    def test_table_batch_rejects_second_document(self, cli, mocker, monkeypatch, tmp_path):
+        """Test a batch refuses edits for a document other than its first."""
+        app, runner = cli
+        mocker.patch("gdocs_cli.cli.table.batch_update", return_value={})
+        monkeypatch.setattr("gdocs_cli.cli.table._BATCH_DIR", tmp_path)
+        monkeypatch.setenv("GDOCS_BATCH_ID", "batch1")
 
-    def test_drives_help(self):
-        """Test drives --help."""
-        result = runner.invoke(app, ["drives", "--help"])
-        assert result.exit_code == 0
-        assert "list" in result.output
-        assert "folders" in result.output
+        runner.ok(app, ["table", "create", "doc123"])
+        result = runner.fail(app, ["table", "create", "other456"])
 
-    def test_drives_list_success(self, mocker):
-        """Test drives list success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.drives.list_shared_drives",
-            return_value=[
-                SharedDrive(id="drive1", name="Team Drive 1"),
-                SharedDrive(id="drive2", name="Team Drive 2"),
-            ],
-        )
+        assert "doc123" in result.output
 
-        result = runner.invoke(app, ["drives", "list"])
+    def test_table_batch_end_corrupt_queue(self, cli, monkeypatch, tmp_path):
+        """Test batch end reports a corrupt queue file instead of crashing."""
+        app, runner = cli
+        monkeypatch.setattr("gdocs_cli.cli.table._BATCH_DIR", tmp_path)
+        (tmp_path / "batch1.json").write_bytes(b"{not json")
 
-        assert result.exit_code == 0
-        assert "Team Drive" in result.output or "Shared Drives" in result.output
+        result = runner.fail(app, ["table", "batch", "end", "batch1"])
 
-    def test_drives_list_empty(self, mocker):
-        """Test drives list with no drives."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.drives.list_shared_drives", return_value=[])
+        assert "unreadable" in result.output
 
-        result = runner.invoke(app, ["drives", "list"])
+    def test_table_batch_end_not_found(self, cli, monkeypatch, tmp_path):
+        """Test batch end with unknown batch ID."""
+        app, runner = cli
+        monkeypatch.setattr("gdocs_cli.cli.table._BATCH_DIR", tmp_path)
 
-        assert result.exit_code == 0
-        assert "No Shared Drives found" in result.output
+        runner.fail(app, ["table", "batch", "end", "missing"])
 
-    def test_drives_folders_success(self, mocker):
-        """Test drives folders success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.drives.list_folders",
-            return_value=[
-                Folder(id="folder1", name="Folder 1"),
-                Folder(id="folder2", name="Folder 2"),
-            ],
-        )
 
-        result = runner.invoke(app, ["drives", "folders", "drive123"])
+class TestDrivesCli:
+    """Tests for drives CLI commands."""
 
-        assert result.exit_code == 0
+    def test_drives_list_success(self, cli, monkeypatch):
+        """Test drives list success."""
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.drives.list_shared_drives", DRIVES)
 
-    def test_drives_folders_empty(self, mocker):
-        """Test drives folders with no folders."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.drives.list_folders", return_value=[])
+        result = runner.ok(app, ["drives", "list"])
+
+        assert "Team Drive" in result.output or "Shared Drives" in result.output
 
-        result = runner.invoke(app, ["drives", "folders"])
+    def test_drives_folders_success(self, cli, monkeypatch):
+        """Test drives folders success."""
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.drives.list_folders", FOLDERS)
 
-        assert result.exit_code == 0
-        assert "No folders found" in result.output
+        runner.ok(app, ["drives", "folders", "drive123"])
 
 
 class TestJsonOutput:
     """Tests for JSON output mode."""
 
-    def test_doc_list_json(self, mocker):
-        """Test doc list with --json flag."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.document.list_documents",
-            return_value=[DocumentSummary(id="doc1", title="Doc 1")],
-        )
-
-        result = runner.invoke(app, ["--json", "doc", "list"])
-
-        assert result.exit_code == 0
-        assert '"documents"' in result.output
-
-    def test_doc_create_json(self, mocker):
-        """Test doc create with --json flag."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.document.create_document",
-            return_value=Document(id="doc123", title="Test Doc"),
-        )
-
-        result = runner.invoke(app, ["--json", "doc", "create", "Test Doc"])
-
-        assert result.exit_code == 0
-        assert '"id"' in result.output
-        assert "doc123" in result.output
+    @pytest.mark.parametrize(
+        ("target", "ret", "argv", "needles"),
+        [
+            (
+                "document.list_documents",
+                SUMMARIES[:1],
+                ["--json", "doc", "list"],
+                ('"documents"',),
+            ),
+            (
+                "document.create_document",
+                DOC,
+                ["--json", "doc", "create", "Test Doc"],
+                ('"id"', "doc123"),
+            ),
+            (
+                "document.search_documents",
+                SEARCH_RESULTS[:1],
+                ["--json", "doc", "search", "Test"],
+                ('"query"', '"documents"'),
+            ),
+            (
+                "document.list_revisions",
+                [{"id": "1", "modifiedTime": "2024-01-01T12:00:00Z"}],
+                ["--json", "doc", "revisions", "doc123"],
+                ('"revisions"',),
+            ),
+        ],
+        ids=["list", "create", "search", "revisions"],
+    )
+    def test_json_outputs(self, cli, monkeypatch, target, ret, argv, needles):
+        """Test each doc subcommand emits its JSON envelope under --json."""
+        app, runner = cli
+        stub(monkeypatch, f"gdocs_cli.cli.{target}", ret)
+
+        result = runner.ok(app, argv)
+
+        for needle in needles:
+            assert needle in result.output
 
 
 class TestSearchCli:
     """Tests for search CLI command."""
 
-    def test_doc_search_success(self, mocker):
+    def test_doc_search_success(self, cli, monkeypatch):
         """Test doc search success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.document.search_documents",
-            return_value=[
-                DocumentSummary(id="doc1", title="Test Doc 1"),
-                DocumentSummary(id="doc2", title="Test Doc 2"),
-            ],
-        )
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.document.search_documents", SEARCH_RESULTS)
 
-        result = runner.invoke(app, ["doc", "search", "Test"])
+        result = runner.ok(app, ["doc", "search", "Test"])
 
-        assert result.exit_code == 0
         assert "Test Doc" in result.output or "Search" in result.output
 
-    def test_doc_search_empty(self, mocker):
-        """Test doc search with no results."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.document.search_documents", return_value=[])
-
-        result = runner.invoke(app, ["doc", "search", "nonexistent"])
-
-        assert result.exit_code == 0
-        assert "No documents found" in result.output
-
-    def test_doc_search_json(self, mocker):
-        """Test doc search with --json flag."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.document.search_documents",
-            return_value=[DocumentSummary(id="doc1", title="Test")],
-        )
-
-        result = runner.invoke(app, ["--json", "doc", "search", "Test"])
-
-        assert result.exit_code == 0
-        assert '"query"' in result.output
-        assert '"documents"' in result.output
-
 
 class TestSharingCli:
     """Tests for sharing CLI commands."""
 
-    def test_doc_permissions_success(self, mocker):
+    def test_doc_permissions_success(self, cli, monkeypatch):
         """Test doc permissions listing."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
+        app, runner = cli
+        stub(
+            monkeypatch,
             "gdocs_cli.cli.document.list_permissions",
-            return_value=[
+            [
                 {"id": "perm1", "type": "user", "role": "owner", "emailAddress": "owner@test.com"},
                 {
                     "id": "perm2",
@@ -479,67 +571,55 @@ class TestSharingCli:
             ],
         )
 
-        result = runner.invoke(app, ["doc", "permissions", "doc123"])
+        result = runner.ok(app, ["doc", "permissions", "doc123"])
 
-        assert result.exit_code == 0
         assert "Permissions" in result.output or "owner" in result.output
 
-    def test_doc_permissions_empty(self, mocker):
-        """Test doc permissions with no permissions."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.document.list_permissions", return_value=[])
-
-        result = runner.invoke(app, ["doc", "permissions", "doc123"])
-
-        assert result.exit_code == 0
-        assert "No permissions found" in result.output
-
-    def test_doc_share_success(self, mocker):
+    def test_doc_share_success(self, cli, monkeypatch):
         """Test doc share success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
+        app, runner = cli
+        stub(
+            monkeypatch,
             "gdocs_cli.cli.document.share_document",
-            return_value={"id": "perm123", "type": "user", "role": "reader"},
+            {"id": "perm123", "type": "user", "role": "reader"},
         )
 
-        result = runner.invoke(
+        result = runner.ok(
             app, ["doc", "share", "doc123", "--email", "user@test.com", "--role", "reader"]
         )
 
-        assert result.exit_code == 0
         assert "Shared" in result.output
 
-    def test_doc_share_invalid_role(self, mocker):
+    def test_doc_share_invalid_role(self, capsys):
         """Test doc share with invalid role."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
+        from gdocs_cli.cli.document import share_command
 
-        result = runner.invoke(
-            app, ["doc", "share", "doc123", "--email", "user@test.com", "--role", "invalid"]
-        )
+        with pytest.raises(typer.Exit) as exc_info:
+            share_command("doc123", email="user@test.com", role="invalid")
 
-        assert result.exit_code == 1
-        assert "Invalid role" in result.output
+        assert exc_info.value.exit_code == 1
+        assert "Invalid role" in capsys.readouterr().err
 
-    def test_doc_unshare_success(self, mocker):
+    def test_doc_unshare_success(self, cli, monkeypatch):
         """Test doc unshare success."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.document.unshare_document")
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.document.unshare_document", None)
 
-        result = runner.invoke(app, ["doc", "unshare", "doc123", "--permission", "perm123"])
+        result = runner.ok(app, ["doc", "unshare", "doc123", "--permission", "perm123"])
 
-        assert result.exit_code == 0
         assert "Removed" in result.output
 
 
 class TestRevisionsCli:
     """Tests for revisions CLI command."""
 
-    def test_doc_revisions_success(self, mocker):
+    def test_doc_revisions_success(self, cli, monkeypatch):
         """Test doc revisions listing."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
+        app, runner = cli
+        stub(
+            monkeypatch,
             "gdocs_cli.cli.document.list_revisions",
-            return_value=[
+            [
                 {
                     "id": "1",
                     "modifiedTime": "2024-01-01T12:00:00Z",
@@ -553,44 +633,21 @@ class TestRevisionsCli:
             ],
         )
 
-        result = runner.invoke(app, ["doc", "revisions", "doc123"])
+        result = runner.ok(app, ["doc", "revisions", "doc123"])
 
-        assert result.exit_code == 0
         assert "Revisions" in result.output
 
-    def test_doc_revisions_empty(self, mocker):
-        """Test doc revisions with no revisions."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch("gdocs_cli.cli.document.list_revisions", return_value=[])
-
-        result = runner.invoke(app, ["doc", "revisions", "doc123"])
-
-        assert result.exit_code == 0
-        assert "No revisions found" in result.output
-
-    def test_doc_revisions_json(self, mocker):
-        """Test doc revisions with --json flag."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.document.list_revisions",
-            return_value=[{"id": "1", "modifiedTime": "2024-01-01T12:00:00Z"}],
-        )
-
-        result = runner.invoke(app, ["--json", "doc", "revisions", "doc123"])
-
-        assert result.exit_code == 0
-        assert '"revisions"' in result.output
-
 
 class TestContentReadCli:
     """Tests for content read CLI command."""
 
-    def test_content_read_markdown(self, mocker):
+    def test_content_read_markdown(self, cli, monkeypatch):
         """Test content read as markdown."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
+        app, runner = cli
+        stub(
+            monkeypatch,
             "gdocs_cli.cli.content.get_document_content",
-            return_value={
+            {
                 "title": "Test Doc",
                 "body": {
                     "content": [
@@ -605,18 +662,18 @@ class TestContentReadCli:
             },
         )
 
-        result = runner.invoke(app, ["content", "read", "doc123"])
+        result = runner.ok(app, ["content", "read", "doc123"])
 
-        assert result.exit_code == 0
         assert "Test Doc" in result.output
         assert "Hello World" in result.output
 
-    def test_content_read_plain(self, mocker):
+    def test_content_read_plain(self, cli, monkeypatch):
         """Test content read as plain text."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
+        app, runner = cli
+        stub(
+            monkeypatch,
             "gdocs_cli.cli.content.get_document_content",
-            return_value={
+            {
                 "title": "Test Doc",
                 "body": {
                     "content": [
@@ -630,98 +687,29 @@ class TestContentReadCli:
             },
         )
 
-        result = runner.invoke(app, ["content", "read", "doc123", "--plain"])
+        result = runner.ok(app, ["content", "read", "doc123", "--plain"])
 
-        assert result.exit_code == 0
         assert "Plain text" in result.output
 
-    def test_content_read_raw_json(self, mocker):
+    def test_content_read_raw_json(self, cli, monkeypatch):
         """Test content read as raw JSON."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
+        app, runner = cli
+        stub(
+            monkeypatch,
             "gdocs_cli.cli.content.get_document_content",
-            return_value={"title": "Test", "body": {"content": []}},
+            {"title": "Test", "body": {"content": []}},
         )
 
-        result = runner.invoke(app, ["content", "read", "doc123", "--raw"])
+        result = runner.ok(app, ["content", "read", "doc123", "--raw"])
 
-        assert result.exit_code == 0
         assert '"title"' in result.output
 
-    def test_content_read_with_table(self, mocker):
+    def test_content_read_with_table(self, cli, monkeypatch):
         """Test content read with table in document."""
-        mocker.patch("gdocs_cli.cli.auth.is_authenticated", return_value=True)
-        mocker.patch(
-            "gdocs_cli.cli.content.get_document_content",
-            return_value={
-                "title": "Test Doc",
-                "body": {
-                    "content": [
-                        {
-                            "table": {
-                                "tableRows": [
-                                    {
-                                        "tableCells": [
-                                            {
-                                                "content": [
-                                                    {
-                                                        "paragraph": {
-                                                            "elements": [
-                                                                {"textRun": {"content": "A\n"}}
-                                                            ]
-                                                        }
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                "content": [
-                                                    {
-                                                        "paragraph": {
-                                                            "elements": [
-                                                                {"textRun": {"content": "B\n"}}
-                                                            ]
-                                                        }
-                                                    }
-                                                ]
-                                            },
-                                        ]
-                                    },
-                                    {
-                                        "tableCells": [
-                                            {
-                                                "content": [
-                                                    {
-                                                        "paragraph": {
-                                                            "elements": [
-                                                                {"textRun": {"content": "1\n"}}
-                                                            ]
-                                                        }
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                "content": [
-                                                    {
-                                                        "paragraph": {
-                                                            "elements": [
-                                                                {"textRun": {"content": "2\n"}}
-                                                            ]
-                                                        }
-                                                    }
-                                                ]
-                                            },
-                                        ]
-                                    },
-                                ]
-                            }
-                        }
-                    ]
-                },
-            },
-        )
+        app, runner = cli
+        stub(monkeypatch, "gdocs_cli.cli.content.get_document_content", TABLE_DOC)
 
-        result = runner.invoke(app, ["content", "read", "doc123"])
+        result = runner.ok(app, ["content", "read", "doc123"])
 
-        assert result.exit_code == 0
         assert "| A | B |" in result.output
         assert "| 1 | 2 |" in result.output
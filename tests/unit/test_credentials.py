@@ -1,20 +1,28 @@
 """Tests for credentials service."""
 
 import json
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
+import keyring
+import keyring.errors
+import pytest
+
 from gdocs_cli.services.credentials import (
     ACCOUNTS_LIST_KEY,
     DEFAULT_ACCOUNT_KEY,
-    SERVICE_NAME,
+    LEGACY_ACCOUNT_NAME,
     _add_to_accounts_list,
     _get_account_key,
     _remove_from_accounts_list,
+    cache_access_token,
     clear_all_accounts,
+    clear_cached_access_token,
     delete_credentials,
+    get_cached_access_token,
     get_default_account,
     get_raw_credentials_json,
+    get_token_expiries,
     has_credentials,
     list_accounts,
     load_credentials,
@@ -22,6 +30,49 @@ from gdocs_cli.services.credentials import (
     set_default_account,
 )
 
+# Fixed expiry reused by tests that need one; fromisoformat is the C fast
+# path and runs once at import instead of per test.
+_TEST_EXPIRY = datetime.fromisoformat("2024-01-01T12:00:00+00:00")
+
+
+class FakeKeyring:
+    """Stateful in-memory stand-in for the keyring backend.
+
+    One instance per test replaces the per-test mocker.patch churn on
+    get/set/delete_password. Tests seed `store` (keyed by entry name, the
+    service is constant) and assert on it afterwards; `set_calls` records
+    writes for the few tests where avoiding a write is the behavior under
+    test.
+    """
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.set_calls: list[tuple[str, str]] = []
+        self.deleted: list[str] = []
+
+    def get_password(self, _service: str, key: str) -> str | None:
+        return self.store.get(key)
+
+    def set_password(self, _service: str, key: str, value: str) -> None:
+        self.store[key] = value
+        self.set_calls.append((key, value))
+
+    def delete_password(self, _service: str, key: str) -> None:
+        if key not in self.store:
+            raise keyring.errors.PasswordDeleteError(key)
+        del self.store[key]
+        self.deleted.append(key)
+
+
+@pytest.fixture(autouse=True)
+def fake_keyring(mocker):
+    """Install a FakeKeyring in place of the real backend for each test."""
+    fake = FakeKeyring()
+    mocker.patch.object(keyring, "get_password", fake.get_password)
+    mocker.patch.object(keyring, "set_password", fake.set_password)
+    mocker.patch.object(keyring, "delete_password", fake.delete_password)
+    return fake
+
 
 class TestAccountKey:
     """Tests for _get_account_key."""
@@ -34,109 +85,84 @@ class TestAccountKey:
 class TestListAccounts:
     """Tests for list_accounts."""
 
-    def test_list_accounts_empty(self, mocker):
+    def test_list_accounts_empty(self):
         """Test listing accounts when none exist."""
-        mocker.patch("gdocs_cli.services.credentials.keyring.get_password", return_value=None)
         assert list_accounts() == []
 
-    def test_list_accounts_with_data(self, mocker):
+    def test_list_accounts_with_data(self, fake_keyring):
         """Test listing accounts with existing accounts."""
         accounts = ["user1@example.com", "user2@example.com"]
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps(accounts),
-        )
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(accounts)
+
         assert list_accounts() == accounts
 
-    def test_list_accounts_invalid_json(self, mocker):
+    def test_list_accounts_invalid_json(self, fake_keyring):
         """Test listing accounts with invalid JSON."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value="invalid json",
-        )
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = "invalid json"
+
         assert list_accounts() == []
 
 
 class TestDefaultAccount:
     """Tests for default account management."""
 
-    def test_get_default_account(self, mocker):
+    def test_get_default_account(self, fake_keyring):
         """Test getting default account."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value="default@example.com",
-        )
+        fake_keyring.store[DEFAULT_ACCOUNT_KEY] = "default@example.com"
+
         assert get_default_account() == "default@example.com"
 
-    def test_get_default_account_none(self, mocker):
+    def test_get_default_account_none(self):
         """Test getting default account when not set."""
-        mocker.patch("gdocs_cli.services.credentials.keyring.get_password", return_value=None)
         assert get_default_account() is None
 
-    def test_set_default_account(self, mocker):
+    def test_set_default_account(self, fake_keyring):
         """Test setting default account."""
-        mock_set = mocker.patch("gdocs_cli.services.credentials.keyring.set_password")
         set_default_account("new@example.com")
-        mock_set.assert_called_once_with(SERVICE_NAME, DEFAULT_ACCOUNT_KEY, "new@example.com")
+
+        assert fake_keyring.store[DEFAULT_ACCOUNT_KEY] == "new@example.com"
 
 
 class TestAccountsList:
     """Tests for accounts list management."""
 
-    def test_add_to_accounts_list_new(self, mocker):
+    def test_add_to_accounts_list_new(self, fake_keyring):
         """Test adding new account to list."""
-        mocker.patch("gdocs_cli.services.credentials.keyring.get_password", return_value=None)
-        mock_set = mocker.patch("gdocs_cli.services.credentials.keyring.set_password")
-
         _add_to_accounts_list("new@example.com")
 
-        mock_set.assert_called_once_with(
-            SERVICE_NAME, ACCOUNTS_LIST_KEY, json.dumps(["new@example.com"])
-        )
+        assert fake_keyring.store[ACCOUNTS_LIST_KEY] == json.dumps(["new@example.com"])
 
-    def test_add_to_accounts_list_existing(self, mocker):
+    def test_add_to_accounts_list_existing(self, fake_keyring):
         """Test adding account that already exists."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps(["existing@example.com"]),
-        )
-        mock_set = mocker.patch("gdocs_cli.services.credentials.keyring.set_password")
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(["existing@example.com"])
 
         _add_to_accounts_list("existing@example.com")
 
-        mock_set.assert_not_called()
+        assert fake_keyring.set_calls == []
 
-    def test_remove_from_accounts_list(self, mocker):
+    def test_remove_from_accounts_list(self, fake_keyring):
         """Test removing account from list."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps(["user1@example.com", "user2@example.com"]),
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(
+            ["user1@example.com", "user2@example.com"]
         )
-        mock_set = mocker.patch("gdocs_cli.services.credentials.keyring.set_password")
 
         _remove_from_accounts_list("user1@example.com")
 
-        mock_set.assert_called_once_with(
-            SERVICE_NAME, ACCOUNTS_LIST_KEY, json.dumps(["user2@example.com"])
-        )
+        assert fake_keyring.store[ACCOUNTS_LIST_KEY] == json.dumps(["user2@example.com"])
 
-    def test_remove_from_accounts_list_not_present(self, mocker):
+    def test_remove_from_accounts_list_not_present(self, fake_keyring):
         """Test removing account that doesn't exist."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps(["other@example.com"]),
-        )
-        mock_set = mocker.patch("gdocs_cli.services.credentials.keyring.set_password")
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(["other@example.com"])
 
         _remove_from_accounts_list("notpresent@example.com")
 
-        mock_set.assert_not_called()
+        assert fake_keyring.set_calls == []
 
 
 class TestSaveCredentials:
     """Tests for save_credentials."""
 
-    def test_save_credentials_with_account(self, mocker):
+    def test_save_credentials_with_account(self, fake_keyring):
         """Test saving credentials for specific account."""
         mock_creds = MagicMock()
         mock_creds.token = "test_token"
@@ -145,21 +171,15 @@ class TestSaveCredentials:
         mock_creds.client_id = "client_id"
         mock_creds.client_secret = "client_secret"
         mock_creds.scopes = ["scope1", "scope2"]
-        mock_creds.expiry = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
-
-        # Mock keyring and list_accounts
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=None,
-        )
-        mock_set = mocker.patch("gdocs_cli.services.credentials.keyring.set_password")
+        mock_creds.expiry = _TEST_EXPIRY
 
         save_credentials(mock_creds, account="user@example.com")
 
-        # Check that credentials were saved
-        assert mock_set.call_count >= 1
+        saved = json.loads(fake_keyring.store[_get_account_key("user@example.com")])
+        assert saved["token"] == "test_token"
+        assert saved["refresh_token"] == "test_refresh"
 
-    def test_save_credentials_first_account_sets_default(self, mocker):
+    def test_save_credentials_first_account_sets_default(self, fake_keyring):
         """Test that first account is set as default."""
         mock_creds = MagicMock()
         mock_creds.token = "test_token"
@@ -170,234 +190,223 @@ class TestSaveCredentials:
         mock_creds.scopes = []
         mock_creds.expiry = None
 
-        # Track state: start with no accounts, then after save there's one
-        accounts_state = {"accounts": [], "saved": False}
-
-        def get_password_side_effect(_service, key):
-            if key == ACCOUNTS_LIST_KEY:
-                if accounts_state["saved"]:
-                    return json.dumps(["user@example.com"])
-                return json.dumps(accounts_state["accounts"])
-            return None
+        save_credentials(mock_creds, account="user@example.com")
 
-        def set_password_side_effect(_service, key, value):
-            if key == ACCOUNTS_LIST_KEY:
-                accounts_state["accounts"] = json.loads(value)
-                accounts_state["saved"] = True
+        assert fake_keyring.store[ACCOUNTS_LIST_KEY] == json.dumps(["user@example.com"])
+        assert fake_keyring.store[DEFAULT_ACCOUNT_KEY] == "user@example.com"
 
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            side_effect=get_password_side_effect,
-        )
-        mock_set = mocker.patch(
-            "gdocs_cli.services.credentials.keyring.set_password",
-            side_effect=set_password_side_effect,
-        )
-
-        save_credentials(mock_creds, account="user@example.com")
 
-        # Verify set_default_account was called (DEFAULT_ACCOUNT_KEY)
-        calls = [call for call in mock_set.call_args_list if call[0][1] == DEFAULT_ACCOUNT_KEY]
-        assert len(calls) == 1
+# Canonical stored credential payload; variants below tweak single fields.
+_CREDS_DATA = {
+    "token": "test_token",
+    "refresh_token": "test_refresh",
+    "token_uri": "https://oauth2.googleapis.com/token",
+    "client_id": "client_id",
+    "client_secret": "client_secret",
+    "scopes": ["scope1"],
+    "expiry": "2024-01-01T12:00:00",
+}
 
 
 class TestLoadCredentials:
     """Tests for load_credentials."""
 
-    def test_load_credentials_not_found(self, mocker):
-        """Test loading credentials when not found."""
-        mocker.patch("gdocs_cli.services.credentials.keyring.get_password", return_value=None)
-        assert load_credentials(account="user@example.com") is None
-
-    def test_load_credentials_success(self, mocker):
-        """Test loading credentials successfully."""
-        creds_data = {
-            "token": "test_token",
-            "refresh_token": "test_refresh",
-            "token_uri": "https://oauth2.googleapis.com/token",
-            "client_id": "client_id",
-            "client_secret": "client_secret",
-            "scopes": ["scope1"],
-            "expiry": "2024-01-01T12:00:00",
-        }
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps(creds_data),
-        )
-
-        creds = load_credentials(account="user@example.com")
-
-        # Credentials object is returned (may be mock in Python 3.14 alpha)
-        assert creds is not None
-
-    def test_load_credentials_invalid_json(self, mocker):
-        """Test loading credentials with invalid JSON."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value="invalid json",
-        )
-        assert load_credentials(account="user@example.com") is None
-
-    def test_load_credentials_legacy_format(self, mocker):
-        """Test loading credentials from legacy format."""
-        creds_data = {
-            "token": "legacy_token",
-            "refresh_token": "legacy_refresh",
-            "token_uri": "https://oauth2.googleapis.com/token",
-            "client_id": "client_id",
-            "client_secret": "client_secret",
-            "scopes": [],
-            "expiry": None,
-        }
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps(creds_data),
-        )
-
-        creds = load_credentials(account=None)
-
-        # Credentials object is returned (may be mock in Python 3.14 alpha)
-        assert creds is not None
+    @pytest.mark.parametrize(
+        ("payload", "account", "expect_none"),
+        [
+            pytest.param(None, "user@example.com", True, id="not_found"),
+            pytest.param("invalid json", "user@example.com", True, id="invalid_json"),
+            pytest.param(json.dumps(_CREDS_DATA), "user@example.com", False, id="success"),
+            pytest.param(
+                json.dumps({**_CREDS_DATA, "scopes": [], "expiry": None}),
+                None,
+                False,
+                id="legacy_format",
+            ),
+        ],
+    )
+    def test_load_credentials(self, fake_keyring, payload, account, expect_none):
+        """Test loading credentials across stored payload variants."""
+        if payload is not None:
+            key = _get_account_key(account) if account else LEGACY_ACCOUNT_NAME
+            fake_keyring.store[key] = payload
+
+        creds = load_credentials(account=account)
+
+        # A Credentials object is returned whenever the payload parses
+        assert (creds is None) == expect_none
 
 
 class TestDeleteCredentials:
     """Tests for delete_credentials."""
 
-    def test_delete_credentials_with_account(self, mocker):
+    def test_delete_credentials_with_account(self, fake_keyring):
         """Test deleting credentials for specific account."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps(["user@example.com"]),
-        )
-        mock_delete = mocker.patch("gdocs_cli.services.credentials.keyring.delete_password")
-        mocker.patch("gdocs_cli.services.credentials.keyring.set_password")
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(["user@example.com"])
+        fake_keyring.store[_get_account_key("user@example.com")] = '{"token": "test"}'
 
         delete_credentials(account="user@example.com")
 
-        mock_delete.assert_called()
+        assert _get_account_key("user@example.com") not in fake_keyring.store
+        assert fake_keyring.store[ACCOUNTS_LIST_KEY] == json.dumps([])
 
-    def test_delete_credentials_updates_default(self, mocker):
+    def test_delete_credentials_updates_default(self, fake_keyring):
         """Test that deleting default account updates the default."""
-        call_count = 0
-
-        def get_password_side_effect(_service, key):
-            nonlocal call_count
-            call_count += 1
-            if key == ACCOUNTS_LIST_KEY:
-                if call_count <= 2:
-                    return json.dumps(["user1@example.com", "user2@example.com"])
-                return json.dumps(["user2@example.com"])
-            if key == DEFAULT_ACCOUNT_KEY:
-                return "user1@example.com"
-            return None
-
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            side_effect=get_password_side_effect,
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(
+            ["user1@example.com", "user2@example.com"]
         )
-        mocker.patch("gdocs_cli.services.credentials.keyring.delete_password")
-        mock_set = mocker.patch("gdocs_cli.services.credentials.keyring.set_password")
+        fake_keyring.store[DEFAULT_ACCOUNT_KEY] = "user1@example.com"
+        fake_keyring.store[_get_account_key("user1@example.com")] = '{"token": "test"}'
 
         delete_credentials(account="user1@example.com")
 
-        # Should set new default
-        default_calls = [c for c in mock_set.call_args_list if c[0][1] == DEFAULT_ACCOUNT_KEY]
-        assert len(default_calls) == 1
+        assert fake_keyring.store[DEFAULT_ACCOUNT_KEY] == "user2@example.com"
 
-    def test_delete_credentials_not_found(self, mocker):
+    def test_delete_credentials_not_found(self):
         """Test deleting credentials that don't exist."""
-        import keyring.errors
-
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps([]),
-        )
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.delete_password",
-            side_effect=keyring.errors.PasswordDeleteError(),
-        )
-
-        # Should not raise
+        # Should not raise; the missing entry raises PasswordDeleteError
+        # internally and delete_credentials swallows it.
         delete_credentials(account="nonexistent@example.com")
 
 
 class TestHasCredentials:
     """Tests for has_credentials."""
 
-    def test_has_credentials_true(self, mocker):
+    def test_has_credentials_true(self, fake_keyring):
         """Test has_credentials returns True when credentials exist."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value='{"token": "test"}',
-        )
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(["user@example.com"])
+        fake_keyring.store[_get_account_key("user@example.com")] = '{"token": "test"}'
+
         assert has_credentials(account="user@example.com") is True
 
-    def test_has_credentials_false(self, mocker):
+    def test_has_credentials_unlisted_account_skips_keyring(self, fake_keyring):
+        """Test an account missing from the accounts list short-circuits."""
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(["other@example.com"])
+
+        assert has_credentials(account="user@example.com") is False
+
+    def test_has_credentials_false(self):
         """Test has_credentials returns False when no credentials."""
-        mocker.patch("gdocs_cli.services.credentials.keyring.get_password", return_value=None)
         assert has_credentials(account="user@example.com") is False
 
-    def test_has_credentials_legacy(self, mocker):
+    def test_has_credentials_legacy(self, fake_keyring):
         """Test has_credentials for legacy format."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value='{"token": "legacy"}',
-        )
+        fake_keyring.store[LEGACY_ACCOUNT_NAME] = '{"token": "legacy"}'
+
         assert has_credentials(account=None) is True
 
 
+class TestGetTokenExpiries:
+    """Tests for get_token_expiries."""
+
+    def test_get_token_expiries(self, fake_keyring):
+        """Test batch expiry lookup."""
+        creds_data = {"token": "test", "expiry": "2024-01-01T12:00:00"}
+        fake_keyring.store[_get_account_key("user@example.com")] = json.dumps(creds_data)
+
+        result = get_token_expiries(["user@example.com"])
+
+        assert result == {"user@example.com": "2024-01-01 12:00:00"}
+
+    def test_get_token_expiries_missing_credentials(self):
+        """Test batch expiry lookup for account without credentials."""
+        result = get_token_expiries(["user@example.com"])
+
+        assert result == {"user@example.com": None}
+
+    def test_get_token_expiries_no_expiry(self, fake_keyring):
+        """Test batch expiry lookup when expiry is not set."""
+        fake_keyring.store[_get_account_key("user@example.com")] = json.dumps(
+            {"token": "test", "expiry": None}
+        )
+
+        result = get_token_expiries(["user@example.com"])
+
+        assert result == {"user@example.com": None}
+
+
 class TestGetRawCredentialsJson:
     """Tests for get_raw_credentials_json."""
 
-    def test_get_raw_credentials_json(self, mocker):
+    def test_get_raw_credentials_json(self, fake_keyring):
         """Test getting raw credentials JSON."""
         raw_json = '{"token": "test", "refresh_token": "refresh"}'
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=raw_json,
-        )
+        fake_keyring.store[_get_account_key("user@example.com")] = raw_json
 
         result = get_raw_credentials_json("user@example.com")
 
         assert result == raw_json
 
-    def test_get_raw_credentials_json_not_found(self, mocker):
+    def test_get_raw_credentials_json_not_found(self):
         """Test getting raw credentials when not found."""
-        mocker.patch("gdocs_cli.services.credentials.keyring.get_password", return_value=None)
-
         result = get_raw_credentials_json("user@example.com")
 
         assert result is None
 
 
+class TestAccessTokenCache:
+    """Tests for the on-disk access token cache."""
+
+    def test_cache_and_get_token(self):
+        """Test caching and retrieving a fresh token."""
+        expiry = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        cache_access_token("user@example.com", "cached_token", expiry)
+
+        assert get_cached_access_token("user@example.com") == "cached_token"
+
+    def test_get_token_expired(self):
+        """Test that tokens within the expiry skew are treated as stale."""
+        expiry = (datetime.now(UTC) + timedelta(seconds=60)).isoformat()
+        cache_access_token("user@example.com", "cached_token", expiry)
+
+        assert get_cached_access_token("user@example.com") is None
+
+    def test_get_token_not_cached(self):
+        """Test lookup for an account that was never cached."""
+        assert get_cached_access_token("unknown@example.com") is None
+
+    def test_clear_cached_token(self):
+        """Test clearing a single account's cached token."""
+        expiry = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        cache_access_token("user@example.com", "cached_token", expiry)
+
+        clear_cached_access_token("user@example.com")
+
+        assert get_cached_access_token("user@example.com") is None
+
+    def test_clear_all_cached_tokens(self):
+        """Test clearing the whole token cache."""
+        expiry = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        cache_access_token("user1@example.com", "token1", expiry)
+        cache_access_token("user2@example.com", "token2", expiry)
+
+        clear_cached_access_token()
+
+        assert get_cached_access_token("user1@example.com") is None
+        assert get_cached_access_token("user2@example.com") is None
+
+
 class TestClearAllAccounts:
     """Tests for clear_all_accounts."""
 
-    def test_clear_all_accounts(self, mocker):
+    def test_clear_all_accounts(self, fake_keyring):
         """Test clearing all accounts."""
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps(["user1@example.com", "user2@example.com"]),
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(
+            ["user1@example.com", "user2@example.com"]
         )
-        mock_delete = mocker.patch("gdocs_cli.services.credentials.keyring.delete_password")
+        fake_keyring.store[_get_account_key("user1@example.com")] = '{"token": "1"}'
+        fake_keyring.store[_get_account_key("user2@example.com")] = '{"token": "2"}'
+        fake_keyring.store[DEFAULT_ACCOUNT_KEY] = "user1@example.com"
 
-        clear_all_accounts()
+        result = clear_all_accounts()
 
-        # Should delete credentials for each account + accounts list + default account
-        assert mock_delete.call_count >= 2
+        assert result == ["user1@example.com", "user2@example.com"]
+        assert fake_keyring.store == {}
 
-    def test_clear_all_accounts_handles_errors(self, mocker):
+    def test_clear_all_accounts_handles_errors(self, fake_keyring):
         """Test clearing all accounts handles delete errors."""
-        import keyring.errors
-
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.get_password",
-            return_value=json.dumps(["user@example.com"]),
-        )
-        mocker.patch(
-            "gdocs_cli.services.credentials.keyring.delete_password",
-            side_effect=keyring.errors.PasswordDeleteError(),
-        )
+        # Only the accounts list exists; every other delete raises
+        # PasswordDeleteError internally and must be swallowed.
+        fake_keyring.store[ACCOUNTS_LIST_KEY] = json.dumps(["user@example.com"])
 
-        # Should not raise
         clear_all_accounts()
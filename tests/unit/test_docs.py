@@ -1,7 +1,11 @@
 """Tests for docs service."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
+
+from gdocs_cli.models.document import Document, DocumentSummary
 from gdocs_cli.services.docs import (
     _execute_with_retry,
     batch_update,
@@ -9,6 +13,7 @@ from gdocs_cli.services.docs import (
     delete_document,
     get_document,
     get_document_content,
+    get_documents_bulk,
     list_documents,
     list_folders,
     list_shared_drives,
@@ -16,6 +21,74 @@ from gdocs_cli.services.docs import (
 )
 
 
+class FakeMethod:
+    """One API method on a fake service: records kwargs, replays responses.
+
+    Tests queue canned responses on `responses` (the last one repeats) and
+    read the kwargs of the most recent call via `call_kwargs`.
+    """
+
+    def __init__(self) -> None:
+        self.responses: list[dict] = []
+        self.calls: list[dict] = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(execute=self._next_response)
+
+    def _next_response(self) -> dict:
+        if len(self.responses) > 1:
+            return self.responses.pop(0)
+        return self.responses[0] if self.responses else {}
+
+    @property
+    def call_kwargs(self) -> dict:
+        return self.calls[-1]
+
+
+class FakeCollection:
+    """Stands in for service.documents(), service.files(), and friends."""
+
+    def __init__(self, *methods: str) -> None:
+        for name in methods:
+            setattr(self, name, FakeMethod())
+
+    def __call__(self):
+        return self
+
+
+class FakeService:
+    """Plain-object replacement for the MagicMock service chains.
+
+    Unlike a MagicMock, attribute access doesn't allocate child mocks, and
+    response setup reads as data (`fake.files.list.responses = [...]`)
+    instead of a chained return_value assignment.
+    """
+
+    def __init__(self) -> None:
+        self.documents = FakeCollection("create", "get", "batchUpdate")
+        self.files = FakeCollection("create", "get", "list", "update", "delete")
+        self.permissions = FakeCollection("list", "create", "delete")
+        self.revisions = FakeCollection("list")
+        self.drives = FakeCollection("list")
+
+
+@pytest.fixture
+def fake_docs_service(mocker):
+    """Install a FakeService as the Docs API service."""
+    service = FakeService()
+    mocker.patch("gdocs_cli.services.docs.get_docs_service", return_value=service)
+    return service
+
+
+@pytest.fixture
+def fake_drive_service(mocker):
+    """Install a FakeService as the Drive API service."""
+    service = FakeService()
+    mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=service)
+    return service
+
+
 class TestExecuteWithRetry:
     """Tests for _execute_with_retry."""
 
@@ -36,56 +109,36 @@ class TestExecuteWithRetry:
 class TestCreateDocument:
     """Tests for create_document."""
 
-    def test_create_document_simple(self, mocker):
+    def test_create_document_simple(self, fake_docs_service):
         """Test creating a simple document."""
-        mock_docs_service = MagicMock()
-        mock_docs_service.documents().create().execute.return_value = {
-            "documentId": "doc123",
-            "title": "Test Doc",
-            "revisionId": "rev1",
-        }
-
-        mocker.patch("gdocs_cli.services.docs.get_docs_service", return_value=mock_docs_service)
+        fake_docs_service.documents.create.responses = [
+            {"documentId": "doc123", "title": "Test Doc", "revisionId": "rev1"}
+        ]
 
         result = create_document("Test Doc")
 
         assert result.id == "doc123"
         assert result.title == "Test Doc"
 
-    def test_create_document_in_folder(self, mocker):
-        """Test creating document in a folder."""
-        mock_docs_service = MagicMock()
-        mock_docs_service.documents().create().execute.return_value = {
-            "documentId": "doc123",
-            "title": "Test Doc",
-        }
-
-        mock_drive_service = MagicMock()
-        mock_drive_service.files().get().execute.return_value = {"parents": ["root"]}
-        mock_drive_service.files().update().execute.return_value = {}
-
-        mocker.patch("gdocs_cli.services.docs.get_docs_service", return_value=mock_docs_service)
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_drive_service)
+    def test_create_document_in_folder(self, fake_drive_service):
+        """Test creating document in a folder with a single Drive call."""
+        fake_drive_service.files.create.responses = [{"id": "doc123", "name": "Test Doc"}]
 
         result = create_document("Test Doc", folder_id="folder123")
 
         assert result.id == "doc123"
-        mock_drive_service.files().update.assert_called()
+        assert result.title == "Test Doc"
+        assert fake_drive_service.files.create.call_kwargs["body"]["parents"] == ["folder123"]
 
 
 class TestGetDocument:
     """Tests for get_document."""
 
-    def test_get_document_success(self, mocker):
+    def test_get_document_success(self, fake_docs_service):
         """Test getting document successfully."""
-        mock_service = MagicMock()
-        mock_service.documents().get().execute.return_value = {
-            "documentId": "doc123",
-            "title": "Test Doc",
-            "revisionId": "rev1",
-        }
-
-        mocker.patch("gdocs_cli.services.docs.get_docs_service", return_value=mock_service)
+        fake_docs_service.documents.get.responses = [
+            {"documentId": "doc123", "title": "Test Doc", "revisionId": "rev1"}
+        ]
 
         result = get_document("doc123")
 
@@ -94,40 +147,88 @@ class TestGetDocument:
         assert result.revision_id == "rev1"
 
 
+class TestGetDocumentsBulk:
+    """Tests for get_documents_bulk."""
+
+    def test_get_documents_bulk_preserves_order(self, mocker):
+        """Test bulk fetch returns documents in the requested order."""
+        mocker.patch(
+            "gdocs_cli.services.docs.get_document",
+            side_effect=lambda document_id, **_kwargs: Document(
+                id=document_id, title=f"Title {document_id}"
+            ),
+        )
+
+        document_ids = [f"doc{i}" for i in range(10)]
+        results = get_documents_bulk(document_ids)
+
+        assert [d.id for d in results] == document_ids
+
+    def test_get_documents_bulk_empty(self):
+        """Test bulk fetch with no IDs makes no requests."""
+        assert get_documents_bulk([]) == []
+
+
 class TestGetDocumentContent:
     """Tests for get_document_content."""
 
-    def test_get_document_content(self, mocker):
+    def test_get_document_content(self, fake_docs_service):
         """Test getting full document content."""
-        mock_service = MagicMock()
         expected_content = {
             "documentId": "doc123",
             "title": "Test Doc",
             "body": {"content": [{"paragraph": {}}]},
         }
-        mock_service.documents().get().execute.return_value = expected_content
-
-        mocker.patch("gdocs_cli.services.docs.get_docs_service", return_value=mock_service)
+        fake_docs_service.documents.get.responses = [expected_content]
 
         result = get_document_content("doc123")
 
         assert result == expected_content
 
+    def test_get_document_content_with_fields(self, fake_docs_service):
+        """Test getting document content with a field mask."""
+        fake_docs_service.documents.get.responses = [{"title": "Test Doc"}]
+
+        get_document_content("doc123", fields="title,body(content(paragraph,table))")
+
+        call_kwargs = fake_docs_service.documents.get.call_kwargs
+        assert call_kwargs["fields"] == "title,body(content(paragraph,table))"
+
+    def test_get_document_content_cached(self, fake_docs_service):
+        """Test repeated fetches of the same document hit the cache."""
+        fake_docs_service.documents.get.responses = [{"title": "Test Doc"}]
+
+        first = get_document_content("doc123")
+        second = get_document_content("doc123")
+
+        assert first == second
+        assert len(fake_docs_service.documents.get.calls) == 1
+
+    def test_batch_update_invalidates_cache(self, fake_docs_service):
+        """Test a mutation drops the cached document content."""
+        fake_docs_service.documents.get.responses = [{"title": "Test Doc"}]
+
+        get_document_content("doc123")
+        batch_update("doc123", [{"insertText": {}}])
+        get_document_content("doc123")
+
+        # The second fetch goes back to the API instead of the cache
+        assert len(fake_docs_service.documents.get.calls) == 2
+
 
 class TestListDocuments:
     """Tests for list_documents."""
 
-    def test_list_documents_simple(self, mocker):
+    def test_list_documents_simple(self, fake_drive_service):
         """Test listing documents."""
-        mock_service = MagicMock()
-        mock_service.files().list().execute.return_value = {
-            "files": [
-                {"id": "doc1", "name": "Doc 1", "modifiedTime": "2024-01-01T00:00:00Z"},
-                {"id": "doc2", "name": "Doc 2", "modifiedTime": "2024-01-02T00:00:00Z"},
-            ]
-        }
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.files.list.responses = [
+            {
+                "files": [
+                    {"id": "doc1", "name": "Doc 1", "modifiedTime": "2024-01-01T00:00:00Z"},
+                    {"id": "doc2", "name": "Doc 2", "modifiedTime": "2024-01-02T00:00:00Z"},
+                ]
+            }
+        ]
 
         result = list_documents()
 
@@ -135,64 +236,94 @@ class TestListDocuments:
         assert result[0].id == "doc1"
         assert result[0].title == "Doc 1"
 
-    def test_list_documents_with_folder(self, mocker):
+    def test_list_documents_with_folder(self, fake_drive_service):
         """Test listing documents in folder."""
-        mock_service = MagicMock()
-        mock_service.files().list().execute.return_value = {"files": []}
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.files.list.responses = [{"files": []}]
 
         list_documents(folder_id="folder123")
 
         # Check that folder was included in query
-        call_kwargs = mock_service.files().list.call_args[1]
-        assert "folder123" in call_kwargs["q"]
+        assert "folder123" in fake_drive_service.files.list.call_kwargs["q"]
+
+    def test_list_documents_paginates(self, fake_drive_service):
+        """Test that results spanning several pages are followed via pageToken."""
+        fake_drive_service.files.list.responses = [
+            {"files": [{"id": "doc1", "name": "Doc 1"}], "nextPageToken": "page2"},
+            {"files": [{"id": "doc2", "name": "Doc 2"}]},
+        ]
+
+        result = list_documents(limit=5)
+
+        assert [doc.id for doc in result] == ["doc1", "doc2"]
+        assert fake_drive_service.files.list.call_kwargs["pageToken"] == "page2"
+
+    def test_list_documents_respects_limit(self, fake_drive_service):
+        """Test that pagination stops once limit documents are collected."""
+        fake_drive_service.files.list.responses = [
+            {
+                "files": [
+                    {"id": "doc1", "name": "Doc 1"},
+                    {"id": "doc2", "name": "Doc 2"},
+                ],
+                "nextPageToken": "page2",
+            }
+        ]
+
+        result = list_documents(limit=2)
 
-    def test_list_documents_shared_drive(self, mocker):
-        """Test listing documents from shared drive."""
-        mock_service = MagicMock()
-        mock_service.files().list().execute.return_value = {"files": []}
+        assert len(result) == 2
 
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+    def test_list_documents_shared_drive(self, fake_drive_service):
+        """Test listing documents from shared drive."""
+        fake_drive_service.files.list.responses = [{"files": []}]
 
         list_documents(shared_drive_id="drive123")
 
-        call_kwargs = mock_service.files().list.call_args[1]
+        call_kwargs = fake_drive_service.files.list.call_kwargs
         assert call_kwargs["corpora"] == "drive"
         assert call_kwargs["driveId"] == "drive123"
 
+    def test_list_documents_for_accounts(self, mocker):
+        """Test fanning out a list across multiple accounts."""
+        from gdocs_cli.services.docs import list_documents_for_accounts
+
+        mock_list = mocker.patch(
+            "gdocs_cli.services.docs.list_documents",
+            side_effect=lambda account, **_kwargs: [
+                DocumentSummary(id=f"doc-{account}", title=f"Doc {account}")
+            ],
+        )
+
+        result = list_documents_for_accounts(["a@test.com", "b@test.com"], limit=5)
+
+        assert set(result) == {"a@test.com", "b@test.com"}
+        assert result["a@test.com"][0].id == "doc-a@test.com"
+        assert mock_list.call_count == 2
+
 
 class TestDeleteDocument:
     """Tests for delete_document."""
 
-    def test_delete_document(self, mocker):
+    def test_delete_document(self, fake_drive_service):
         """Test deleting document."""
-        mock_service = MagicMock()
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
-
         delete_document("doc123")
 
-        mock_service.files().delete.assert_called_with(
-            fileId="doc123",
-            supportsAllDrives=True,
-        )
+        assert fake_drive_service.files.delete.call_kwargs == {
+            "fileId": "doc123",
+            "supportsAllDrives": True,
+        }
 
 
 class TestMoveDocument:
     """Tests for move_document."""
 
-    def test_move_document(self, mocker):
+    def test_move_document(self, fake_drive_service):
         """Test moving document."""
-        mock_service = MagicMock()
-        mock_service.files().get().execute.return_value = {"parents": ["old_folder"]}
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.files.get.responses = [{"parents": ["old_folder"]}]
 
         move_document("doc123", "new_folder")
 
-        mock_service.files().update.assert_called()
-        call_kwargs = mock_service.files().update.call_args[1]
+        call_kwargs = fake_drive_service.files.update.call_kwargs
         assert call_kwargs["addParents"] == "new_folder"
         assert call_kwargs["removeParents"] == "old_folder"
 
@@ -200,50 +331,42 @@ class TestMoveDocument:
 class TestListSharedDrives:
     """Tests for list_shared_drives."""
 
-    def test_list_shared_drives(self, mocker):
-        """Test listing shared drives."""
-        mock_service = MagicMock()
-        mock_service.drives().list().execute.return_value = {
-            "drives": [
+    @pytest.mark.parametrize(
+        "drives",
+        [
+            [],
+            [
                 {"id": "drive1", "name": "Team Drive 1"},
                 {"id": "drive2", "name": "Team Drive 2"},
-            ]
-        }
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+            ],
+        ],
+        ids=["empty", "populated"],
+    )
+    def test_list_shared_drives(self, fake_drive_service, drives):
+        """Test listing shared drives with and without results."""
+        fake_drive_service.drives.list.responses = [{"drives": drives}]
 
         result = list_shared_drives()
 
-        assert len(result) == 2
-        assert result[0].id == "drive1"
-        assert result[0].name == "Team Drive 1"
-
-    def test_list_shared_drives_empty(self, mocker):
-        """Test listing shared drives when none exist."""
-        mock_service = MagicMock()
-        mock_service.drives().list().execute.return_value = {"drives": []}
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
-
-        result = list_shared_drives()
-
-        assert result == []
+        assert len(result) == len(drives)
+        if drives:
+            assert result[0].id == "drive1"
+            assert result[0].name == "Team Drive 1"
 
 
 class TestListFolders:
     """Tests for list_folders."""
 
-    def test_list_folders(self, mocker):
+    def test_list_folders(self, fake_drive_service):
         """Test listing folders."""
-        mock_service = MagicMock()
-        mock_service.files().list().execute.return_value = {
-            "files": [
-                {"id": "folder1", "name": "Folder 1", "parents": ["root"]},
-                {"id": "folder2", "name": "Folder 2", "parents": ["folder1"]},
-            ]
-        }
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.files.list.responses = [
+            {
+                "files": [
+                    {"id": "folder1", "name": "Folder 1", "parents": ["root"]},
+                    {"id": "folder2", "name": "Folder 2", "parents": ["folder1"]},
+                ]
+            }
+        ]
 
         result = list_folders()
 
@@ -252,88 +375,78 @@ class TestListFolders:
         assert result[0].name == "Folder 1"
         assert result[0].parent_id == "root"
 
-    def test_list_folders_with_parent(self, mocker):
+    def test_list_folders_with_parent(self, fake_drive_service):
         """Test listing folders with parent filter."""
-        mock_service = MagicMock()
-        mock_service.files().list().execute.return_value = {"files": []}
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.files.list.responses = [{"files": []}]
 
         list_folders(parent_id="parent123")
 
-        call_kwargs = mock_service.files().list.call_args[1]
-        assert "parent123" in call_kwargs["q"]
+        assert "parent123" in fake_drive_service.files.list.call_kwargs["q"]
 
 
 class TestBatchUpdate:
     """Tests for batch_update."""
 
-    def test_batch_update(self, mocker):
+    def test_batch_update(self, fake_docs_service):
         """Test batch update."""
-        mock_service = MagicMock()
-        mock_service.documents().batchUpdate().execute.return_value = {
-            "replies": [{"insertText": {}}]
-        }
-
-        mocker.patch("gdocs_cli.services.docs.get_docs_service", return_value=mock_service)
+        fake_docs_service.documents.batchUpdate.responses = [{"replies": [{"insertText": {}}]}]
 
         requests = [{"insertText": {"text": "Hello", "location": {"index": 1}}}]
         result = batch_update("doc123", requests)
 
         assert "replies" in result
-        mock_service.documents().batchUpdate.assert_called_with(
-            documentId="doc123",
-            body={"requests": requests},
-        )
+        assert fake_docs_service.documents.batchUpdate.call_kwargs == {
+            "documentId": "doc123",
+            "body": {"requests": requests},
+        }
 
 
 class TestSearchDocuments:
     """Tests for search_documents."""
 
-    def test_search_documents(self, mocker):
-        """Test searching documents."""
-        from gdocs_cli.services.docs import search_documents
-
-        mock_service = MagicMock()
-        mock_service.files().list().execute.return_value = {
-            "files": [
+    @pytest.mark.parametrize(
+        "files",
+        [
+            [],
+            [
                 {"id": "doc1", "name": "Test Doc 1", "modifiedTime": "2024-01-01T00:00:00Z"},
                 {"id": "doc2", "name": "Test Doc 2", "modifiedTime": "2024-01-02T00:00:00Z"},
-            ]
-        }
+            ],
+        ],
+        ids=["empty", "populated"],
+    )
+    def test_search_documents(self, fake_drive_service, files):
+        """Test searching documents with and without results."""
+        from gdocs_cli.services.docs import search_documents
 
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.files.list.responses = [{"files": files}]
 
         result = search_documents("Test")
 
-        assert len(result) == 2
-        assert result[0].id == "doc1"
-        assert result[0].title == "Test Doc 1"
+        assert len(result) == len(files)
+        if files:
+            assert result[0].id == "doc1"
+            assert result[0].title == "Test Doc 1"
 
-    def test_search_documents_empty(self, mocker):
-        """Test searching with no results."""
+    def test_search_documents_escapes_quotes(self, fake_drive_service):
+        """Test that quotes in the search term don't break the Drive query."""
         from gdocs_cli.services.docs import search_documents
 
-        mock_service = MagicMock()
-        mock_service.files().list().execute.return_value = {"files": []}
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.files.list.responses = [{"files": []}]
 
-        result = search_documents("nonexistent")
+        search_documents("Bob's Doc")
 
-        assert result == []
+        assert "Bob\\'s Doc" in fake_drive_service.files.list.call_kwargs["q"]
 
 
 class TestListPermissions:
     """Tests for list_permissions."""
 
-    def test_list_permissions(self, mocker):
-        """Test listing permissions."""
-        from gdocs_cli.services.docs import list_permissions
-
-        mock_service = MagicMock()
-        mock_service.permissions().list().execute.return_value = {
-            "permissions": [
+    @pytest.mark.parametrize(
+        "permissions",
+        [
+            [],
+            [
                 {"id": "perm1", "type": "user", "role": "owner", "emailAddress": "owner@test.com"},
                 {
                     "id": "perm2",
@@ -341,46 +454,38 @@ class TestListPermissions:
                     "role": "reader",
                     "emailAddress": "reader@test.com",
                 },
-            ]
-        }
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
-
-        result = list_permissions("doc123")
-
-        assert len(result) == 2
-        assert result[0]["role"] == "owner"
-
-    def test_list_permissions_empty(self, mocker):
-        """Test listing permissions when none exist."""
+            ],
+        ],
+        ids=["empty", "populated"],
+    )
+    def test_list_permissions(self, fake_drive_service, permissions):
+        """Test listing permissions with and without results."""
         from gdocs_cli.services.docs import list_permissions
 
-        mock_service = MagicMock()
-        mock_service.permissions().list().execute.return_value = {"permissions": []}
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.permissions.list.responses = [{"permissions": permissions}]
 
         result = list_permissions("doc123")
 
-        assert result == []
+        assert len(result) == len(permissions)
+        if permissions:
+            assert result[0]["role"] == "owner"
 
 
 class TestShareDocument:
     """Tests for share_document."""
 
-    def test_share_document(self, mocker):
+    def test_share_document(self, fake_drive_service):
         """Test sharing a document."""
         from gdocs_cli.services.docs import share_document
 
-        mock_service = MagicMock()
-        mock_service.permissions().create().execute.return_value = {
-            "id": "perm123",
-            "type": "user",
-            "role": "reader",
-            "emailAddress": "user@test.com",
-        }
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.permissions.create.responses = [
+            {
+                "id": "perm123",
+                "type": "user",
+                "role": "reader",
+                "emailAddress": "user@test.com",
+            }
+        ]
 
         result = share_document("doc123", "user@test.com", role="reader")
 
@@ -391,52 +496,38 @@ class TestShareDocument:
 class TestUnshareDocument:
     """Tests for unshare_document."""
 
-    def test_unshare_document(self, mocker):
+    def test_unshare_document(self, fake_drive_service):
         """Test removing a permission."""
         from gdocs_cli.services.docs import unshare_document
 
-        mock_service = MagicMock()
-        mock_service.permissions().delete().execute.return_value = None
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
-
         # Should not raise
         unshare_document("doc123", "perm123")
 
-        mock_service.permissions().delete.assert_called()
+        assert fake_drive_service.permissions.delete.calls
 
 
 class TestListRevisions:
     """Tests for list_revisions."""
 
-    def test_list_revisions(self, mocker):
-        """Test listing revisions."""
-        from gdocs_cli.services.docs import list_revisions
-
-        mock_service = MagicMock()
-        mock_service.revisions().list().execute.return_value = {
-            "revisions": [
+    @pytest.mark.parametrize(
+        "revisions",
+        [
+            [],
+            [
                 {"id": "1", "modifiedTime": "2024-01-01T12:00:00Z"},
                 {"id": "2", "modifiedTime": "2024-01-02T12:00:00Z"},
-            ]
-        }
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
-
-        result = list_revisions("doc123")
-
-        assert len(result) == 2
-        assert result[0]["id"] == "1"
-
-    def test_list_revisions_empty(self, mocker):
-        """Test listing revisions when none exist."""
+            ],
+        ],
+        ids=["empty", "populated"],
+    )
+    def test_list_revisions(self, fake_drive_service, revisions):
+        """Test listing revisions with and without results."""
         from gdocs_cli.services.docs import list_revisions
 
-        mock_service = MagicMock()
-        mock_service.revisions().list().execute.return_value = {"revisions": []}
-
-        mocker.patch("gdocs_cli.services.docs.get_drive_service", return_value=mock_service)
+        fake_drive_service.revisions.list.responses = [{"revisions": revisions}]
 
         result = list_revisions("doc123")
 
-        assert result == []
+        assert len(result) == len(revisions)
+        if revisions:
+            assert result[0]["id"] == "1"
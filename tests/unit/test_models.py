@@ -1,5 +1,7 @@
 """Tests for domain models."""
 
+import pytest
+
 from gdocs_cli.models.document import Document, DocumentSummary, Folder, SharedDrive
 from gdocs_cli.models.element import (
     Alignment,
@@ -9,108 +11,108 @@ from gdocs_cli.models.element import (
     TextStyle,
 )
 
+# Expected values built once at import instead of inline per test.
+_URL_CASES = (
+    (Document, "abc123", "https://docs.google.com/document/d/abc123/edit"),
+    (DocumentSummary, "xyz789", "https://docs.google.com/document/d/xyz789/edit"),
+)
+
+_HEADING_VALUES = (
+    (NamedStyleType.HEADING_1, "HEADING_1"),
+    (NamedStyleType.TITLE, "TITLE"),
+)
+
 
-class TestDocument:
-    """Tests for Document model."""
+@pytest.fixture(scope="module")
+def default_doc():
+    """Document shared across the module; frozen, so reuse is safe."""
+    return Document(id="abc123", title="Test Doc")
 
-    def test_document_url(self):
-        """Test document URL generation."""
-        doc = Document(id="abc123", title="Test Doc")
-        assert doc.url == "https://docs.google.com/document/d/abc123/edit"
 
-    def test_document_defaults(self):
-        """Test document default values."""
-        doc = Document(id="abc123", title="Test Doc")
-        assert doc.revision_id is None
-        assert doc.created_time is None
-        assert doc.modified_time is None
-        assert doc.body_content == []
+@pytest.fixture(scope="module")
+def default_text_style():
+    """All-defaults TextStyle shared across the module."""
+    return TextStyle()
 
 
-class TestDocumentSummary:
-    """Tests for DocumentSummary model."""
+@pytest.fixture(scope="module")
+def bold_italic_style():
+    """Styled TextStyle shared across the module."""
+    return TextStyle(bold=True, italic=True, font_size=14.0)
 
-    def test_summary_url(self):
-        """Test summary URL generation."""
-        summary = DocumentSummary(id="xyz789", title="Summary Doc")
-        assert summary.url == "https://docs.google.com/document/d/xyz789/edit"
 
+@pytest.mark.parametrize(("model", "doc_id", "expected"), _URL_CASES)
+def test_document_url(model, doc_id, expected):
+    """Test URL generation for both document models."""
+    assert model(id=doc_id, title="Test Doc").url == expected
 
-class TestSharedDrive:
-    """Tests for SharedDrive model."""
 
-    def test_shared_drive_creation(self):
-        """Test shared drive creation."""
-        drive = SharedDrive(id="drive123", name="Team Drive")
-        assert drive.id == "drive123"
-        assert drive.name == "Team Drive"
+def test_document_defaults(default_doc):
+    """Test document default values."""
+    assert default_doc.revision_id is None
+    assert default_doc.created_time is None
+    assert default_doc.modified_time is None
+    assert default_doc.body_content == []
 
 
-class TestFolder:
-    """Tests for Folder model."""
+def test_shared_drive_creation():
+    """Test shared drive creation."""
+    drive = SharedDrive(id="drive123", name="Team Drive")
+    assert drive.id == "drive123"
+    assert drive.name == "Team Drive"
 
-    def test_folder_creation(self):
-        """Test folder creation."""
-        folder = Folder(id="folder123", name="My Folder")
-        assert folder.id == "folder123"
-        assert folder.name == "My Folder"
-        assert folder.parent_id is None
 
-    def test_folder_with_parent(self):
-        """Test folder with parent."""
-        folder = Folder(id="folder123", name="Subfolder", parent_id="parent456")
-        assert folder.parent_id == "parent456"
+def test_folder_creation():
+    """Test folder creation."""
+    folder = Folder(id="folder123", name="My Folder")
+    assert folder.id == "folder123"
+    assert folder.name == "My Folder"
+    assert folder.parent_id is None
 
 
-class TestTextStyle:
-    """Tests for TextStyle model."""
+def test_folder_with_parent():
+    """Test folder with parent."""
+    folder = Folder(id="folder123", name="Subfolder", parent_id="parent456")
+    assert folder.parent_id == "parent456"
 
-    def test_text_style_defaults(self):
-        """Test text style default values."""
-        style = TextStyle()
-        assert style.bold is False
-        assert style.italic is False
-        assert style.underline is False
-        assert style.font_size is None
 
-    def test_text_style_custom(self):
-        """Test text style with custom values."""
-        style = TextStyle(bold=True, italic=True, font_size=14.0)
-        assert style.bold is True
-        assert style.italic is True
-        assert style.font_size == 14.0
+def test_text_style_defaults(default_text_style):
+    """Test text style default values."""
+    assert default_text_style.bold is False
+    assert default_text_style.italic is False
+    assert default_text_style.underline is False
+    assert default_text_style.font_size is None
 
 
-class TestParagraphStyle:
-    """Tests for ParagraphStyle model."""
+def test_text_style_custom(bold_italic_style):
+    """Test text style with custom values."""
+    assert bold_italic_style.bold is True
+    assert bold_italic_style.italic is True
+    assert bold_italic_style.font_size == 14.0
 
-    def test_paragraph_style_defaults(self):
-        """Test paragraph style defaults."""
-        style = ParagraphStyle()
-        assert style.named_style == NamedStyleType.NORMAL_TEXT
-        assert style.alignment == Alignment.START
 
-    def test_paragraph_style_heading(self):
-        """Test paragraph style with heading."""
-        style = ParagraphStyle(named_style=NamedStyleType.HEADING_1)
-        assert style.named_style == NamedStyleType.HEADING_1
+def test_paragraph_style_defaults():
+    """Test paragraph style defaults."""
+    style = ParagraphStyle()
+    assert style.named_style == NamedStyleType.NORMAL_TEXT
+    assert style.alignment == Alignment.START
 
 
-class TestNamedStyleType:
-    """Tests for NamedStyleType enum."""
+def test_paragraph_style_heading():
+    """Test paragraph style with heading."""
+    style = ParagraphStyle(named_style=NamedStyleType.HEADING_1)
+    assert style.named_style == NamedStyleType.HEADING_1
 
-    def test_heading_values(self):
-        """Test heading enum values."""
-        assert NamedStyleType.HEADING_1.value == "HEADING_1"
-        assert NamedStyleType.TITLE.value == "TITLE"
 
+@pytest.mark.parametrize(("member", "expected"), _HEADING_VALUES)
+def test_heading_values(member, expected):
+    """Test heading enum values."""
+    assert member.value == expected
 
-class TestTable:
-    """Tests for Table model."""
 
-    def test_table_creation(self):
-        """Test table creation."""
-        table = Table(rows=3, columns=4)
-        assert table.rows == 3
-        assert table.columns == 4
-        assert table.cells == []
+def test_table_creation():
+    """Test table creation."""
+    table = Table(rows=3, columns=4)
+    assert table.rows == 3
+    assert table.columns == 4
+    assert table.cells == []
@@ -1,7 +1,12 @@
 """Tests for output utilities."""
 
+import io
 import json
+from types import SimpleNamespace
 
+import pytest
+
+from gdocs_cli.utils import output
 from gdocs_cli.utils.output import (
     is_json_mode,
     print_document_info,
@@ -15,263 +20,235 @@ from gdocs_cli.utils.output import (
     set_json_mode,
 )
 
+# Collapses the normal-mode/JSON-mode test pairs: parametrizing a test with
+# this marker runs it once per mode via the indirect json_mode fixture.
+both_modes = pytest.mark.parametrize("json_mode", [False, True], indirect=True)
 
-class TestJsonMode:
-    """Tests for JSON mode."""
-
-    def test_set_json_mode(self):
-        """Test setting JSON mode."""
-        set_json_mode(True)
-        assert is_json_mode() is True
-
-        set_json_mode(False)
-        assert is_json_mode() is False
 
-    def test_default_json_mode(self):
-        """Test default JSON mode is False."""
-        set_json_mode(False)  # Reset
-        assert is_json_mode() is False
+class _StdoutSink(io.StringIO):
+    """sys.stdout stand-in: rich writes text here, print_json bytes to .buffer."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.buffer = io.BytesIO()
 
-class TestPrintSuccess:
-    """Tests for print_success."""
+    def getvalue(self) -> str:
+        return super().getvalue() + self.buffer.getvalue().decode()
 
-    def test_print_success_normal_mode(self, capsys):
-        """Test print_success in normal mode."""
-        set_json_mode(False)
-        print_success("Operation completed")
 
-        captured = capsys.readouterr()
-        assert "Operation completed" in captured.out
-        assert "✓" in captured.out
+@pytest.fixture
+def out(monkeypatch):
+    """Capture this module's output into an in-memory sink.
 
-    def test_print_success_json_mode(self, capsys):
-        """Test print_success is silent in JSON mode."""
-        set_json_mode(True)
-        print_success("Operation completed")
+    Cheaper than capsys for this file's many tiny assertions: no
+    readouterr() snapshotting, just a StringIO the Console writes into.
+    Patching sys.stdout itself doesn't stick (pytest's fd capture restores
+    it between fixture setup and the test call), so the sink is wired into
+    the shared Console and the module's sys reference instead.
+    """
+    sink = _StdoutSink()
+    monkeypatch.setattr(output._get_console(), "_file", sink)
+    monkeypatch.setattr(output, "sys", SimpleNamespace(stdout=sink))
+    return sink
 
-        captured = capsys.readouterr()
-        assert captured.out == ""
 
-        set_json_mode(False)
+# One decoder instance shared by every JSON assertion; .decode skips the
+# json.loads wrapper on each call.
+_decode_json = json.JSONDecoder().decode
 
 
-class TestPrintError:
-    """Tests for print_error."""
+def _parsed(sink):
+    """Parse a sink's captured output as JSON."""
+    return _decode_json(sink.getvalue())
 
-    def test_print_error_simple(self, capsys):
-        """Test print_error with message only."""
-        set_json_mode(False)
-        print_error("Something went wrong")
 
-        captured = capsys.readouterr()
-        assert "Something went wrong" in captured.out
-        assert "✗" in captured.out
+@pytest.fixture(autouse=True)
+def _reset_json_mode():
+    """Restore JSON mode after each test so ordering never leaks state."""
+    yield
+    set_json_mode(False)
 
-    def test_print_error_with_details(self, capsys):
-        """Test print_error with details."""
-        set_json_mode(False)
-        print_error("Error occurred", details="More information")
 
-        captured = capsys.readouterr()
-        assert "Error occurred" in captured.out
-        assert "More information" in captured.out
+@pytest.fixture
+def json_mode(request):
+    """Set JSON mode to the indirect parameter for the duration of a test."""
+    set_json_mode(request.param)
+    return request.param
 
-    def test_print_error_with_tip(self, capsys):
-        """Test print_error with tip."""
-        set_json_mode(False)
-        print_error("Error occurred", tip="Try this instead")
 
-        captured = capsys.readouterr()
-        assert "Error occurred" in captured.out
-        assert "Try this instead" in captured.out
+def test_set_json_mode():
+    """Test setting JSON mode."""
+    set_json_mode(True)
+    assert is_json_mode() is True
 
-    def test_print_error_json_mode(self, capsys):
-        """Test print_error is silent in JSON mode."""
-        set_json_mode(True)
-        print_error("Error occurred")
+    set_json_mode(False)
+    assert is_json_mode() is False
 
-        captured = capsys.readouterr()
-        assert captured.out == ""
 
-        set_json_mode(False)
+def test_default_json_mode():
+    """Test default JSON mode is False."""
+    assert is_json_mode() is False
 
 
-class TestPrintWarning:
-    """Tests for print_warning."""
+@both_modes
+def test_print_success(out, json_mode):
+    """Test print_success prints normally and is silent in JSON mode."""
+    print_success("Operation completed")
 
-    def test_print_warning(self, capsys):
-        """Test print_warning."""
-        set_json_mode(False)
-        print_warning("This is a warning")
+    if json_mode:
+        assert out.getvalue() == ""
+    else:
+        assert "Operation completed" in out.getvalue()
+        assert "✓" in out.getvalue()
 
-        captured = capsys.readouterr()
-        assert "This is a warning" in captured.out
-        assert "!" in captured.out
 
-    def test_print_warning_json_mode(self, capsys):
-        """Test print_warning is silent in JSON mode."""
-        set_json_mode(True)
-        print_warning("Warning")
+@both_modes
+def test_print_error(out, json_mode):
+    """Test print_error prints normally and is silent in JSON mode."""
+    print_error("Something went wrong")
 
-        captured = capsys.readouterr()
-        assert captured.out == ""
+    if json_mode:
+        assert out.getvalue() == ""
+    else:
+        assert "Something went wrong" in out.getvalue()
+        assert "✗" in out.getvalue()
 
-        set_json_mode(False)
 
+def test_print_error_with_details(out):
+    """Test print_error with details."""
+    print_error("Error occurred", details="More information")
 
-class TestPrintInfo:
-    """Tests for print_info."""
+    assert "Error occurred" in out.getvalue()
+    assert "More information" in out.getvalue()
 
-    def test_print_info(self, capsys):
-        """Test print_info."""
-        set_json_mode(False)
-        print_info("Information message")
 
-        captured = capsys.readouterr()
-        assert "Information message" in captured.out
-        assert "ℹ" in captured.out
+def test_print_error_with_tip(out):
+    """Test print_error with tip."""
+    print_error("Error occurred", tip="Try this instead")
 
-    def test_print_info_json_mode(self, capsys):
-        """Test print_info is silent in JSON mode."""
-        set_json_mode(True)
-        print_info("Info")
+    assert "Error occurred" in out.getvalue()
+    assert "Try this instead" in out.getvalue()
 
-        captured = capsys.readouterr()
-        assert captured.out == ""
 
-        set_json_mode(False)
+@both_modes
+def test_print_warning(out, json_mode):
+    """Test print_warning prints normally and is silent in JSON mode."""
+    print_warning("This is a warning")
 
+    if json_mode:
+        assert out.getvalue() == ""
+    else:
+        assert "This is a warning" in out.getvalue()
+        assert "!" in out.getvalue()
 
-class TestPrintJson:
-    """Tests for print_json."""
 
-    def test_print_json_dict(self, capsys):
-        """Test print_json with dict."""
-        set_json_mode(False)  # Should still print
-        print_json({"key": "value", "number": 42})
+@both_modes
+def test_print_info(out, json_mode):
+    """Test print_info prints normally and is silent in JSON mode."""
+    print_info("Information message")
 
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["key"] == "value"
-        assert data["number"] == 42
+    if json_mode:
+        assert out.getvalue() == ""
+    else:
+        assert "Information message" in out.getvalue()
+        assert "ℹ" in out.getvalue()
 
-    def test_print_json_list(self, capsys):
-        """Test print_json with list."""
-        print_json([1, 2, 3])
 
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data == [1, 2, 3]
+def test_print_json_dict(out):
+    """Test print_json with dict (prints regardless of mode)."""
+    print_json({"key": "value", "number": 42})
 
-    def test_print_json_unicode(self, capsys):
-        """Test print_json preserves unicode."""
-        print_json({"emoji": "✓", "german": "Überschrift"})
+    data = _parsed(out)
+    assert data["key"] == "value"
+    assert data["number"] == 42
 
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["emoji"] == "✓"
-        assert data["german"] == "Überschrift"
 
+def test_print_json_list(out):
+    """Test print_json with list."""
+    print_json([1, 2, 3])
 
-class TestPrintJsonError:
-    """Tests for print_json_error."""
+    data = _parsed(out)
+    assert data == [1, 2, 3]
 
-    def test_print_json_error_simple(self, capsys):
-        """Test print_json_error with code and message."""
-        print_json_error("ERROR_CODE", "Error message")
 
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["error"] is True
-        assert data["code"] == "ERROR_CODE"
-        assert data["message"] == "Error message"
+def test_print_json_unicode(out):
+    """Test print_json preserves unicode."""
+    print_json({"emoji": "✓", "german": "Überschrift"})
 
-    def test_print_json_error_with_details(self, capsys):
-        """Test print_json_error with details."""
-        print_json_error("ERROR_CODE", "Error message", details="More info")
+    data = _parsed(out)
+    assert data["emoji"] == "✓"
+    assert data["german"] == "Überschrift"
 
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["details"] == "More info"
 
+def test_print_json_error_simple(out):
+    """Test print_json_error with code and message."""
+    print_json_error("ERROR_CODE", "Error message")
 
-class TestPrintTable:
-    """Tests for print_table."""
+    data = _parsed(out)
+    assert data["error"] is True
+    assert data["code"] == "ERROR_CODE"
+    assert data["message"] == "Error message"
 
-    def test_print_table_normal(self, capsys):
-        """Test print_table in normal mode."""
-        set_json_mode(False)
-        print_table(
-            "Test Table",
-            ["Col1", "Col2"],
-            [["A", "B"], ["C", "D"]],
-        )
 
-        captured = capsys.readouterr()
-        assert "Test Table" in captured.out
-        assert "Col1" in captured.out
-        assert "A" in captured.out
+def test_print_json_error_with_details(out):
+    """Test print_json_error with details."""
+    print_json_error("ERROR_CODE", "Error message", details="More info")
 
-    def test_print_table_with_footer(self, capsys):
-        """Test print_table with footer."""
-        set_json_mode(False)
-        print_table(
-            "Test Table",
-            ["Col1"],
-            [["A"]],
-            footer="Footer text",
-        )
+    data = _parsed(out)
+    assert data["details"] == "More info"
 
-        captured = capsys.readouterr()
-        assert "Footer text" in captured.out
 
-    def test_print_table_json_mode(self, capsys):
-        """Test print_table is silent in JSON mode."""
-        set_json_mode(True)
-        print_table("Table", ["Col"], [["A"]])
+@both_modes
+def test_print_table(out, json_mode):
+    """Test print_table prints normally and is silent in JSON mode."""
+    print_table(
+        "Test Table",
+        ["Col1", "Col2"],
+        [["A", "B"], ["C", "D"]],
+    )
 
-        captured = capsys.readouterr()
-        assert captured.out == ""
+    if json_mode:
+        assert out.getvalue() == ""
+    else:
+        assert "Test Table" in out.getvalue()
+        assert "Col1" in out.getvalue()
+        assert "A" in out.getvalue()
 
-        set_json_mode(False)
 
+def test_print_table_with_footer(out):
+    """Test print_table with footer."""
+    print_table(
+        "Test Table",
+        ["Col1"],
+        [["A"]],
+        footer="Footer text",
+    )
 
-class TestPrintDocumentInfo:
-    """Tests for print_document_info."""
+    assert "Footer text" in out.getvalue()
 
-    def test_print_document_info(self, capsys):
-        """Test print_document_info."""
-        set_json_mode(False)
-        print_document_info("doc123", "Test Document")
 
-        captured = capsys.readouterr()
-        assert "Test Document" in captured.out
-        assert "doc123" in captured.out
-        assert "https://docs.google.com/document/d/doc123/edit" in captured.out
+@both_modes
+def test_print_document_info(out, json_mode):
+    """Test print_document_info prints normally and is silent in JSON mode."""
+    print_document_info("doc123", "Test Document")
 
-    def test_print_document_info_with_modified(self, capsys):
-        """Test print_document_info with modified time."""
-        set_json_mode(False)
-        print_document_info("doc123", "Test Doc", modified_time="2024-01-15")
+    if json_mode:
+        assert out.getvalue() == ""
+    else:
+        assert "Test Document" in out.getvalue()
+        assert "doc123" in out.getvalue()
+        assert "https://docs.google.com/document/d/doc123/edit" in out.getvalue()
 
-        captured = capsys.readouterr()
-        assert "2024-01-15" in captured.out
 
-    def test_print_document_info_no_url(self, capsys):
-        """Test print_document_info without URL."""
-        set_json_mode(False)
-        print_document_info("doc123", "Test Doc", show_url=False)
+def test_print_document_info_with_modified(out):
+    """Test print_document_info with modified time."""
+    print_document_info("doc123", "Test Doc", modified_time="2024-01-15")
 
-        captured = capsys.readouterr()
-        assert "https://" not in captured.out
+    assert "2024-01-15" in out.getvalue()
 
-    def test_print_document_info_json_mode(self, capsys):
-        """Test print_document_info is silent in JSON mode."""
-        set_json_mode(True)
-        print_document_info("doc123", "Test Doc")
 
-        captured = capsys.readouterr()
-        assert captured.out == ""
+def test_print_document_info_no_url(out):
+    """Test print_document_info without URL."""
+    print_document_info("doc123", "Test Doc", show_url=False)
 
-        set_json_mode(False)
+    assert "https://" not in out.getvalue()